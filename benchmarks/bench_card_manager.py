@@ -0,0 +1,57 @@
+import os
+import random
+import shutil
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.bench_config_io import make_data
+from benchmarks.harness import Results, time_per_op
+from core.card_manager import CardManager
+from core.persistence import atomic_write_json
+
+
+def run(results: Results, sizes=(100, 1000, 10000, 100000), operations: int = 1000, repeat: int = 3):
+    for size in sizes:
+        directory = tempfile.mkdtemp()
+        try:
+            run_size(results, size, operations, repeat, directory)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+def run_size(results: Results, size: int, operations: int, repeat: int, directory: str):
+    path = os.path.join(directory, "settings.json")
+    atomic_write_json(path, make_data(size), None)
+    card_manager = CardManager(path, save_delay=3600, history=False)
+    rng = random.Random(size)
+    existing = [rng.randint(1, size) for _ in range(operations)]
+    names = [f"Card {card_id}" for card_id in existing]
+    added = []
+    
+    def add():
+        for i in range(operations):
+            added.append(card_manager.add_card(f"Added {i}", f"https://added.example/{i}?q={{content}}"))
+    
+    def lookup():
+        for card_id, name in zip(existing, names):
+            card_manager.get_card(card_id)
+            card_manager.get_card_by_name(name)
+            card_manager.get_card_by_hotkey("ctrl+alt+5")
+    
+    def update():
+        for card_id in existing:
+            card_manager.update_card(card_id, hotkey="")
+    
+    def delete():
+        for _ in range(operations):
+            card_manager.delete_card(added.pop())
+    
+    try:
+        results.add(f"card_manager.add[{size}]", time_per_op(add, operations, repeat))
+        results.add(f"card_manager.lookup[{size}]", time_per_op(lookup, operations * 3, repeat))
+        results.add(f"card_manager.update[{size}]", time_per_op(update, operations, repeat))
+        results.add(f"card_manager.delete[{size}]", time_per_op(delete, operations, repeat))
+    finally:
+        card_manager.persister.discard()
+        card_manager.close()
\ No newline at end of file
@@ -0,0 +1,106 @@
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.harness import Results
+from core.card_manager import CardManager
+from core.persistence import atomic_write_json, file_signature, read_snapshot, write_snapshot
+
+
+COLUMNS = ('save_indent', 'save_compact', 'save_snapshot', 'load_indent', 'load_compact', 'load_snapshot',
+           'startup_json', 'startup_snapshot')
+
+
+def make_data(count: int):
+    cards = [
+        {'id': i, 'name': f"Card {i}", 'url': f"https://example.com/search?q={{content}}&page={i}",
+         'hotkey': f"ctrl+alt+{i % 10}" if i % 50 == 0 else ""}
+        for i in range(1, count + 1)
+    ]
+    return {'next_id': count + 1, 'cards': cards}
+
+
+def best_of(repeat: int, function) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def load_json(path: str):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_manager(path: str, snapshot_cache: bool):
+    card_manager = CardManager(path, history=False, snapshot_cache=snapshot_cache)
+    card_manager.close()
+
+
+def measure(count: int, repeat: int, directory: str):
+    data = make_data(count)
+    path = os.path.join(directory, f"settings-{count}.json")
+    results = {'cards': count}
+    
+    results['save_indent'] = best_of(repeat, lambda: atomic_write_json(path, data, 2))
+    results['load_indent'] = best_of(repeat, lambda: load_json(path))
+    results['size_indent'] = os.path.getsize(path)
+    
+    results['save_compact'] = best_of(repeat, lambda: atomic_write_json(path, data, None))
+    results['load_compact'] = best_of(repeat, lambda: load_json(path))
+    results['size_compact'] = os.path.getsize(path)
+    
+    signature = file_signature(path)
+    results['save_snapshot'] = best_of(repeat, lambda: write_snapshot(path, data, signature))
+    results['load_snapshot'] = best_of(repeat, lambda: read_snapshot(path, signature))
+    
+    os.remove(os.path.splitext(path)[0] + ".snapshot")
+    results['startup_json'] = best_of(1, lambda: load_manager(path, False))
+    load_manager(path, True)
+    results['startup_snapshot'] = best_of(repeat, lambda: load_manager(path, True))
+    return results
+
+
+def run(results: Results, sizes=(1000, 10000, 100000), repeat: int = 3):
+    directory = tempfile.mkdtemp()
+    try:
+        for count in sizes:
+            row = measure(count, repeat, directory)
+            for key in COLUMNS:
+                results.add(f"config.{key}[{count}]", row[key] / count, total_seconds=row[key])
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Config load/save microbenchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args(argv)
+    
+    directory = tempfile.mkdtemp()
+    try:
+        rows = [measure(count, args.repeat, directory) for count in args.sizes]
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(f"{'cards':>8} " + " ".join(f"{column:>16}" for column in COLUMNS) + "  (ms)")
+    for row in rows:
+        print(f"{row['cards']:>8} " + " ".join(f"{row[column] * 1000:>16.2f}" for column in COLUMNS))
+    for row in rows:
+        print(f"{row['cards']:>8} cards: {row['size_indent']} bytes indented, {row['size_compact']} bytes compact")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
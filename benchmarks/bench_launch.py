@@ -0,0 +1,120 @@
+import os
+import resource
+import shutil
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.harness import Results, time_per_op
+from core.async_core import AsyncCore
+from core.browser_launcher import BrowserLauncher
+from core.clipboard_reader import ClipboardReader
+from core.launch_executor import LaunchExecutor
+
+
+TEMPLATES = [
+    "https://www.google.com/search?q={content}",
+    "https://example.com/{content|path}/page?d={date:%Y%m%d}",
+    "https://en.wikipedia.org/wiki/Special:Search?search={content|plus}&go=Go",
+    "https://docs.python.org/3/search.html?q={content}&env={env:HOME}",
+]
+
+
+class StubSelectionHelper:
+    def __init__(self, text: str = "selected text for the benchmark"):
+        self.text = text
+        self.reads = 0
+    
+    def read(self, selection: str = "PRIMARY"):
+        self.reads += 1
+        return self.text
+    
+    def owner(self, selection: str = "PRIMARY"):
+        return 42
+    
+    def close(self):
+        pass
+
+
+class StubBrowserLauncher(BrowserLauncher):
+    def _spawn(self, argv):
+        with self.lock:
+            self.spawns += 1
+
+
+def make_reader(freshness_window: float) -> ClipboardReader:
+    reader = ClipboardReader(freshness_window=freshness_window)
+    if reader.selection_helper:
+        reader.selection_helper.close()
+    reader.selection_helper = StubSelectionHelper()
+    reader.get_clipboard_content = lambda: ""
+    return reader
+
+
+def context_switches() -> int:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_nvcsw + usage.ru_nivcsw
+
+
+def measure_burst(backend: str, size: int, browser: str):
+    launcher = BrowserLauncher(browser_command=browser)
+    cards = [{'id': i, 'name': f"Card {i}", 'url': f"https://example.com/{{content}}/{i}"} for i in range(size)]
+    baseline_threads = threading.active_count()
+    peak_threads = baseline_threads
+    switches = context_switches()
+    started_at = time.perf_counter()
+    if backend == 'asyncio':
+        executor = AsyncCore(launcher, max_queue=size + 2, coalesce_window=0.0, selection_commands=[])
+        executor.start()
+        for card in cards:
+            executor.submit_card(card, "burst")
+    else:
+        executor = LaunchExecutor(max_workers=2, max_queue=size + 2, coalesce_window=0.0)
+        for card in cards:
+            executor.submit(card['id'], launcher.launch_card, card, "burst")
+    while executor.stats()['completed'] < size:
+        peak_threads = max(peak_threads, threading.active_count())
+        time.sleep(0.02)
+    elapsed = time.perf_counter() - started_at
+    switches = context_switches() - switches
+    executor.shutdown(wait=True, timeout=10.0)
+    return elapsed, peak_threads - baseline_threads, switches
+
+
+def run(results: Results, operations: int = 10000, repeat: int = 3):
+    launcher = StubBrowserLauncher(browser_command="stub-browser --new-tab")
+    urls = [f"{template}&n={i}" for i in range(25) for template in TEMPLATES]
+    
+    def render():
+        for i in range(operations):
+            launcher.replace_parameters(urls[i % len(urls)], "python asyncio tutorial")
+    results.add("launch.replace_parameters", time_per_op(render, operations, repeat))
+    
+    cards = [{'id': i, 'name': f"Card {i}", 'url': url} for i, url in enumerate(urls)]
+    for label, freshness_window in (('cold', 0.0), ('warm', 60.0)):
+        launcher = StubBrowserLauncher(make_reader(freshness_window), browser_command="stub-browser --new-tab")
+        
+        def launch():
+            for i in range(operations):
+                launcher.launch_card(cards[i % len(cards)])
+        results.add(f"launch.launch_card[{label}]", time_per_op(launch, operations, repeat))
+    
+    launcher = StubBrowserLauncher(make_reader(0.0), browser_command="stub-browser --new-tab")
+    batch = min(operations, 1000)
+    
+    def executor_launch():
+        executor = LaunchExecutor(max_workers=2, max_queue=batch + 2, coalesce_window=0.0)
+        for i in range(batch):
+            executor.submit(i, launcher.launch_card, cards[i % len(cards)])
+        executor.shutdown(wait=True, timeout=10.0)
+    results.add("launch.executor_launch_card", time_per_op(executor_launch, batch, repeat))
+    
+    browser = shutil.which('true')
+    if not browser:
+        results.skip('launch.burst', "no 'true' executable to stand in for the browser")
+        return
+    size = min(operations, 200)
+    for backend in ('threads', 'asyncio'):
+        elapsed, threads, switches = measure_burst(backend, size, browser)
+        results.add(f"launch.burst[{backend}]", elapsed / size, extra_threads=threads, context_switches=switches)
\ No newline at end of file
@@ -0,0 +1,74 @@
+import argparse
+import gc
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.bench_config_io import make_data
+from benchmarks.harness import Results
+from core.card_manager import CardManager
+from core.persistence import atomic_write_json
+
+
+def measure(count: int, directory: str):
+    path = os.path.join(directory, f"settings-{count}.json")
+    atomic_write_json(path, make_data(count), None)
+    
+    started_at = time.perf_counter()
+    card_manager = CardManager(path, history=False)
+    load_seconds = time.perf_counter() - started_at
+    card_manager.close()
+    del card_manager
+    
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        card_manager = CardManager(path, history=False)
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    card_manager.close()
+    return {'cards': count, 'load_seconds': load_seconds, 'bytes': retained, 'bytes_per_card': retained / count}
+
+
+def run(results: Results, sizes=(1000, 10000, 100000)):
+    directory = tempfile.mkdtemp()
+    try:
+        for count in sizes:
+            row = measure(count, directory)
+            results.add(f"memory.load[{count}]", row['load_seconds'] / count, total_seconds=row['load_seconds'],
+                        bytes_per_card=row['bytes_per_card'])
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-card memory footprint of a loaded CardManager")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args(argv)
+    
+    directory = tempfile.mkdtemp()
+    try:
+        rows = [measure(count, directory) for count in args.sizes]
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(f"{'cards':>8} {'load ms':>10} {'retained KiB':>14} {'bytes/card':>12}")
+    for row in rows:
+        print(f"{row['cards']:>8} {row['load_seconds'] * 1000:>10.2f} {row['bytes'] / 1024:>14.1f} "
+              f"{row['bytes_per_card']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,87 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.bench_config_io import make_data
+from benchmarks.harness import Results, time_per_op
+from core.persistence import atomic_write_json
+
+
+def start_xvfb(display: int = 99, timeout: float = 5.0):
+    if not shutil.which('Xvfb'):
+        return None
+    process = subprocess.Popen(['Xvfb', f":{display}", '-screen', '0', '1280x800x24', '-nolisten', 'tcp'],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    socket_path = f"/tmp/.X11-unix/X{display}"
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if os.path.exists(socket_path):
+            os.environ['DISPLAY'] = f":{display}"
+            return process
+        if process.poll() is not None:
+            return None
+        time.sleep(0.05)
+    process.terminate()
+    return None
+
+
+def run(results: Results, sizes=(100, 1000, 10000), repeat: int = 5):
+    xvfb = None
+    if not os.environ.get('DISPLAY'):
+        xvfb = start_xvfb()
+        if xvfb is None:
+            results.skip("ui.refresh_cards", "no DISPLAY and Xvfb is not installed")
+            return
+    try:
+        import tkinter as tk
+        
+        try:
+            root = tk.Tk()
+        except tk.TclError as e:
+            results.skip("ui.refresh_cards", f"cannot open display: {e}")
+            return
+        root.withdraw()
+        try:
+            for size in sizes:
+                run_size(results, root, size, repeat)
+        finally:
+            root.destroy()
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait(timeout=5)
+
+
+def run_size(results: Results, root, size: int, repeat: int):
+    from benchmarks.bench_launch import StubBrowserLauncher
+    from core.card_manager import CardManager
+    from ui.window import MainWindow
+    
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "settings.json")
+        atomic_write_json(path, make_data(size), None)
+        card_manager = CardManager(path, save_delay=3600, history=False)
+        window = MainWindow(root, card_manager, StubBrowserLauncher(browser_command="stub-browser"), None)
+        root.update()
+        
+        def refresh():
+            window.refresh_cards()
+            root.update()
+        results.add(f"ui.refresh_cards[{size}]", time_per_op(refresh, 1, repeat))
+        
+        def update_one():
+            card_manager.update_card(1, name=f"Renamed {time.perf_counter()}")
+            root.update()
+        results.add(f"ui.card_updated[{size}]", time_per_op(update_one, 1, repeat))
+        
+        card_manager.remove_listener(window.on_card_event)
+        window.window.destroy()
+        card_manager.persister.discard()
+        card_manager.close()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
\ No newline at end of file
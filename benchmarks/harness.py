@@ -0,0 +1,116 @@
+import json
+import os
+import platform
+import re
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+def time_per_op(fn: Callable[[], Any], operations: int, repeat: int = 3) -> float:
+    samples = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started_at) / max(1, operations))
+    return statistics.median(samples)
+
+
+class Results:
+    def __init__(self):
+        self.metrics: Dict[str, Dict[str, Any]] = {}
+        self.skipped: Dict[str, str] = {}
+    
+    def add(self, name: str, seconds_per_op: float, **extra):
+        metric = {'seconds_per_op': seconds_per_op,
+                  'ops_per_sec': 1.0 / seconds_per_op if seconds_per_op > 0 else None}
+        metric.update(extra)
+        self.metrics[name] = metric
+    
+    def skip(self, group: str, reason: str):
+        self.skipped[group] = reason
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'meta': {
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'platform': platform.platform(),
+                'machine': platform.machine(),
+                'cpu_count': os.cpu_count(),
+            },
+            'metrics': self.metrics,
+            'skipped': self.skipped,
+        }
+
+
+def load_results(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_results(results: Dict[str, Any], path: str):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.25) -> Dict[str, Any]:
+    rows = []
+    for name, metric in sorted(current['metrics'].items()):
+        reference = baseline.get('metrics', {}).get(name)
+        if not reference or not reference.get('seconds_per_op'):
+            continue
+        ratio = metric['seconds_per_op'] / reference['seconds_per_op']
+        if ratio > 1 + threshold:
+            status = 'regression'
+        elif ratio < 1 / (1 + threshold):
+            status = 'improvement'
+        else:
+            status = 'ok'
+        rows.append({'name': name, 'baseline': reference['seconds_per_op'], 'current': metric['seconds_per_op'],
+                     'ratio': ratio, 'status': status})
+    return {
+        'threshold': threshold,
+        'rows': rows,
+        'regressions': [row['name'] for row in rows if row['status'] == 'regression'],
+    }
+
+
+def natural_key(name: str):
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', name)]
+
+
+def format_time(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.2f} us"
+
+
+def print_report(results: Dict[str, Any], comparison: Optional[Dict[str, Any]] = None, stream=None):
+    stream = stream or sys.stdout
+    ratios = {row['name']: row for row in comparison['rows']} if comparison else {}
+    for name, metric in sorted(results['metrics'].items(), key=lambda item: natural_key(item[0])):
+        line = f"{name:<44} {format_time(metric['seconds_per_op']):>12}/op"
+        if 'bytes_per_card' in metric:
+            line += f"  {metric['bytes_per_card']:.0f} B/card"
+        if 'context_switches' in metric:
+            line += f"  {metric['extra_threads']} threads, {metric['context_switches']} switches"
+        row = ratios.get(name)
+        if row:
+            line += f"  x{row['ratio']:.2f} {row['status']}"
+        print(line, file=stream)
+    for group, reason in sorted(results['skipped'].items()):
+        print(f"{group:<44} skipped: {reason}", file=stream)
+    if comparison and comparison['regressions']:
+        print(f"{len(comparison['regressions'])} regression(s) above {comparison['threshold']:.0%}", file=stream)
\ No newline at end of file
@@ -0,0 +1,62 @@
+import argparse
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks import bench_card_manager, bench_config_io, bench_launch, bench_memory, bench_ui
+from benchmarks.harness import Results, compare, load_results, print_report, save_results
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+GROUPS = ('card_manager', 'config', 'memory', 'launch', 'ui')
+
+
+def run_groups(groups, quick: bool = False, repeat: int = 3) -> Results:
+    results = Results()
+    if 'card_manager' in groups:
+        bench_card_manager.run(results, (100, 1000) if quick else (100, 1000, 10000, 100000),
+                               operations=200 if quick else 1000, repeat=repeat)
+    if 'config' in groups:
+        bench_config_io.run(results, (1000,) if quick else (1000, 10000, 100000), repeat=repeat)
+    if 'memory' in groups:
+        bench_memory.run(results, (1000,) if quick else (1000, 10000, 100000))
+    if 'launch' in groups:
+        bench_launch.run(results, operations=1000 if quick else 10000, repeat=repeat)
+    if 'ui' in groups:
+        bench_ui.run(results, (100, 1000) if quick else (100, 1000, 10000), repeat=max(repeat, 5))
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Quick Access App benchmark suite")
+    parser.add_argument('--only', nargs='+', choices=GROUPS, default=list(GROUPS), help="benchmark groups to run")
+    parser.add_argument('--quick', action='store_true', help="smaller sizes for a fast smoke run")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help="write results as JSON to this file")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="results file to compare against")
+    parser.add_argument('--save-baseline', action='store_true', help="store these results as the new baseline")
+    parser.add_argument('--threshold', type=float, default=0.25, help="slowdown ratio reported as a regression")
+    parser.add_argument('--json', action='store_true', help="print results and comparison as JSON")
+    args = parser.parse_args(argv)
+    
+    results = run_groups(args.only, args.quick, args.repeat).to_dict()
+    baseline = None if args.save_baseline else load_results(args.baseline)
+    comparison = compare(results, baseline, args.threshold) if baseline else None
+    if comparison:
+        results['comparison'] = comparison
+    
+    if args.output:
+        save_results(results, args.output)
+    if args.save_baseline:
+        save_results(results, args.baseline)
+    
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+    else:
+        print_report(results, comparison)
+    return 1 if comparison and comparison['regressions'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
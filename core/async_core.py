@@ -0,0 +1,542 @@
+import asyncio
+import os
+import platform
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Mapping, Optional, Sequence
+
+from core.ipc import MAX_REQUEST_BYTES, ControlServer, encode_message
+from core.launch_executor import CoalescingExecutor
+from core.selection_helper import SelectionHelper, decode_reply
+from core.tracing import tracer
+from core.url_template import TemplateError
+
+
+MAX_LINE_BYTES = 16 * 1024 * 1024
+
+
+def default_selection_commands() -> List[List[str]]:
+    system = platform.system().lower()
+    if system == "linux":
+        return [['xsel', '-o'], ['xclip', '-o']]
+    if system == "darwin":
+        return [['pbpaste']]
+    return []
+
+
+def install_child_watcher(loop: asyncio.AbstractEventLoop) -> bool:
+    if sys.version_info >= (3, 12) or not hasattr(asyncio, 'PidfdChildWatcher') or not hasattr(os, 'pidfd_open'):
+        return False
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        return False
+    watcher = asyncio.PidfdChildWatcher()
+    watcher.attach_loop(loop)
+    asyncio.set_child_watcher(watcher)
+    return True
+
+
+async def run_capture(argv: Sequence[str], timeout: float) -> Optional[str]:
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *argv,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+    except (OSError, ValueError):
+        return None
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        return None
+    finally:
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            await process.wait()
+    if process.returncode != 0:
+        return None
+    return stdout.decode('utf-8', 'replace').strip()
+
+
+class AsyncSelectionHelper(SelectionHelper):
+    def __init__(self, core: "AsyncCore", command: List[str] = None, timeout: float = 1.0, max_restarts: int = 3,
+                 restart_cooldown: float = 30.0):
+        super().__init__(command, timeout, max_restarts, restart_cooldown)
+        self.core = core
+        self.lock = None
+    
+    def read(self, selection: str = "PRIMARY") -> Optional[str]:
+        return self.core.run(self.read_async(selection), self.timeout * 6)
+    
+    def owner(self, selection: str = "PRIMARY") -> Optional[int]:
+        return self.core.run(self.owner_async(selection), self.timeout * 2)
+    
+    def close(self):
+        self.core.run(self.close_async(), 1.0)
+    
+    async def read_async(self, selection: str = "PRIMARY") -> Optional[str]:
+        async with self._lock():
+            if not self._available():
+                return None
+            
+            for _ in range(2):
+                if not await self._ensure_started():
+                    self._record_failure()
+                    return None
+                
+                reply = await self._request(selection)
+                if reply is not None:
+                    return self._accept(reply)
+                await self._terminate()
+            
+            self._record_failure()
+            return None
+    
+    async def owner_async(self, selection: str = "PRIMARY") -> Optional[int]:
+        async with self._lock():
+            if not self._available() or not self._alive():
+                return None
+            reply = await self._request(f"owner {selection}")
+            if reply is None:
+                await self._terminate()
+                return None
+            return reply.get('owner') if reply.get('ok') else None
+    
+    async def close_async(self):
+        async with self._lock():
+            await self._terminate()
+    
+    def _lock(self) -> asyncio.Lock:
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        return self.lock
+    
+    def _alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+    
+    async def _ensure_started(self) -> bool:
+        if self._alive():
+            return True
+        
+        await self._terminate()
+        try:
+            self.process = await asyncio.create_subprocess_exec(
+                *self.command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=MAX_LINE_BYTES
+            )
+        except (OSError, ValueError):
+            self.process = None
+            return False
+        
+        self.starts += 1
+        ready = await self._read_line(self.timeout * 5)
+        if not ready or not ready.get('ready'):
+            await self._terminate()
+            return False
+        return True
+    
+    async def _request(self, selection: str) -> Optional[dict]:
+        try:
+            self.process.stdin.write(selection.encode('ascii') + b"\n")
+            await asyncio.wait_for(self.process.stdin.drain(), self.timeout)
+        except (OSError, ValueError, asyncio.TimeoutError):
+            return None
+        return await self._read_line(self.timeout)
+    
+    async def _read_line(self, timeout: float) -> Optional[dict]:
+        try:
+            line = await asyncio.wait_for(self.process.stdout.readline(), timeout)
+        except (OSError, ValueError, asyncio.TimeoutError):
+            return None
+        if not line:
+            return None
+        return decode_reply(line)
+    
+    async def _terminate(self):
+        process = self.process
+        self.process = None
+        if not process:
+            return
+        try:
+            process.stdin.close()
+        except Exception:
+            pass
+        try:
+            await asyncio.wait_for(process.wait(), 0.2)
+        except asyncio.TimeoutError:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            await process.wait()
+        except Exception:
+            pass
+
+
+class AsyncCore(CoalescingExecutor):
+    def __init__(self, browser_launcher, clipboard_reader=None, max_workers: int = 2, max_queue: int = 16,
+                 coalesce_window: float = 0.5, selection_timeout: float = 1.0,
+                 selection_commands: List[List[str]] = None, latency_samples: int = 256):
+        super().__init__(coalesce_window, latency_samples)
+        self.launcher = browser_launcher
+        self.clipboard_reader = clipboard_reader
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(1, max_queue)
+        self.selection_timeout = selection_timeout
+        self.selection_commands = default_selection_commands() if selection_commands is None else selection_commands
+        self.selection = None
+        self.loop = None
+        self.thread = None
+        self.pool = None
+        self.subprocesses = False
+        self.tasks: Dict[Hashable, asyncio.Task] = {}
+        self.interruptible = set()
+        self.children = set()
+        self.cancelled = 0
+    
+    def start(self):
+        if self.thread is not None:
+            return
+        ready = threading.Event()
+        self.loop = asyncio.new_event_loop()
+        self.pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix='quick-access-io')
+        self.loop.set_default_executor(self.pool)
+        self.thread = threading.Thread(target=self._run, args=(ready,), name='quick-access-async', daemon=True)
+        self.thread.start()
+        ready.wait()
+        
+        reader = self.clipboard_reader
+        if reader is not None and reader.selection_helper is not None:
+            command = getattr(reader.selection_helper, 'command', None)
+            reader.selection_helper.close()
+            self.selection = AsyncSelectionHelper(self, command, timeout=self.selection_timeout)
+            reader.selection_helper = self.selection
+    
+    def _run(self, ready: threading.Event):
+        asyncio.set_event_loop(self.loop)
+        self.subprocesses = sys.version_info >= (3, 12) or install_child_watcher(self.loop)
+        self.loop.call_soon(ready.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+    
+    def on_loop_thread(self) -> bool:
+        return threading.current_thread() is self.thread
+    
+    def run(self, coroutine: Awaitable, timeout: float) -> Any:
+        if self.loop is None or self.on_loop_thread() or not self.loop.is_running():
+            coroutine.close()
+            return None
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        try:
+            return future.result(timeout)
+        except Exception:
+            future.cancel()
+            return None
+    
+    def call_later(self, delay: float, callback: Callable[[], Any]):
+        return asyncio.run_coroutine_threadsafe(self._deferred(delay, callback), self.loop)
+    
+    async def _deferred(self, delay: float, callback: Callable[[], Any]):
+        await asyncio.sleep(delay)
+        await self.loop.run_in_executor(self.pool, callback)
+    
+    def submit(self, key: Hashable, fn: Callable, *args) -> bool:
+        return self._submit(key, lambda: self.loop.run_in_executor(self.pool, fn, *args), False, None)
+    
+    def submit_card(self, card: Mapping[str, Any], content: str = None, pressed_at: float = None,
+                    replace: bool = False) -> bool:
+        return self._submit(card['id'], lambda: self.launch_card(card, content), replace,
+                            'hotkey.to_browser' if pressed_at is not None else None, pressed_at)
+    
+    def submit_group(self, key: Hashable, cards: Sequence[Mapping[str, Any]], content: str = None) -> bool:
+        return self._submit(key, lambda: self.launch_group(cards, content), False, None)
+    
+    def _submit(self, key: Hashable, factory: Callable[[], Awaitable], replace: bool, span: Optional[str],
+                started_at: float = None) -> bool:
+        now = time.monotonic()
+        with self.lock:
+            if self.shutting_down or self.loop is None:
+                return False
+            token = self._admit(key, now, replace)
+            if token is None:
+                return False
+            if key not in self.pending and len(self.pending) >= self.max_queue:
+                self.rejected += 1
+                return False
+            self._claim(key, token, now)
+        self.loop.call_soon_threadsafe(self._start, key, token, factory, replace, span, started_at, now)
+        return True
+    
+    def _start(self, key: Hashable, token: int, factory: Callable[[], Awaitable], replace: bool,
+               span: Optional[str], started_at: Optional[float], submitted_at: float):
+        older = self.tasks.get(key)
+        if older in self.interruptible:
+            self.interruptible.discard(older)
+            older.cancel()
+        task = self.loop.create_task(self._execute(key, token, factory, span, started_at, submitted_at))
+        self.tasks[key] = task
+        if replace:
+            self.interruptible.add(task)
+    
+    async def _execute(self, key: Hashable, token: int, factory: Callable[[], Awaitable], span: Optional[str],
+                       started_at: Optional[float], submitted_at: float):
+        task = asyncio.current_task()
+        running_at = time.monotonic()
+        tracer.record('executor.queue_wait', running_at - submitted_at)
+        cancelled = False
+        try:
+            result = await factory()
+            failed = result is False
+        except asyncio.CancelledError:
+            cancelled = True
+            failed = False
+        except Exception:
+            failed = True
+        finally:
+            if self.tasks.get(key) is task:
+                del self.tasks[key]
+            self.interruptible.discard(task)
+        finished_at = time.monotonic()
+        if span and not cancelled:
+            finished = time.perf_counter()
+            tracer.record(span, finished - started_at, finished)
+        
+        with self.lock:
+            if not cancelled:
+                self._finish(key, token, submitted_at, running_at, finished_at, failed)
+                return
+            self._release(key, token)
+            self.cancelled += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        stats = {'backend': 'asyncio'}
+        stats.update(super().stats())
+        stats['cancelled'] = self.cancelled
+        stats['io_threads'] = len(getattr(self.pool, '_threads', ()))
+        return stats
+    
+    def shutdown(self, wait: bool = False, timeout: float = 1.0):
+        with self.lock:
+            if self.shutting_down or self.loop is None:
+                return
+            self.shutting_down = True
+        self.run(self._close(), timeout)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        if wait:
+            self.thread.join(timeout=timeout)
+        self.pool.shutdown(wait=False)
+    
+    async def _close(self):
+        if self.selection is not None:
+            await self.selection.close_async()
+        if self.children:
+            await asyncio.wait(list(self.children), timeout=0.5)
+        tasks = list(self.tasks.values()) + list(self.children)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def read_selection(self) -> str:
+        if self.selection is not None:
+            text = await self.selection.read_async("PRIMARY")
+            if text is not None:
+                return text.strip()
+        for argv in self.selection_commands:
+            text = await run_capture(argv, self.selection_timeout)
+            if text:
+                return text
+        if not self.selection_commands and self.clipboard_reader is not None:
+            return await self.loop.run_in_executor(self.pool, self.clipboard_reader.try_get_selected_text)
+        return ""
+    
+    async def capture_selection(self) -> str:
+        reader = self.clipboard_reader
+        if reader is None:
+            with tracer.span('selection.read'):
+                return await self.read_selection()
+        
+        token = reader.capture_token()
+        cached = reader.selection_cache.get('selection', token)
+        if cached is not None:
+            return cached
+        
+        with tracer.span('selection.read'):
+            text = await self.read_selection()
+        if text:
+            return reader.resolve_selection(text, token)
+        return await self.loop.run_in_executor(self.pool, reader.resolve_selection, "", token)
+    
+    async def capture_content(self, urls: Sequence[str], content: str = None) -> Optional[str]:
+        if content is not None or not any(self.launcher.uses_content(url) for url in urls):
+            return content
+        return await self.capture_selection()
+    
+    def reads_clipboard(self, url: str) -> bool:
+        try:
+            return self.launcher.templates.get(url).uses('clipboard')
+        except TemplateError:
+            return False
+    
+    async def render(self, url: str, content: str = None) -> str:
+        if self.reads_clipboard(url):
+            return await self.loop.run_in_executor(self.pool, self.launcher.replace_parameters, url, content)
+        return self.launcher.replace_parameters(url, content or "")
+    
+    async def open_url(self, url: str, command: str = None) -> bool:
+        argv = self.launcher.build_argv(url, command)
+        if not argv or not self.subprocesses:
+            return await self.loop.run_in_executor(self.pool, self.launcher.open_url, url, command)
+        
+        started_at = time.perf_counter()
+        try:
+            try:
+                await self._spawn(argv)
+                return True
+            except OSError:
+                if not command or not self.launcher.default_command:
+                    raise
+                await self._spawn(self.launcher.build_argv(url))
+                return True
+        except OSError:
+            return await self.loop.run_in_executor(self.pool, self.launcher.open_url, url)
+        finally:
+            finished_at = time.perf_counter()
+            self.launcher._record_duration(finished_at - started_at)
+            tracer.record('browser.open', finished_at - started_at, finished_at)
+    
+    async def open_urls(self, urls: List[str], command: str = None) -> bool:
+        if len(urls) == 1:
+            return await self.open_url(urls[0], command)
+        
+        argv = self.launcher.build_batch_argv(urls, command)
+        if argv and self.subprocesses:
+            started_at = time.perf_counter()
+            try:
+                await self._spawn(argv)
+                return True
+            except OSError:
+                pass
+            finally:
+                self.launcher._record_duration(time.perf_counter() - started_at)
+        
+        results = [await self.open_url(url, command) for url in urls]
+        return all(results)
+    
+    async def _spawn(self, argv: List[str]):
+        process = await asyncio.create_subprocess_exec(
+            *argv,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+            start_new_session=os.name == "posix"
+        )
+        with self.launcher.lock:
+            self.launcher.spawns += 1
+        reaper = self.loop.create_task(process.wait())
+        self.children.add(reaper)
+        reaper.add_done_callback(self.children.discard)
+    
+    async def launch_card(self, card: Mapping[str, Any], content: str = None) -> bool:
+        if not card or 'url' not in card:
+            return False
+        key = card.get('id')
+        started_at = time.perf_counter()
+        with tracer.span('launch.capture'):
+            content = await self.capture_content([card['url']], content)
+        self.interruptible.discard(asyncio.current_task())
+        if not self.launcher.admit(key, content):
+            return True
+        
+        try:
+            url = self.launcher._complete_url(await self.render(card['url'], content))
+            result = await self.open_url(url, card.get('browser') or None)
+        except Exception:
+            return False
+        finished_at = time.perf_counter()
+        tracer.record('launch.card', finished_at - started_at, finished_at)
+        if result:
+            self.launcher._notify_launch([card], content, finished_at - started_at)
+        return result
+    
+    async def launch_group(self, cards: Sequence[Mapping[str, Any]], content: str = None) -> bool:
+        started_at = time.perf_counter()
+        cards = [card for card in cards if card and 'url' in card]
+        content = await self.capture_content([card['url'] for card in cards], content)
+        if not self.launcher.admit(tuple(card.get('id') for card in cards), content):
+            return True
+        if any(self.reads_clipboard(card['url']) for card in cards):
+            batches = await self.loop.run_in_executor(self.pool, self.launcher.render_group, cards, content or "")
+        else:
+            batches = self.launcher.render_group(cards, content or "")
+        if not batches:
+            return False
+        results = [await self.open_urls(urls, command) for command, urls in batches.items()]
+        if all(results):
+            self.launcher._notify_launch(cards, content, time.perf_counter() - started_at)
+            return True
+        return False
+
+
+class AsyncControlServer(ControlServer):
+    def __init__(self, path: str, handler: Callable[[Dict[str, Any]], Dict[str, Any]], core):
+        super().__init__(path, handler)
+        self.core = core
+        self.server = None
+    
+    def start(self):
+        if self.running:
+            return
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        previous_umask = os.umask(0o177)
+        try:
+            self.server = asyncio.run_coroutine_threadsafe(
+                asyncio.start_unix_server(self._handle, self.path, limit=MAX_REQUEST_BYTES),
+                self.core.loop
+            ).result(5.0)
+        finally:
+            os.umask(previous_umask)
+        self.running = True
+    
+    def stop(self):
+        self.running = False
+        server = self.server
+        self.server = None
+        if server is not None:
+            self.core.run(self._close(server), 1.0)
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+    
+    @staticmethod
+    async def _close(server):
+        server.close()
+        await server.wait_closed()
+    
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            try:
+                line = await asyncio.wait_for(reader.readline(), 5.0)
+            except Exception as e:
+                response = {'ok': False, 'error': str(e) or "request too large or timed out"}
+            else:
+                response = await asyncio.get_running_loop().run_in_executor(None, self.dispatch, line)
+            writer.write(encode_message(response))
+            await writer.drain()
+        except OSError:
+            pass
+        finally:
+            writer.close()
\ No newline at end of file
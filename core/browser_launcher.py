@@ -1,36 +1,315 @@
-import webbrowser
+import os
+import platform
+import shlex
+import shutil
 import urllib.parse
-from typing import Dict, Any
+import subprocess
+import threading
+import time
+import webbrowser
+from collections import deque
+from datetime import datetime
+from typing import Dict, Any, Callable, Iterable, List, Mapping, Optional
+
+from core.launch_gate import LaunchGate
+from core.tracing import tracer
+from core.url_template import CompiledTemplate, TemplateCache, TemplateError, template_cache
+
+
+def resolve_default_command() -> Optional[List[str]]:
+    system = platform.system().lower()
+    if system == "linux":
+        for candidate in (['xdg-open'], ['gio', 'open']):
+            if shutil.which(candidate[0]):
+                return candidate
+    elif system == "darwin":
+        if shutil.which('open'):
+            return ['open']
+    return None
+
+
+SINGLE_URL_OPENERS = frozenset(('xdg-open', 'sensible-browser', 'start'))
+
+
+def accepts_multiple_urls(argv: Optional[List[str]]) -> bool:
+    if not argv or any('%s' in arg for arg in argv):
+        return False
+    return os.path.basename(argv[0]) not in SINGLE_URL_OPENERS
+
+
+def resolve_batch_command(default_command: Optional[List[str]]) -> Optional[List[str]]:
+    if accepts_multiple_urls(default_command):
+        return default_command
+    if default_command and platform.system().lower() == "linux" and shutil.which('gio'):
+        return ['gio', 'open']
+    return None
 
 
 class BrowserLauncher:
-    def __init__(self, clipboard_reader=None):
+    def __init__(self, clipboard_reader=None, browser_command: str = None, templates: TemplateCache = None,
+                 on_launch: Callable[[int, Optional[str], float], None] = None, gate: LaunchGate = None):
         self.clipboard_reader = clipboard_reader
+        self.on_launch = on_launch
+        self.gate = gate
+        self.templates = templates or template_cache
+        self.lock = threading.Lock()
+        self.command_cache: Dict[str, List[str]] = {}
+        self.children: List[subprocess.Popen] = []
+        self.open_durations = deque(maxlen=256)
+        self.last_open_duration = 0.0
+        self.controller = None
+        self.use_startfile = platform.system().lower() == "windows" and hasattr(os, 'startfile')
+        self.default_command = self.parse_command(browser_command) if browser_command else resolve_default_command()
+        self.batch_command = resolve_batch_command(self.default_command)
+        self.spawns = 0
+        if not self.default_command and not self.use_startfile:
+            try:
+                self.controller = webbrowser.get()
+            except webbrowser.Error:
+                self.controller = None
+    
+    def parse_command(self, command: str) -> List[str]:
+        argv = self.command_cache.get(command)
+        if argv is None:
+            argv = shlex.split(command, posix=os.name == "posix")
+            self.command_cache[command] = argv
+        return argv
     
     def replace_parameters(self, url: str, content: str = None) -> str:
-        if content is None and self.clipboard_reader:
-            content = self.clipboard_reader.get_selected_content()
+        with tracer.span('url.render'):
+            try:
+                template = self.templates.get(url)
+            except TemplateError:
+                return self._replace_legacy(url, content)
+            return self.render(template, content)
+    
+    def render(self, template: CompiledTemplate, content: str = None, values: Dict = None) -> str:
+        if not template.slots:
+            return template.source
         
-        if content:
-            encoded_content = urllib.parse.quote(content, safe='')
-            url = url.replace('{content}', encoded_content)
+        if values is None:
+            values = {}
+        for key in template.keys:
+            if key not in values:
+                values[key] = self._resolve(key[0], key[1], content)
+        return template.render(values)
+    
+    def _resolve(self, source: str, arg: Optional[str], content: str = None) -> str:
+        if source == 'content':
+            if content is None and self.clipboard_reader:
+                content = self.clipboard_reader.get_selected_content()
+            return content or ""
+        if source == 'clipboard':
+            if self.clipboard_reader:
+                return self.clipboard_reader.get_clipboard_content()
+            return ""
+        if source == 'date':
+            return datetime.now().strftime(arg or '%Y-%m-%d')
+        if source == 'env':
+            return os.environ.get(arg, "")
+        return ""
+    
+    def uses_content(self, url: str) -> bool:
+        try:
+            return self.templates.get(url).uses('content')
+        except TemplateError:
+            return '{content}' in url
+    
+    def capture_content(self, urls: Iterable[str], content: str = None) -> Optional[str]:
+        if content is not None or not self.clipboard_reader:
+            return content
+        if any(self.uses_content(url) for url in urls):
+            return self.clipboard_reader.get_selected_content()
+        return None
+    
+    def _replace_legacy(self, url: str, content: str = None) -> str:
+        if content is None and self.clipboard_reader and '{content}' in url:
+            content = self.clipboard_reader.get_selected_content()
+        return url.replace('{content}', self._encode_legacy(content))
+    
+    @staticmethod
+    def _encode_legacy(content: str) -> str:
+        if not content:
+            return ""
+        return urllib.parse.quote(content, safe='')
+    
+    def build_argv(self, url: str, command: str = None) -> Optional[List[str]]:
+        argv = self.parse_command(command) if command else self.default_command
+        if not argv:
+            return None
+        if any('%s' in arg for arg in argv):
+            return [arg.replace('%s', url) for arg in argv]
+        return argv + [url]
+    
+    def build_batch_argv(self, urls: List[str], command: str = None) -> Optional[List[str]]:
+        if command:
+            argv = self.parse_command(command)
+            if not accepts_multiple_urls(argv):
+                return None
         else:
-            url = url.replace('{content}', '')
+            argv = self.batch_command
+        if not argv:
+            return None
+        return argv + urls
+    
+    def open_url(self, url: str, command: str = None) -> bool:
+        started_at = time.perf_counter()
+        try:
+            argv = self.build_argv(url, command)
+            if argv:
+                try:
+                    self._spawn(argv)
+                    return True
+                except OSError:
+                    if command and self.default_command:
+                        argv = self.build_argv(url)
+                        try:
+                            self._spawn(argv)
+                            return True
+                        except OSError:
+                            pass
+            
+            if self.use_startfile:
+                os.startfile(url)
+                return True
+            if self.controller is not None:
+                return self.controller.open(url)
+            webbrowser.open(url)
+            return True
+        finally:
+            finished_at = time.perf_counter()
+            self._record_duration(finished_at - started_at)
+            tracer.record('browser.open', finished_at - started_at, finished_at)
+    
+    def _spawn(self, argv: List[str]):
+        kwargs = {
+            'stdin': subprocess.DEVNULL,
+            'stdout': subprocess.DEVNULL,
+            'stderr': subprocess.DEVNULL,
+            'close_fds': True,
+        }
+        if os.name == "posix":
+            kwargs['start_new_session'] = True
+        process = subprocess.Popen(argv, **kwargs)
+        with self.lock:
+            self.spawns += 1
+            self.children = [child for child in self.children if child.poll() is None]
+            self.children.append(process)
+    
+    def _record_duration(self, duration: float):
+        with self.lock:
+            self.last_open_duration = duration
+            self.open_durations.append(duration)
+    
+    def open_stats(self) -> Dict[str, Any]:
+        with self.lock:
+            durations = sorted(self.open_durations)
+        return {
+            'opens': len(durations),
+            'spawns': self.spawns,
+            'last': self.last_open_duration,
+            'p50': durations[len(durations) // 2] if durations else 0.0,
+            'max': durations[-1] if durations else 0.0,
+        }
+    
+    def open_urls(self, urls: List[str], command: str = None) -> bool:
+        if len(urls) == 1:
+            return self.open_url(urls[0], command)
         
+        argv = self.build_batch_argv(urls, command)
+        if argv:
+            started_at = time.perf_counter()
+            try:
+                self._spawn(argv)
+                return True
+            except OSError:
+                pass
+            finally:
+                self._record_duration(time.perf_counter() - started_at)
+        
+        results = [self.open_url(url, command) for url in urls]
+        return all(results)
+    
+    @staticmethod
+    def _complete_url(url: str) -> str:
+        if not url.startswith(('http://', 'https://')) and '://' not in url:
+            return 'https://' + url
         return url
     
-    def launch_url(self, url: str, content: str = None) -> bool:
+    def launch_url(self, url: str, content: str = None, command: str = None) -> bool:
         try:
-            final_url = self.replace_parameters(url, content)
-            if not final_url.startswith(('http://', 'https://')):
-                if '://' not in final_url:
-                    final_url = 'https://' + final_url
-            webbrowser.open(final_url)
-            return True
+            final_url = self._complete_url(self.replace_parameters(url, content))
+            return self.open_url(final_url, command)
         except Exception:
             return False
     
+    def admit(self, target: Any, content: Optional[str]) -> bool:
+        return self.gate is None or self.gate.admit(target, content)
+    
     def launch_card(self, card: Dict[str, Any], content: str = None) -> bool:
         if not card or 'url' not in card:
             return False
-        return self.launch_url(card['url'], content)
\ No newline at end of file
+        started_at = time.perf_counter()
+        try:
+            with tracer.span('launch.capture'):
+                content = self.capture_content([card['url']], content)
+        except Exception:
+            return False
+        if not self.admit(card.get('id'), content):
+            return True
+        result = self.launch_url(card['url'], content, card.get('browser') or None)
+        finished_at = time.perf_counter()
+        tracer.record('launch.card', finished_at - started_at, finished_at)
+        if result:
+            self._notify_launch([card], content, finished_at - started_at)
+        return result
+    
+    def _notify_launch(self, cards: Iterable[Mapping[str, Any]], content: Optional[str], latency: float):
+        if not self.on_launch:
+            return
+        for card in cards:
+            if 'id' not in card:
+                continue
+            try:
+                self.on_launch(card['id'], content, latency)
+            except Exception:
+                pass
+    
+    def render_group(self, cards: Iterable[Mapping[str, Any]], content: str = None) -> Dict[Optional[str], List[str]]:
+        cards = [card for card in cards if card and 'url' in card]
+        templates = []
+        for card in cards:
+            try:
+                templates.append(self.templates.get(card['url']))
+            except TemplateError:
+                templates.append(None)
+        
+        content = self.capture_content([card['url'] for card in cards], content) or ""
+        
+        values = {}
+        batches: Dict[Optional[str], List[str]] = {}
+        for card, template in zip(cards, templates):
+            if template is None:
+                url = self._replace_legacy(card['url'], content)
+            else:
+                url = self.render(template, content, values)
+            batches.setdefault(card.get('browser') or None, []).append(self._complete_url(url))
+        return batches
+    
+    def launch_group(self, cards: Iterable[Mapping[str, Any]], content: str = None) -> bool:
+        started_at = time.perf_counter()
+        cards = [card for card in cards if card and 'url' in card]
+        try:
+            content = self.capture_content([card['url'] for card in cards], content)
+            if not self.admit(tuple(card.get('id') for card in cards), content):
+                return True
+            batches = self.render_group(cards, content)
+            if not batches:
+                return False
+            results = [self.open_urls(urls, command) for command, urls in batches.items()]
+        except Exception:
+            return False
+        if all(results):
+            self._notify_launch(cards, content, time.perf_counter() - started_at)
+            return True
+        return False
\ No newline at end of file
@@ -0,0 +1,92 @@
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional
+
+
+FIELDS = ('id', 'name', 'url', 'hotkey', 'browser')
+
+
+def _intern(value: Optional[str]) -> str:
+    return sys.intern(value) if value else ""
+
+
+class Card(Mapping):
+    __slots__ = ('_id', '_name', '_url', '_hotkey', '_browser', '_extra')
+    
+    def __init__(self, id: int, name: str, url: str, hotkey: str = "", browser: str = "",
+                 extra: Optional[Dict[str, Any]] = None):
+        self._id = id
+        self._name = name
+        self._url = url
+        self._hotkey = _intern(hotkey)
+        self._browser = _intern(browser)
+        self._extra = extra or None
+    
+    id = property(lambda self: self._id)
+    name = property(lambda self: self._name)
+    url = property(lambda self: self._url)
+    hotkey = property(lambda self: self._hotkey)
+    browser = property(lambda self: self._browser)
+    
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Card":
+        if type(data) is cls:
+            return data
+        card = object.__new__(cls)
+        card._id = data['id']
+        card._name = data.get('name', "")
+        card._url = data['url']
+        card._hotkey = _intern(data.get('hotkey'))
+        card._browser = _intern(data.get('browser'))
+        card._extra = {key: value for key, value in data.items() if key not in FIELDS} or None
+        return card
+    
+    def replace(self, **fields) -> "Card":
+        data = self.to_dict()
+        data.update(fields)
+        return Card.from_dict(data)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        data = {'id': self._id, 'name': self._name, 'url': self._url, 'hotkey': self._hotkey}
+        if self._browser:
+            data['browser'] = self._browser
+        if self._extra:
+            data.update(self._extra)
+        return data
+    
+    def __getitem__(self, key: str) -> Any:
+        if key == 'browser':
+            if not self._browser:
+                raise KeyError(key)
+            return self._browser
+        if key in FIELDS:
+            return getattr(self, '_' + key)
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+    
+    def __contains__(self, key: object) -> bool:
+        if key == 'browser':
+            return bool(self._browser)
+        return key in FIELDS or bool(self._extra) and key in self._extra
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_dict())
+    
+    def __len__(self) -> int:
+        return 4 + bool(self._browser) + (len(self._extra) if self._extra else 0)
+    
+    def __eq__(self, other: object) -> bool:
+        if type(other) is Card:
+            return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __reduce__(self):
+        return (Card.from_dict, (self.to_dict(),))
+    
+    def __repr__(self) -> str:
+        return f"Card({self.to_dict()!r})"
\ No newline at end of file
@@ -0,0 +1,190 @@
+import csv
+import html
+import json
+import os
+from collections import deque
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, TextIO
+
+
+FORMATS = ('jsonl', 'csv', 'bookmarks', 'json')
+FIELDS = ('name', 'url', 'hotkey', 'browser')
+EXTENSIONS = {
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.csv': 'csv',
+    '.html': 'bookmarks',
+    '.htm': 'bookmarks',
+    '.json': 'json',
+}
+CHUNK_SIZE = 64 * 1024
+
+
+def detect_format(path: str, fmt: Optional[str] = None) -> str:
+    if fmt:
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown format '{fmt}'")
+        return fmt
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in EXTENSIONS:
+        raise ValueError(f"Cannot tell the format of '{path}'; pass one of {', '.join(FORMATS)}")
+    return EXTENSIONS[extension]
+
+
+def read_jsonl(stream: TextIO) -> Iterator[Dict[str, Any]]:
+    for number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield {'error': f"line {number}: {e}"}
+            continue
+        yield record if isinstance(record, dict) else {'error': f"line {number}: not an object"}
+
+
+def read_csv(stream: TextIO) -> Iterator[Dict[str, Any]]:
+    reader = csv.reader(stream)
+    header = next(reader, None)
+    if header is None:
+        return
+    columns = [column.strip().lower() for column in header]
+    if 'url' not in columns:
+        columns = list(FIELDS)
+        yield dict(zip(columns, header))
+    for row in reader:
+        if row:
+            yield dict(zip(columns, row))
+
+
+def read_json(stream: TextIO) -> Iterator[Dict[str, Any]]:
+    data = json.load(stream)
+    if isinstance(data, dict):
+        data = data.get('cards', [])
+    for record in data:
+        yield record if isinstance(record, dict) else {'error': "not an object"}
+
+
+class BookmarkParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.records = deque()
+        self.href = None
+        self.title = []
+    
+    def handle_starttag(self, tag, attrs):
+        if tag == 'a':
+            self.href = dict(attrs).get('href')
+            self.title = []
+    
+    def handle_data(self, data):
+        if self.href is not None:
+            self.title.append(data)
+    
+    def handle_endtag(self, tag):
+        if tag == 'a' and self.href is not None:
+            name = " ".join("".join(self.title).split())
+            self.records.append({'name': name, 'url': self.href})
+            self.href = None
+            self.title = []
+
+
+def read_bookmarks(stream: TextIO) -> Iterator[Dict[str, Any]]:
+    parser = BookmarkParser()
+    while True:
+        chunk = stream.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        parser.feed(chunk)
+        while parser.records:
+            yield parser.records.popleft()
+    parser.close()
+    while parser.records:
+        yield parser.records.popleft()
+
+
+READERS = {
+    'jsonl': read_jsonl,
+    'csv': read_csv,
+    'bookmarks': read_bookmarks,
+    'json': read_json,
+}
+
+
+def read_cards(path: str, fmt: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    reader = READERS[detect_format(path, fmt)]
+    with open(path, 'r', encoding='utf-8', newline='') as stream:
+        yield from reader(stream)
+
+
+def _export_fields(card: Mapping[str, Any]) -> Dict[str, Any]:
+    return {field: card[field] for field in FIELDS if card.get(field)}
+
+
+def write_jsonl(cards: Iterable[Mapping[str, Any]], stream: TextIO) -> int:
+    count = 0
+    for card in cards:
+        stream.write(json.dumps(_export_fields(card), ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+def write_csv(cards: Iterable[Mapping[str, Any]], stream: TextIO) -> int:
+    writer = csv.writer(stream)
+    writer.writerow(FIELDS)
+    count = 0
+    for card in cards:
+        writer.writerow([card.get(field, '') for field in FIELDS])
+        count += 1
+    return count
+
+
+def write_bookmarks(cards: Iterable[Mapping[str, Any]], stream: TextIO) -> int:
+    stream.write(
+        "<!DOCTYPE NETSCAPE-Bookmark-file-1>\n"
+        '<META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=UTF-8">\n'
+        "<TITLE>Bookmarks</TITLE>\n"
+        "<H1>Bookmarks</H1>\n"
+        "<DL><p>\n"
+        "    <DT><H3>Quick Access</H3>\n"
+        "    <DL><p>\n"
+    )
+    count = 0
+    for card in cards:
+        stream.write(f'        <DT><A HREF="{html.escape(card["url"])}">{html.escape(card["name"])}</A>\n')
+        count += 1
+    stream.write("    </DL><p>\n</DL><p>\n")
+    return count
+
+
+def write_json(cards: Iterable[Mapping[str, Any]], stream: TextIO) -> int:
+    records = [_export_fields(card) for card in cards]
+    json.dump({'cards': records}, stream, ensure_ascii=False, indent=2)
+    return len(records)
+
+
+WRITERS = {
+    'jsonl': write_jsonl,
+    'csv': write_csv,
+    'bookmarks': write_bookmarks,
+    'json': write_json,
+}
+
+
+def write_cards(cards: Iterable[Mapping[str, Any]], path: str, fmt: Optional[str] = None) -> int:
+    writer = WRITERS[detect_format(path, fmt)]
+    temp_path = f"{path}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8', newline='') as stream:
+            count = writer(cards, stream)
+            stream.flush()
+            os.fsync(stream.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    return count
\ No newline at end of file
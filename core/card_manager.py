@@ -1,80 +1,721 @@
 import json
 import os
-from typing import List, Dict, Any
+import threading
+import time
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import List, Dict, Any, Callable, Iterable, Mapping, Optional, Sequence, Union
+
+from core import card_io
+from core.card import Card
+from core.journal import CardJournal
+from core.launch_history import LaunchHistory
+from core.persistence import (WriteBehindPersister, file_signature, flush_pending, gc_paused, read_snapshot,
+                              write_snapshot)
+from core.url_template import TemplateError, compile_template, template_cache
+
+
+MODIFIER_ORDER = ('ctrl', 'alt', 'shift', 'windows')
+MODIFIER_ALIASES = {'control': 'ctrl', 'ctl': 'ctrl', 'win': 'windows', 'super': 'windows'}
+
+
+def normalize_hotkey(hotkey: str) -> str:
+    if not hotkey:
+        return ""
+    steps = []
+    for step in hotkey.lower().split(","):
+        keys = [MODIFIER_ALIASES.get(part.strip(), part.strip()) for part in step.split("+")]
+        keys = [key for key in keys if key]
+        modifiers = sorted((key for key in keys if key in MODIFIER_ORDER), key=MODIFIER_ORDER.index)
+        others = [key for key in keys if key not in MODIFIER_ORDER]
+        if modifiers or others:
+            steps.append("+".join(modifiers + others))
+    return ", ".join(steps)
+
+
+def normalize_name(name: str) -> str:
+    return (name or "").strip().casefold()
+
+
+def normalize_url(url: str) -> str:
+    return (url or "").strip()
 
 
 class CardManager:
-    def __init__(self, config_path: str = "config/settings.json"):
+    def __init__(self, config_path: str = "config/settings.json", save_delay: float = 0.25,
+                 journaled: Optional[bool] = None, compact_threshold: int = 256 * 1024, history: bool = True,
+                 compact_json: Optional[bool] = None, snapshot_cache: Optional[bool] = None):
         self.config_path = config_path
-        self.cards = []
+        self.lock = threading.RLock()
+        self.compact_json = compact_json
+        self.snapshot_cache = snapshot_cache
+        self.journaled = journaled
+        self.compact_threshold = compact_threshold
+        self.loaded_from_snapshot = False
+        self.persister = WriteBehindPersister(config_path, self._to_data, delay=save_delay)
+        self.journal = None
+        self.history = LaunchHistory(LaunchHistory.path_for(config_path)) if history else None
+        self.load_error = None
+        self.reload_error = None
+        self.loaded_signature = None
+        self.cards: Dict[int, Card] = {}
+        self.hotkey_index: Dict[str, Union[int, List[int]]] = {}
+        self.name_index: Dict[str, Union[int, List[int]]] = {}
+        self.url_index: Dict[str, Union[int, List[int]]] = {}
+        self.next_id = 1
+        self.extra_settings: Dict[str, Any] = {}
+        self.groups: Dict[int, Dict[str, Any]] = {}
+        self.group_views: Dict[int, Mapping[str, Any]] = {}
+        self._all_cards_view = None
+        self.listeners: List[Callable[[str, int, Optional[Mapping[str, Any]]], None]] = []
         self.load_cards()
     
     def load_cards(self):
+        flush_pending(self.config_path)
+        self.load_error = None
         try:
             os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
             if os.path.exists(self.config_path):
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.cards = data.get('cards', [])
+                signature = file_signature(self.config_path)
+                with gc_paused():
+                    data = read_snapshot(self.config_path, signature)
+                    self.loaded_from_snapshot = data is not None
+                    if data is None:
+                        data = self._read_config()
+                    problems = self._check_records(data)
+                    if problems:
+                        self.load_error = ValueError("skipped " + "; ".join(problems))
+                    with self.lock:
+                        self._set_data(data)
+                self.loaded_signature = signature
+                self._configure_storage()
+                if self.persister.snapshot_cache and not self.loaded_from_snapshot:
+                    write_snapshot(self.config_path, self._to_data(), signature)
             else:
-                self.cards = []
+                with self.lock:
+                    self._set_data({})
+                self._configure_storage()
                 self.save_cards()
-        except Exception:
-            self.cards = []
+                self.flush()
+            self._replay_journal()
+        except Exception as e:
+            self.load_error = e
+            with self.lock:
+                self._set_data({})
+        self._emit('reloaded')
     
-    def save_cards(self):
+    def _read_config(self) -> Dict[str, Any]:
         try:
-            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-            data = {'cards': self.cards}
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        except Exception:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise TypeError("settings must be an object")
+        except (ValueError, TypeError):
+            self._quarantine_config()
+            raise
+        return data
+    
+    def _configure_storage(self):
+        storage = self.extra_settings.get('storage', {})
+        compact_json = storage.get('compact', False) if self.compact_json is None else self.compact_json
+        snapshot_cache = storage.get('snapshot_cache', False) if self.snapshot_cache is None else self.snapshot_cache
+        self.persister.indent = None if compact_json else 2
+        self.persister.snapshot_cache = bool(snapshot_cache)
+        journaled = storage.get('journaled', False) if self.journaled is None else self.journaled
+        if journaled and not self.journal:
+            self.journal = CardJournal(CardJournal.path_for(self.config_path), self.compact_threshold)
+        elif not journaled and self.journal:
+            try:
+                self.journal.reset()
+            except OSError:
+                pass
+            self.journal.close()
+            self.journal = None
+    
+    def reload_from_disk(self) -> Optional[Dict[str, int]]:
+        signature = file_signature(self.config_path)
+        if signature is None or signature in (self.loaded_signature, self.persister.last_signature):
+            return None
+        try:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
+                data = self._check_data(json.load(f))
+            problems = self._check_records(data)
+        except (OSError, ValueError, TypeError) as e:
+            self.reload_error = e
+            return None
+        self.reload_error = ValueError("skipped " + "; ".join(problems)) if problems else None
+        
+        events = []
+        with self.lock:
+            if file_signature(self.config_path) != signature:
+                return None
+            self._apply_diff(data, events)
+            self.loaded_signature = signature
+        self._configure_storage()
+        self.persister.discard()
+        if self.journal:
+            try:
+                self.journal.reset()
+            except OSError:
+                pass
+        
+        changes = {'added': 0, 'updated': 0, 'removed': 0, 'groups': 0}
+        for event, item_id in events:
+            if event.startswith('group_'):
+                changes['groups'] += 1
+                self._emit(event, item_id, self.group_views.get(item_id))
+            else:
+                changes[event] += 1
+                self._emit(event, item_id, self.cards.get(item_id))
+        return changes
+    
+    @staticmethod
+    def _check_data(data: Any) -> Dict[str, Any]:
+        if not isinstance(data, dict):
+            raise TypeError("settings must be an object")
+        if not isinstance(data.get('cards'), list):
+            raise TypeError("settings have no cards list")
+        return data
+    
+    @staticmethod
+    def _check_records(data: Dict[str, Any]) -> List[str]:
+        problems = []
+        ids = set()
+        for key in ('cards', 'groups'):
+            items = data.get(key, [])
+            if not isinstance(items, list):
+                problems.append(f"{key}: not a list")
+                items = []
+            valid = []
+            for position, item in enumerate(items):
+                item_id = item.get('id') if isinstance(item, dict) else None
+                if type(item_id) is not int or item_id in ids:
+                    problems.append(f"{key}[{position}]: invalid or duplicate id {item_id!r}")
+                elif key == 'cards' and not isinstance(item.get('url'), str):
+                    problems.append(f"card {item_id}: missing url")
+                elif key == 'groups' and not isinstance(item.get('cards', []), list):
+                    problems.append(f"group {item_id}: cards must be a list")
+                else:
+                    ids.add(item_id)
+                    if key == 'cards':
+                        item.setdefault('name', item['url'])
+                        item.setdefault('hotkey', "")
+                    valid.append(item)
+            if key in data:
+                data[key] = valid
+        return problems
+    
+    def _apply_diff(self, data: Dict[str, Any], events: List[tuple]):
+        incoming = {card['id']: Card.from_dict(card) for card in data.get('cards', [])}
+        for card_id in [card_id for card_id in self.cards if card_id not in incoming]:
+            card = self.cards.pop(card_id)
+            self._unindex_card(card)
+            template_cache.invalidate(card['url'])
+            events.append(('removed', card_id))
+        for card_id, card in incoming.items():
+            current = self.cards.get(card_id)
+            if current is None:
+                self._index_card(card)
+                events.append(('added', card_id))
+            elif current != card:
+                self._unindex_card(current)
+                if current['url'] != card['url']:
+                    template_cache.invalidate(current['url'])
+                self._index_card(card)
+                events.append(('updated', card_id))
+        self._all_cards_view = None
+        
+        incoming_groups = {group['id']: group for group in data.get('groups', [])}
+        for group_id in [group_id for group_id in self.groups if group_id not in incoming_groups]:
+            del self.groups[group_id]
+            del self.group_views[group_id]
+            events.append(('group_removed', group_id))
+        for group_id, group in incoming_groups.items():
+            group['cards'] = [card_id for card_id in group['cards'] if card_id in self.cards]
+            current = self.groups.get(group_id)
+            if current is None:
+                self._store_group(group)
+                events.append(('group_added', group_id))
+            elif current != group:
+                current.clear()
+                current.update(group)
+                events.append(('group_updated', group_id))
+        
+        max_id = max(list(self.cards) + list(self.groups) + [0])
+        self.next_id = max(self.next_id, int(data.get('next_id', 1)), max_id + 1)
+        self.extra_settings = {k: v for k, v in data.items() if k not in ('cards', 'groups', 'next_id')}
+    
+    def add_listener(self, callback: Callable[[str, int, Optional[Mapping[str, Any]]], None]):
+        if callback not in self.listeners:
+            self.listeners.append(callback)
+    
+    def remove_listener(self, callback: Callable[[str, int, Optional[Mapping[str, Any]]], None]):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+    
+    def _emit(self, event: str, card_id: int = 0, card: Optional[Mapping[str, Any]] = None):
+        for callback in list(self.listeners):
+            try:
+                callback(event, card_id, card)
+            except Exception:
+                pass
+    
+    def _replay_journal(self):
+        if not self.journal:
+            return
+        with self.lock:
+            for record in self.journal.replay():
+                self._apply_record(record)
+        if self.journal.torn or self.journal.needs_compaction():
+            self.compact()
+    
+    def _apply_record(self, record: Dict[str, Any]):
+        op = record.get('op')
+        if op == 'add':
+            card = Card.from_dict(record['card'])
+            existing = self.cards.get(card['id'])
+            if existing is not None:
+                self._unindex_card(existing)
+            self._index_card(card)
+            self.next_id = max(self.next_id, card['id'] + 1)
+        elif op == 'update':
+            card = self.cards.get(record['id'])
+            if card is not None:
+                self._unindex_card(card)
+                self._index_card(card.replace(**record.get('fields', {})))
+        elif op == 'delete':
+            card = self.cards.pop(record['id'], None)
+            if card is not None:
+                self._unindex_card(card)
+                self._all_cards_view = None
+                self._drop_from_groups(card['id'])
+        elif op == 'group_add':
+            group = dict(record['group'])
+            group['cards'] = list(group.get('cards', []))
+            self._store_group(group)
+            self.next_id = max(self.next_id, group['id'] + 1)
+        elif op == 'group_update':
+            group = self.groups.get(record['id'])
+            if group is not None:
+                group.update(record.get('fields', {}))
+        elif op == 'group_delete':
+            self.groups.pop(record['id'], None)
+            self.group_views.pop(record['id'], None)
+    
+    def _commit(self, record: Dict[str, Any]):
+        if self.journal:
+            try:
+                self.journal.append(record)
+            except OSError:
+                self.save_cards()
+                return
+            if self.journal.needs_compaction():
+                self.compact()
+        else:
+            self.save_cards()
+    
+    def compact(self) -> bool:
+        if not self.journal:
+            return self.flush()
+        self.persister.mark_dirty()
+        if not self.persister.flush():
+            return False
+        try:
+            self.journal.reset()
+        except OSError:
+            return False
+        return True
+    
+    def _quarantine_config(self):
+        if not os.path.exists(self.config_path):
+            return
+        try:
+            os.replace(self.config_path, f"{self.config_path}.corrupt-{int(time.time())}")
+        except OSError:
             pass
     
-    def add_card(self, name: str, url: str, hotkey: str = "") -> int:
-        card_id = len(self.cards) + 1
-        card = {
-            'id': card_id,
-            'name': name,
-            'url': url,
-            'hotkey': hotkey
-        }
-        self.cards.append(card)
-        self.save_cards()
+    def _set_data(self, data: Dict[str, Any]):
+        self.cards = {}
+        self.hotkey_index = {}
+        self.name_index = {}
+        self.url_index = {}
+        self.groups = {}
+        self.group_views = {}
+        self._all_cards_view = None
+        
+        max_id = self._index_cards(data.get('cards', []))
+        for group in data.get('groups', []):
+            group['cards'] = [card_id for card_id in group.get('cards', []) if card_id in self.cards]
+            self._store_group(group)
+            max_id = max(max_id, group['id'])
+        
+        self.next_id = max(int(data.get('next_id', 1)), max_id + 1)
+        self.extra_settings = {k: v for k, v in data.items() if k not in ('cards', 'groups', 'next_id')}
+    
+    def _to_data(self) -> Dict[str, Any]:
+        with self.lock:
+            data = dict(self.extra_settings)
+            data['next_id'] = self.next_id
+            data['cards'] = [card.to_dict() for card in self.cards.values()]
+            if self.groups:
+                data['groups'] = [dict(group, cards=list(group['cards'])) for group in self.groups.values()]
+        return data
+    
+    def save_cards(self):
+        self.persister.mark_dirty()
+    
+    def flush(self) -> bool:
+        return self.persister.flush()
+    
+    def close(self):
+        self.persister.close()
+        if self.journal:
+            self.journal.close()
+        if self.history:
+            self.history.close()
+    
+    @contextmanager
+    def transaction(self):
+        with self.persister.batch():
+            yield self
+    
+    def _index_card(self, card: Card):
+        card_id = card.id
+        self.cards[card_id] = card
+        self._all_cards_view = None
+        self._add_to_index(self.hotkey_index, normalize_hotkey(card.hotkey), card_id)
+        self._add_to_index(self.name_index, normalize_name(card.name), card_id)
+        self._add_to_index(self.url_index, normalize_url(card.url), card_id)
+    
+    def _index_cards(self, records: Iterable[Mapping[str, Any]]) -> int:
+        cards = self.cards
+        hotkey_index = self.hotkey_index
+        name_index = self.name_index
+        url_index = self.url_index
+        from_dict = Card.from_dict
+        max_id = 0
+        for record in records:
+            card = from_dict(record)
+            card_id = card.id
+            cards[card_id] = card
+            if card.hotkey:
+                self._add_to_index(hotkey_index, normalize_hotkey(card.hotkey), card_id)
+            for index, key in ((name_index, normalize_name(card.name)), (url_index, normalize_url(card.url))):
+                ids = index.get(key)
+                if ids is None:
+                    index[key] = card_id
+                elif type(ids) is int:
+                    index[key] = [ids, card_id]
+                else:
+                    ids.append(card_id)
+            if card_id > max_id:
+                max_id = card_id
+        self._all_cards_view = None
+        return max_id
+    
+    def _unindex_card(self, card: Card):
+        card_id = card.id
+        self._remove_from_index(self.hotkey_index, normalize_hotkey(card.hotkey), card_id)
+        self._remove_from_index(self.name_index, normalize_name(card.name), card_id)
+        self._remove_from_index(self.url_index, normalize_url(card.url), card_id)
+    
+    @staticmethod
+    def _add_to_index(index: Dict[str, Union[int, List[int]]], key: str, card_id: int):
+        if not key:
+            return
+        ids = index.get(key)
+        if ids is None:
+            index[key] = card_id
+        elif type(ids) is int:
+            index[key] = [ids, card_id]
+        else:
+            ids.append(card_id)
+    
+    @staticmethod
+    def _remove_from_index(index: Dict[str, Union[int, List[int]]], key: str, card_id: int):
+        ids = index.get(key)
+        if ids is None:
+            return
+        if type(ids) is int:
+            if ids == card_id:
+                del index[key]
+            return
+        try:
+            ids.remove(card_id)
+        except ValueError:
+            return
+        if len(ids) == 1:
+            index[key] = ids[0]
+    
+    def _lookup(self, index: Dict[str, Union[int, List[int]]], key: str) -> List[Card]:
+        ids = index.get(key)
+        if ids is None:
+            return []
+        if type(ids) is int:
+            return [self.cards[ids]]
+        return [self.cards[card_id] for card_id in ids]
+    
+    def allocate_id(self) -> int:
+        with self.lock:
+            card_id = self.next_id
+            self.next_id += 1
+            return card_id
+    
+    def add_card(self, name: str, url: str, hotkey: str = "", browser: str = "") -> int:
+        template_cache.get(url)
+        with self.lock:
+            card_id = self.allocate_id()
+            card = Card(card_id, name, url, hotkey, browser)
+            self._index_card(card)
+            record = {'op': 'add', 'card': card.to_dict()}
+        self._commit(record)
+        self._emit('added', card_id, card)
         return card_id
     
-    def update_card(self, card_id: int, name: str = None, url: str = None, hotkey: str = None) -> bool:
-        for card in self.cards:
-            if card['id'] == card_id:
-                if name is not None:
-                    card['name'] = name
-                if url is not None:
-                    card['url'] = url
-                if hotkey is not None:
-                    card['hotkey'] = hotkey
+    def import_cards(self, records: Iterable[Mapping[str, Any]], skip_duplicates: bool = True,
+                     batch_size: int = 1000, max_errors: int = 20) -> Dict[str, Any]:
+        result = {'added': 0, 'duplicates': 0, 'invalid': 0, 'errors': []}
+        batch = []
+        for number, record in enumerate(records, 1):
+            try:
+                batch.append(self._validate_import(record))
+            except (ValueError, TypeError, AttributeError) as e:
+                result['invalid'] += 1
+                if len(result['errors']) < max_errors:
+                    result['errors'].append(f"record {number}: {e}")
+                continue
+            if len(batch) >= batch_size:
+                self._insert_imported(batch, skip_duplicates, result)
+                batch = []
+        if batch:
+            self._insert_imported(batch, skip_duplicates, result)
+        
+        if result['added']:
+            if self.journal:
+                self.compact()
+            else:
                 self.save_cards()
-                return True
-        return False
+                self.flush()
+            self._emit('reloaded')
+        return result
+    
+    def export_cards(self, path: str, fmt: Optional[str] = None) -> int:
+        return card_io.write_cards(self.get_all_cards(), path, fmt)
+    
+    def _insert_imported(self, batch: List[Dict[str, Any]], skip_duplicates: bool, result: Dict[str, Any]):
+        with self.lock:
+            for card in batch:
+                if skip_duplicates and card['url'] in self.url_index:
+                    result['duplicates'] += 1
+                    continue
+                card['id'] = self.allocate_id()
+                self._index_card(Card.from_dict(card))
+                result['added'] += 1
+    
+    @staticmethod
+    def _validate_import(record: Mapping[str, Any]) -> Dict[str, Any]:
+        if record.get('error'):
+            raise ValueError(record['error'])
+        url = normalize_url(record.get('url'))
+        if not url:
+            raise ValueError("missing url")
+        name = (record.get('name') or "").strip() or url
+        try:
+            compile_template(url)
+        except TemplateError as e:
+            raise ValueError(f"invalid URL template: {e}")
+        card = {'id': 0, 'name': name, 'url': url, 'hotkey': (record.get('hotkey') or "").strip()}
+        browser = (record.get('browser') or "").strip()
+        if browser:
+            card['browser'] = browser
+        return card
+    
+    def update_card(self, card_id: int, name: str = None, url: str = None, hotkey: str = None,
+                    browser: str = None) -> bool:
+        if url is not None:
+            template_cache.get(url)
+        with self.lock:
+            card = self.cards.get(card_id)
+            if card is None:
+                return False
+            
+            if url is not None and url != card['url']:
+                template_cache.invalidate(card['url'])
+            
+            fields = {}
+            if name is not None:
+                fields['name'] = name
+            if url is not None:
+                fields['url'] = url
+            if hotkey is not None:
+                fields['hotkey'] = hotkey
+            if browser is not None:
+                fields['browser'] = browser
+            self._unindex_card(card)
+            card = card.replace(**fields)
+            self._index_card(card)
+        self._commit({'op': 'update', 'id': card_id, 'fields': fields})
+        self._emit('updated', card_id, card)
+        return True
     
     def delete_card(self, card_id: int) -> bool:
-        for i, card in enumerate(self.cards):
-            if card['id'] == card_id:
-                del self.cards[i]
-                self.save_cards()
-                return True
-        return False
-    
-    def get_card(self, card_id: int) -> Dict[str, Any]:
-        for card in self.cards:
-            if card['id'] == card_id:
-                return card.copy()
-        return None
-    
-    def get_all_cards(self) -> List[Dict[str, Any]]:
-        return [card.copy() for card in self.cards]
-    
-    def get_card_by_hotkey(self, hotkey: str) -> Dict[str, Any]:
-        for card in self.cards:
-            if card.get('hotkey') == hotkey:
-                return card.copy()
-        return None
\ No newline at end of file
+        with self.lock:
+            card = self.cards.get(card_id)
+            if card is None:
+                return False
+            
+            self._unindex_card(card)
+            del self.cards[card_id]
+            self._all_cards_view = None
+            template_cache.invalidate(card['url'])
+            affected_groups = self._drop_from_groups(card_id)
+        if self.history:
+            self.history.forget(card_id)
+        self._commit({'op': 'delete', 'id': card_id})
+        self._emit('removed', card_id)
+        for group_id in affected_groups:
+            self._emit('group_updated', group_id, self.group_views.get(group_id))
+        return True
+    
+    def _store_group(self, group: Dict[str, Any]):
+        self.groups[group['id']] = group
+        self.group_views[group['id']] = MappingProxyType(group)
+    
+    def _drop_from_groups(self, card_id: int) -> List[int]:
+        affected = []
+        for group in self.groups.values():
+            if card_id in group['cards']:
+                group['cards'] = [member for member in group['cards'] if member != card_id]
+                affected.append(group['id'])
+        return affected
+    
+    def _validate_members(self, card_ids: Sequence[int]) -> List[int]:
+        members = list(dict.fromkeys(card_ids))
+        missing = [card_id for card_id in members if card_id not in self.cards]
+        if missing:
+            raise KeyError(f"Unknown card ids: {', '.join(str(card_id) for card_id in missing)}")
+        return members
+    
+    def add_group(self, name: str, card_ids: Sequence[int], hotkey: str = "") -> int:
+        with self.lock:
+            members = self._validate_members(card_ids)
+            group_id = self.allocate_id()
+            group = {
+                'id': group_id,
+                'name': name,
+                'cards': members,
+                'hotkey': hotkey
+            }
+            self._store_group(group)
+            record = {'op': 'group_add', 'group': dict(group, cards=list(members))}
+        self._commit(record)
+        self._emit('group_added', group_id, self.group_views.get(group_id))
+        return group_id
+    
+    def update_group(self, group_id: int, name: str = None, card_ids: Sequence[int] = None,
+                     hotkey: str = None) -> bool:
+        with self.lock:
+            group = self.groups.get(group_id)
+            if group is None:
+                return False
+            
+            fields = {}
+            if name is not None:
+                fields['name'] = name
+            if card_ids is not None:
+                fields['cards'] = self._validate_members(card_ids)
+            if hotkey is not None:
+                fields['hotkey'] = hotkey
+            group.update(fields)
+            record = {'op': 'group_update', 'id': group_id, 'fields': dict(fields)}
+            if 'cards' in fields:
+                record['fields']['cards'] = list(fields['cards'])
+        self._commit(record)
+        self._emit('group_updated', group_id, self.group_views.get(group_id))
+        return True
+    
+    def delete_group(self, group_id: int) -> bool:
+        with self.lock:
+            if self.groups.pop(group_id, None) is None:
+                return False
+            del self.group_views[group_id]
+        self._commit({'op': 'group_delete', 'id': group_id})
+        self._emit('group_removed', group_id)
+        return True
+    
+    def get_group(self, group_id: int) -> Optional[Mapping[str, Any]]:
+        return self.group_views.get(group_id)
+    
+    def get_all_groups(self) -> Sequence[Mapping[str, Any]]:
+        return tuple(self.group_views.values())
+    
+    def get_group_cards(self, group_id: int) -> List[Mapping[str, Any]]:
+        with self.lock:
+            group = self.groups.get(group_id)
+            if group is None:
+                return []
+            return [self.cards[card_id] for card_id in group['cards'] if card_id in self.cards]
+    
+    def get_setting(self, key: str, default: Any = None) -> Any:
+        with self.lock:
+            return self.extra_settings.get(key, default)
+    
+    def set_setting(self, key: str, value: Any):
+        with self.lock:
+            self.extra_settings[key] = value
+        self.save_cards()
+    
+    def get_card(self, card_id: int) -> Optional[Card]:
+        return self.cards.get(card_id)
+    
+    def get_all_cards(self) -> Sequence[Card]:
+        if self._all_cards_view is None:
+            self._all_cards_view = tuple(self.cards.values())
+        return self._all_cards_view
+    
+    def get_card_by_hotkey(self, hotkey: str) -> Optional[Card]:
+        cards = self._lookup(self.hotkey_index, normalize_hotkey(hotkey))
+        return cards[0] if cards else None
+    
+    def get_cards_by_name(self, name: str) -> List[Card]:
+        return self._lookup(self.name_index, normalize_name(name))
+    
+    def get_cards_by_url(self, url: str) -> List[Card]:
+        return self._lookup(self.url_index, normalize_url(url))
+    
+    def get_card_by_name(self, name: str) -> Optional[Card]:
+        cards = self._lookup(self.name_index, normalize_name(name))
+        return cards[0] if cards else None
+    
+    def card_count(self) -> int:
+        return len(self.cards)
+    
+    def record_launch(self, card_id: int, content: Optional[str] = None, latency: float = 0.0):
+        if not self.history:
+            return
+        self.history.record(card_id, content, latency)
+        self._emit('launched', card_id, self.cards.get(card_id))
+    
+    def top_cards(self, k: int) -> List[Mapping[str, Any]]:
+        if not self.history or k <= 0:
+            return []
+        cards = self.cards
+        top = []
+        for card_id in self.history.top(k):
+            card = cards.get(card_id)
+            if card is not None:
+                top.append(card)
+                if len(top) == k:
+                    break
+        return top
+    
+    def get_ranked_cards(self) -> Sequence[Mapping[str, Any]]:
+        if not self.history:
+            return self.get_all_cards()
+        cards = self.cards
+        ranked = [cards[card_id] for card_id in self.history.ranking() if card_id in cards]
+        if len(ranked) == len(cards):
+            return ranked
+        seen = {card['id'] for card in ranked}
+        ranked.extend(card for card in self.get_all_cards() if card['id'] not in seen)
+        return ranked
\ No newline at end of file
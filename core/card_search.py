@@ -0,0 +1,217 @@
+import heapq
+import re
+import threading
+from bisect import bisect_right
+from collections import defaultdict
+from itertools import accumulate, chain, islice, repeat
+from operator import contains
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+
+URL_NOISE = re.compile(r'^[a-z][a-z0-9+.-]*://(www\.)?')
+TEMPLATE_FIELD = re.compile(r'\{[^{}]*\}')
+WORD_SPLIT = re.compile(r'[^\w]+')
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(WORD_SPLIT.split((text or "").casefold())).strip()
+
+
+def normalize_url(url: str) -> str:
+    return normalize_text(TEMPLATE_FIELD.sub(' ', URL_NOISE.sub('', (url or "").casefold())))
+
+
+def trigrams(text: str) -> Set[str]:
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+MAX_SCORED = 200
+MAX_EXAMINED = 2000
+EMPTY = frozenset()
+
+
+class CardSearchIndex:
+    def __init__(self, rank: Callable[[int], float] = None, top: Callable[[int], List[int]] = None):
+        self.rank = rank
+        self.top = top
+        self.card_manager = None
+        self.lock = threading.Lock()
+        self.sources: Dict[int, Mapping[str, Any]] = {}
+        self.names: Dict[int, str] = {}
+        self.urls: Dict[int, str] = {}
+        self.postings: Dict[str, Set[int]] = defaultdict(set)
+        self.initials: Dict[str, Set[int]] = defaultdict(set)
+        self.haystacks: Dict[str, Tuple[str, List[int], List[int]]] = {}
+        self.searches = 0
+    
+    def attach(self, card_manager):
+        self.rebuild(card_manager.get_all_cards())
+        self.card_manager = card_manager
+        card_manager.add_listener(self.on_card_event)
+    
+    def on_card_event(self, event: str, card_id: int, card: Optional[Mapping[str, Any]]):
+        if event in ('added', 'updated') and card is not None:
+            self.add(card)
+        elif event == 'removed':
+            self.remove(card_id)
+        elif event == 'reloaded' and self.card_manager is not None:
+            self.rebuild(self.card_manager.get_all_cards())
+    
+    def rebuild(self, cards: Iterable[Mapping[str, Any]]):
+        with self.lock:
+            incoming = {card['id']: card for card in cards}
+            for card_id in [card_id for card_id, card in self.sources.items() if incoming.get(card_id) is not card]:
+                self._remove_locked(card_id)
+            for card_id, card in incoming.items():
+                if card_id not in self.sources:
+                    self._add_locked(card)
+    
+    def add(self, card: Mapping[str, Any]):
+        with self.lock:
+            self._remove_locked(card['id'])
+            self._add_locked(card)
+    
+    def remove(self, card_id: int):
+        with self.lock:
+            self._remove_locked(card_id)
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def _add_locked(self, card: Mapping[str, Any]):
+        card_id = card['id']
+        name = normalize_text(card.get('name', ''))
+        url = normalize_url(card.get('url', ''))
+        self.sources[card_id] = card
+        self.haystacks.clear()
+        self.names[card_id] = name
+        self.urls[card_id] = url
+        postings = self.postings
+        for gram in trigrams(name) | trigrams(url):
+            postings[gram].add(card_id)
+        initials = self.initials
+        for initial in self._initials(name, url):
+            initials[initial].add(card_id)
+    
+    def _remove_locked(self, card_id: int):
+        if self.sources.pop(card_id, None) is None:
+            return
+        self.haystacks.clear()
+        name = self.names.pop(card_id)
+        url = self.urls.pop(card_id)
+        for gram in trigrams(name) | trigrams(url):
+            self._discard(self.postings, gram, card_id)
+        for initial in self._initials(name, url):
+            self._discard(self.initials, initial, card_id)
+    
+    @staticmethod
+    def _discard(index: Dict[str, Set[int]], key: str, card_id: int):
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(card_id)
+            if not ids:
+                del index[key]
+    
+    @staticmethod
+    def _initials(name: str, url: str) -> Set[str]:
+        return {word[0] for word in (name + " " + url).split()}
+    
+    def search(self, query: str, limit: int = 10) -> List[int]:
+        query = normalize_text(query)
+        if not query:
+            return []
+        
+        with self.lock:
+            self.searches += 1
+            if len(query) < 3:
+                grams = None
+                required = 0
+                candidates = self._prefix_candidates(query)
+                if len(candidates) > MAX_SCORED:
+                    candidates = self._preferred(query, candidates, candidates)
+            else:
+                grams = sorted((self.postings.get(gram, EMPTY) for gram in trigrams(query)), key=len)
+                required, sources = self._gram_sources(grams)
+                if sum(map(len, sources)) > MAX_SCORED:
+                    candidates = self._preferred(query, None, chain.from_iterable(sources))
+                else:
+                    candidates = set().union(*sources)
+            
+            scored = []
+            seen = set()
+            for card_id in islice(candidates, MAX_EXAMINED):
+                if card_id in seen:
+                    continue
+                seen.add(card_id)
+                score = self._score(query, self.names[card_id], self.urls[card_id])
+                if grams is not None:
+                    count = sum(map(contains, grams, repeat(card_id, len(grams))))
+                    if count < required:
+                        continue
+                    score += 10.0 * count / len(grams)
+                if self.rank is not None:
+                    score += min(1.0, self.rank(card_id))
+                scored.append((score, -card_id))
+                if len(scored) >= MAX_SCORED:
+                    break
+        
+        best = heapq.nlargest(limit, scored)
+        return [-negated_id for _, negated_id in best]
+    
+    @staticmethod
+    def _gram_sources(grams: List[Set[int]]) -> Tuple[int, List[Set[int]]]:
+        total = len(grams)
+        for required in (max(1, int(total * 0.6 + 0.5)), max(2, total // 3)):
+            sources = grams[:total - required + 1]
+            if sum(map(len, sources)) > MAX_SCORED:
+                return required, sources
+            for card_id in set().union(*sources):
+                if sum(map(contains, grams, repeat(card_id, total))) >= required:
+                    return required, sources
+        return 0, []
+    
+    def _preferred(self, query: str, members: Optional[Set[int]], rest: Iterable[int]) -> Iterator[int]:
+        favourites = [card_id for card_id in self.top(MAX_SCORED) if card_id in self.names] if self.top else []
+        preferred = chain(favourites, self._matches('names', query), self._matches('urls', query))
+        if members is not None:
+            preferred = (card_id for card_id in preferred if card_id in members)
+        yield from preferred
+        yield from rest
+    
+    def _matches(self, field: str, query: str) -> Iterator[int]:
+        haystack = self.haystacks.get(field)
+        if haystack is None:
+            texts = getattr(self, field)
+            ids = sorted(texts)
+            offsets = list(accumulate((len(texts[card_id]) + 1 for card_id in ids), initial=0))
+            haystack = self.haystacks[field] = ("\n".join(texts[card_id] for card_id in ids), ids, offsets)
+        text, ids, offsets = haystack
+        position = text.find(query)
+        while position != -1:
+            index = bisect_right(offsets, position) - 1
+            yield ids[index]
+            position = text.find(query, offsets[index + 1])
+    
+    def _prefix_candidates(self, query: str) -> Set[int]:
+        words = query.split()
+        candidates = None
+        for word in words:
+            ids = self.postings.get(" " + word, EMPTY) if len(word) > 1 else self.initials.get(word, EMPTY)
+            candidates = set(ids) if candidates is None else candidates & ids
+            if not candidates:
+                return set()
+        return candidates
+    
+    @staticmethod
+    def _score(query: str, name: str, url: str) -> float:
+        score = 0.0
+        if name.startswith(query):
+            score += 6.0
+        elif (" " + query) in (" " + name):
+            score += 4.0
+        elif query in name:
+            score += 3.0
+        if query in url:
+            score += 1.0
+        return score
\ No newline at end of file
@@ -1,16 +1,77 @@
 import pyperclip
-import threading
-import time
 import platform
 import subprocess
+import threading
+import time
+from typing import Dict, Any, Hashable, Optional, Tuple
+
+from core.clipboard_watcher import PollingClipboardWatcher, create_clipboard_watcher
+from core.selection_helper import SelectionHelper
+from core.tracing import tracer
+
+
+class SelectionCache:
+    def __init__(self, freshness_window: float = 0.5):
+        self.freshness_window = freshness_window
+        self.lock = threading.Lock()
+        self.entries: Dict[str, Tuple[str, float, Hashable]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+    
+    def get(self, kind: str, token: Hashable) -> Optional[str]:
+        if token is None:
+            return None
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(kind)
+            if entry is not None:
+                content, captured_at, captured_token = entry
+                if captured_token == token and now - captured_at <= self.freshness_window:
+                    self.hits += 1
+                    return content
+                del self.entries[kind]
+                self.stale += 1
+            self.misses += 1
+            return None
+    
+    def put(self, kind: str, content: str, token: Hashable):
+        if self.freshness_window <= 0 or token is None:
+            return
+        with self.lock:
+            self.entries[kind] = (content, time.monotonic(), token)
+    
+    def invalidate(self, kind: str = None):
+        with self.lock:
+            if kind is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(kind, None)
+    
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'freshness_window': self.freshness_window,
+                'hits': self.hits,
+                'misses': self.misses,
+                'stale': self.stale,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
 
 
 class ClipboardReader:
-    def __init__(self):
+    def __init__(self, watcher_backend: str = None, freshness_window: float = 0.5):
         self.last_clipboard_content = ""
         self.selected_content = ""
+        self.lock = threading.Lock()
         self.monitoring = False
         self.monitor_thread = None
+        self.watcher = None
+        self.watcher_backend = watcher_backend
+        self.selection_helper = SelectionHelper() if SelectionHelper.is_supported() else None
+        self.selection_cache = SelectionCache(freshness_window)
+        self.change_count = 0
     
     def get_clipboard_content(self) -> str:
         try:
@@ -19,23 +80,61 @@ class ClipboardReader:
         except Exception:
             return ""
     
+    def capture_token(self) -> Optional[Hashable]:
+        watcher = self.watcher
+        generation = watcher.generation() if watcher and watcher.running else None
+        if generation is None:
+            return None
+        return (generation, self.change_count)
+    
+    def get_cached_clipboard_content(self) -> str:
+        token = self.capture_token()
+        content = self.selection_cache.get('clipboard', token)
+        if content is None:
+            content = self.get_clipboard_content()
+            self.selection_cache.put('clipboard', content, token)
+        return content
+    
     def get_selected_content(self) -> str:
-        selected_text = self.try_get_selected_text()
+        token = self.capture_token()
+        cached = self.selection_cache.get('selection', token)
+        if cached is not None:
+            return cached
+        
+        with tracer.span('selection.read'):
+            selected_text = self.try_get_selected_text()
+        return self.resolve_selection(selected_text, token)
+    
+    def resolve_selection(self, selected_text: str, token: Hashable) -> str:
         if selected_text:
-            self.selected_content = selected_text
+            with self.lock:
+                self.selected_content = selected_text
+            self.selection_cache.put('selection', selected_text, token)
             return selected_text
         
-        current_clipboard = self.get_clipboard_content()
-        if current_clipboard != self.last_clipboard_content:
-            self.selected_content = current_clipboard
-            self.last_clipboard_content = current_clipboard
-        return self.selected_content
+        current_clipboard = self.selection_cache.get('clipboard', token)
+        if current_clipboard is None:
+            with tracer.span('selection.clipboard_fallback'):
+                current_clipboard = self.get_clipboard_content()
+            self.selection_cache.put('clipboard', current_clipboard, token)
+        with self.lock:
+            if current_clipboard != self.last_clipboard_content:
+                self.selected_content = current_clipboard
+                self.last_clipboard_content = current_clipboard
+            selected_content = self.selected_content
+        self.selection_cache.put('selection', selected_content, token)
+        return selected_content
     
     def try_get_selected_text(self) -> str:
         try:
             system = platform.system().lower()
             
             if system == "linux":
+                if self.selection_helper:
+                    selected_text = self.selection_helper.read("PRIMARY")
+                    if selected_text is not None:
+                        return selected_text.strip()
+                
                 try:
                     result = subprocess.run(['xsel', '-o'], capture_output=True, text=True, timeout=1)
                     if result.returncode == 0 and result.stdout.strip():
@@ -83,24 +182,50 @@ class ClipboardReader:
         if not self.monitoring:
             self.monitoring = True
             self.last_clipboard_content = self.get_clipboard_content()
-            self.monitor_thread = threading.Thread(target=self._monitor_clipboard, daemon=True)
-            self.monitor_thread.start()
+            self.watcher = create_clipboard_watcher(self._check_clipboard, self.watcher_backend)
+            try:
+                self.watcher.start()
+            except Exception:
+                self.watcher = PollingClipboardWatcher(self._check_clipboard)
+                try:
+                    self.watcher.start()
+                except Exception:
+                    self.monitoring = False
+                    raise
+            self.monitor_thread = self.watcher.thread
     
     def stop_monitoring(self):
         self.monitoring = False
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=1.0)
+        if self.watcher:
+            self.watcher.stop(timeout=1.0)
     
-    def _monitor_clipboard(self):
-        while self.monitoring:
-            try:
-                current_content = self.get_clipboard_content()
-                if current_content != self.last_clipboard_content:
-                    self.selected_content = current_content
-                    self.last_clipboard_content = current_content
-                time.sleep(0.1)
-            except Exception:
-                pass
+    def monitoring_stats(self) -> Dict[str, Any]:
+        if not self.watcher:
+            return {}
+        return self.watcher.stats()
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        return self.selection_cache.stats()
+    
+    def _check_clipboard(self) -> bool:
+        current_content = self.get_clipboard_content()
+        with self.lock:
+            if current_content == self.last_clipboard_content:
+                return False
+            self.selected_content = current_content
+            self.last_clipboard_content = current_content
+            self.change_count += 1
+        self.selection_cache.invalidate('selection')
+        self.selection_cache.put('clipboard', current_content, self.capture_token())
+        return True
+    
+    def close(self):
+        self.stop_monitoring()
+        if self.selection_helper:
+            self.selection_helper.close()
     
     def clear_selected_content(self):
-        self.selected_content = ""
\ No newline at end of file
+        with self.lock:
+            self.selected_content = ""
+            self.change_count += 1
+        self.selection_cache.invalidate()
\ No newline at end of file
@@ -0,0 +1,260 @@
+import ctypes
+import ctypes.util
+import platform
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Any, Optional
+
+from core import x11
+
+
+LEGACY_POLL_INTERVAL = 0.1
+
+
+def clipboard_read_spawns() -> int:
+    return 0 if platform.system().lower() == "windows" else 1
+
+
+class ClipboardWatcher(ABC):
+    name = "base"
+    
+    def __init__(self, check: Callable[[], bool]):
+        self.check = check
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.started_at = None
+        self.stopped_at = None
+        self.wakeups = 0
+        self.reads = 0
+        self.changes = 0
+    
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.started_at = time.monotonic()
+        self.stopped_at = None
+        self.thread = threading.Thread(target=self._run_safely, daemon=True)
+        self.thread.start()
+    
+    def stop(self, timeout: float = 1.0):
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(timeout=timeout)
+        if self.started_at is not None and self.stopped_at is None:
+            self.stopped_at = time.monotonic()
+    
+    @property
+    def running(self) -> bool:
+        return bool(self.thread and self.thread.is_alive())
+    
+    def _run_safely(self):
+        try:
+            self._run()
+        except Exception:
+            pass
+    
+    @abstractmethod
+    def _run(self):
+        pass
+    
+    def _read(self) -> bool:
+        self.reads += 1
+        try:
+            changed = bool(self.check())
+        except Exception:
+            changed = False
+        if changed:
+            self.changes += 1
+        return changed
+    
+    def generation(self) -> Optional[int]:
+        return None
+    
+    def stats(self) -> Dict[str, Any]:
+        if self.started_at is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self.stopped_at or time.monotonic()) - self.started_at
+        legacy_wakeups = int(elapsed / LEGACY_POLL_INTERVAL)
+        spawns_per_read = clipboard_read_spawns()
+        return {
+            'backend': self.name,
+            'elapsed': elapsed,
+            'wakeups': self.wakeups,
+            'reads': self.reads,
+            'changes': self.changes,
+            'wakeups_avoided': max(0, legacy_wakeups - self.wakeups),
+            'spawns_avoided': max(0, (legacy_wakeups - self.reads) * spawns_per_read),
+        }
+
+
+class XFixesClipboardWatcher(ClipboardWatcher):
+    name = "xfixes"
+    
+    def __init__(self, check: Callable[[], bool], selections=("CLIPBOARD",), timeout: float = 1.0,
+                 tracked=("PRIMARY",)):
+        super().__init__(check)
+        self.selections = selections
+        self.tracked = tracked
+        self.timeout = timeout
+        self.selection_changes = 0
+        self.display = None
+        self.checked_atoms = set()
+    
+    @staticmethod
+    def is_supported() -> bool:
+        try:
+            display = x11.XDisplay()
+        except Exception:
+            return False
+        try:
+            display.watch_selection(display.intern_atom("CLIPBOARD"))
+            return True
+        except Exception:
+            return False
+        finally:
+            display.close()
+    
+    def start(self):
+        if self.running:
+            return
+        display = x11.XDisplay()
+        try:
+            self.checked_atoms = {display.intern_atom(selection) for selection in self.selections}
+            for atom in self.checked_atoms:
+                display.watch_selection(atom)
+            for selection in self.tracked:
+                atom = x11.XA_PRIMARY if selection == "PRIMARY" else display.intern_atom(selection)
+                if atom not in self.checked_atoms:
+                    display.watch_selection(atom)
+        except Exception:
+            display.close()
+            raise
+        self.display = display
+        super().start()
+    
+    def generation(self) -> Optional[int]:
+        return self.selection_changes
+    
+    def _run(self):
+        try:
+            while not self.stop_event.is_set():
+                if not self.display.wait_for_events(self.timeout):
+                    continue
+                self.wakeups += 1
+                changed = False
+                event = self.display.next_event()
+                while event is not None:
+                    atom = self.display.selection_changed(event)
+                    if atom is not None:
+                        self.selection_changes += 1
+                        if atom in self.checked_atoms:
+                            changed = True
+                    event = self.display.next_event()
+                if changed:
+                    self._read()
+        finally:
+            self.display.close()
+            self.display = None
+
+
+class SequenceClipboardWatcher(ClipboardWatcher):
+    name = "sequence"
+    
+    def __init__(self, check: Callable[[], bool], sequence: Callable[[], int], interval: float = 0.25):
+        super().__init__(check)
+        self.sequence = sequence
+        self.interval = interval
+    
+    def _run(self):
+        last_sequence = self.sequence()
+        while not self.stop_event.wait(self.interval):
+            self.wakeups += 1
+            current_sequence = self.sequence()
+            if current_sequence != last_sequence:
+                last_sequence = current_sequence
+                self._read()
+    
+    def generation(self) -> Optional[int]:
+        try:
+            return self.sequence()
+        except Exception:
+            return None
+
+
+class PollingClipboardWatcher(ClipboardWatcher):
+    name = "polling"
+    
+    def __init__(self, check: Callable[[], bool], min_interval: float = 0.1,
+                 max_interval: float = 2.0, backoff: float = 1.5):
+        super().__init__(check)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = min_interval
+    
+    def _run(self):
+        while not self.stop_event.wait(self.interval):
+            self.wakeups += 1
+            if self._read():
+                self.interval = self.min_interval
+            else:
+                self.interval = min(self.max_interval, self.interval * self.backoff)
+
+
+def windows_sequence() -> Optional[Callable[[], int]]:
+    try:
+        user32 = ctypes.windll.user32
+    except AttributeError:
+        return None
+    user32.GetClipboardSequenceNumber.restype = ctypes.c_uint32
+    return user32.GetClipboardSequenceNumber
+
+
+def macos_sequence() -> Optional[Callable[[], int]]:
+    objc_path = ctypes.util.find_library('objc')
+    appkit_path = ctypes.util.find_library('AppKit')
+    if not objc_path or not appkit_path:
+        return None
+    try:
+        objc = ctypes.cdll.LoadLibrary(objc_path)
+        ctypes.cdll.LoadLibrary(appkit_path)
+    except OSError:
+        return None
+    
+    objc.objc_getClass.restype = ctypes.c_void_p
+    objc.objc_getClass.argtypes = [ctypes.c_char_p]
+    objc.sel_registerName.restype = ctypes.c_void_p
+    objc.sel_registerName.argtypes = [ctypes.c_char_p]
+    send_object = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p)(('objc_msgSend', objc))
+    send_long = ctypes.CFUNCTYPE(ctypes.c_long, ctypes.c_void_p, ctypes.c_void_p)(('objc_msgSend', objc))
+    
+    pasteboard = send_object(objc.objc_getClass(b'NSPasteboard'), objc.sel_registerName(b'generalPasteboard'))
+    if not pasteboard:
+        return None
+    change_count = objc.sel_registerName(b'changeCount')
+    return lambda: send_long(pasteboard, change_count)
+
+
+def create_clipboard_watcher(check: Callable[[], bool], backend: str = None) -> ClipboardWatcher:
+    system = platform.system().lower()
+    
+    if backend in (None, "xfixes") and system == "linux" and x11.is_available():
+        if XFixesClipboardWatcher.is_supported():
+            return XFixesClipboardWatcher(check)
+    
+    if backend in (None, "sequence"):
+        sequence = None
+        try:
+            if system == "windows":
+                sequence = windows_sequence()
+            elif system == "darwin":
+                sequence = macos_sequence()
+        except Exception:
+            sequence = None
+        if sequence:
+            return SequenceClipboardWatcher(check, sequence)
+    
+    return PollingClipboardWatcher(check)
\ No newline at end of file
@@ -0,0 +1,162 @@
+import ctypes
+import ctypes.util
+import os
+import platform
+import select
+import struct
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from core.persistence import file_signature
+
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct('iIII')
+
+
+class ConfigWatcher:
+    name = "base"
+    
+    def __init__(self, path: str, on_change: Callable[[], Any], settle: float = 0.2):
+        self.path = path
+        self.on_change = on_change
+        self.settle = settle
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.signature = file_signature(path)
+        self.wakeups = 0
+        self.changes = 0
+    
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.signature = file_signature(self.path)
+        self.thread = threading.Thread(target=self._run_safely, daemon=True)
+        self.thread.start()
+    
+    def stop(self, timeout: float = 1.0):
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(timeout=timeout)
+    
+    @property
+    def running(self) -> bool:
+        return bool(self.thread and self.thread.is_alive())
+    
+    def _run_safely(self):
+        try:
+            self._run()
+        except Exception:
+            pass
+    
+    def _run(self):
+        raise NotImplementedError
+    
+    def _check(self) -> bool:
+        signature = file_signature(self.path)
+        if signature is None or signature == self.signature:
+            return False
+        while not self.stop_event.wait(self.settle):
+            settled = file_signature(self.path)
+            if settled == signature:
+                break
+            signature = settled
+        if signature is None:
+            return False
+        self.signature = signature
+        self.changes += 1
+        try:
+            self.on_change()
+        except Exception:
+            pass
+        return True
+    
+    def stats(self) -> Dict[str, Any]:
+        return {'backend': self.name, 'wakeups': self.wakeups, 'changes': self.changes}
+
+
+class InotifyConfigWatcher(ConfigWatcher):
+    name = "inotify"
+    
+    def __init__(self, path: str, on_change: Callable[[], Any], settle: float = 0.2, timeout: float = 1.0):
+        super().__init__(path, on_change, settle)
+        self.timeout = timeout
+        self.filename = os.fsencode(os.path.basename(path))
+        libc = load_libc()
+        if libc is None:
+            raise OSError("inotify is not available")
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        directory = os.path.dirname(os.path.abspath(path))
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK) < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+    
+    def _run(self):
+        try:
+            while not self.stop_event.is_set():
+                readable, _, _ = select.select([self.fd], [], [], self.timeout)
+                if not readable:
+                    continue
+                self.wakeups += 1
+                if self._drain():
+                    self._check()
+        finally:
+            os.close(self.fd)
+    
+    def _drain(self) -> bool:
+        relevant = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return relevant
+            offset = 0
+            while offset + EVENT_HEADER.size <= len(data):
+                _, _, _, length = EVENT_HEADER.unpack_from(data, offset)
+                start = offset + EVENT_HEADER.size
+                if data[start:start + length].rstrip(b"\0") == self.filename:
+                    relevant = True
+                offset = start + length
+
+
+class PollingConfigWatcher(ConfigWatcher):
+    name = "polling"
+    
+    def __init__(self, path: str, on_change: Callable[[], Any], settle: float = 0.2, interval: float = 1.0):
+        super().__init__(path, on_change, settle)
+        self.interval = interval
+    
+    def _run(self):
+        while not self.stop_event.wait(self.interval):
+            self.wakeups += 1
+            self._check()
+
+
+def load_libc():
+    path = ctypes.util.find_library('c')
+    try:
+        libc = ctypes.CDLL(path, use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+def create_config_watcher(path: str, on_change: Callable[[], Any], backend: Optional[str] = None) -> ConfigWatcher:
+    if backend in (None, "inotify") and platform.system().lower() == "linux":
+        try:
+            return InotifyConfigWatcher(path, on_change)
+        except OSError:
+            pass
+    return PollingConfigWatcher(path, on_change)
\ No newline at end of file
@@ -0,0 +1,133 @@
+from typing import Any, Callable, Dict, Optional
+
+from core import card_io
+from core.tracing import tracer
+from core.url_template import TemplateError
+
+
+class ControlHandler:
+    def __init__(self, card_manager, browser_launcher, launch_executor=None, clipboard_reader=None,
+                 on_cards_changed: Callable[[], Any] = None, on_show: Callable[[], Any] = None):
+        self.card_manager = card_manager
+        self.browser_launcher = browser_launcher
+        self.launch_executor = launch_executor
+        self.clipboard_reader = clipboard_reader
+        self.on_cards_changed = on_cards_changed
+        self.on_show = on_show
+        self.operations = {
+            'ping': self.ping,
+            'launch': self.launch,
+            'add': self.add,
+            'import': self.import_cards,
+            'export': self.export_cards,
+            'list': self.list_cards,
+            'stats': self.stats,
+            'show': self.show,
+            'trace': self.trace,
+        }
+    
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        operation = self.operations.get(request.get('op'))
+        if operation is None:
+            return {'ok': False, 'error': f"unknown operation '{request.get('op')}'"}
+        try:
+            return operation(request)
+        except (KeyError, ValueError, TypeError) as e:
+            return {'ok': False, 'error': str(e)}
+    
+    def ping(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        return {'ok': True}
+    
+    def resolve_card(self, target: Any) -> Optional[Any]:
+        if isinstance(target, int) or (isinstance(target, str) and target.isdigit()):
+            card = self.card_manager.get_card(int(target))
+            if card is not None:
+                return card
+        if isinstance(target, str):
+            return self.card_manager.get_card_by_name(target)
+        return None
+    
+    def launch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        card = self.resolve_card(request.get('card'))
+        if card is None:
+            return {'ok': False, 'error': f"no card matches '{request.get('card')}'"}
+        content = request.get('content')
+        if self.launch_executor:
+            queued = self.launch_executor.submit(card['id'], self.browser_launcher.launch_card, card, content)
+            return {'ok': True, 'id': card['id'], 'queued': queued}
+        return {'ok': self.browser_launcher.launch_card(card, content), 'id': card['id']}
+    
+    def add(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            card_id = self.card_manager.add_card(
+                request['name'],
+                request['url'],
+                request.get('hotkey', ''),
+                request.get('browser', '')
+            )
+        except TemplateError as e:
+            return {'ok': False, 'error': f"invalid URL template: {e}"}
+        self._cards_changed()
+        return {'ok': True, 'id': card_id}
+    
+    def import_cards(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if request.get('path'):
+            records = card_io.read_cards(request['path'], request.get('format'))
+        else:
+            records = request.get('cards', [])
+        try:
+            result = self.card_manager.import_cards(records, not request.get('allow_duplicates'))
+        except OSError as e:
+            return {'ok': False, 'error': str(e)}
+        if result['added']:
+            self._cards_changed()
+        return dict(result, ok=not result['invalid'])
+    
+    def export_cards(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            count = self.card_manager.export_cards(request['path'], request.get('format'))
+        except OSError as e:
+            return {'ok': False, 'error': str(e)}
+        return {'ok': True, 'exported': count, 'path': request['path']}
+    
+    def list_cards(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        limit = request.get('limit')
+        cards = self.card_manager.get_ranked_cards()
+        if limit:
+            cards = cards[:int(limit)]
+        return {'ok': True, 'cards': [dict(card) for card in cards]}
+    
+    def stats(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        stats = {'cards': self.card_manager.card_count(), 'groups': len(self.card_manager.get_all_groups())}
+        if self.launch_executor:
+            stats['launch'] = self.launch_executor.stats()
+        stats['browser'] = self.browser_launcher.open_stats()
+        if self.browser_launcher.gate is not None:
+            stats['launch_gate'] = self.browser_launcher.gate.stats()
+        if self.clipboard_reader:
+            stats['selection_cache'] = self.clipboard_reader.cache_stats()
+            stats['clipboard_monitor'] = self.clipboard_reader.monitoring_stats()
+        if tracer.enabled:
+            stats['tracing'] = tracer.summary()
+        return {'ok': True, 'stats': stats}
+    
+    def trace(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if not tracer.enabled:
+            return {'ok': False, 'error': "tracing is disabled; start with --trace or set tracing.enabled"}
+        response = {'ok': True, 'summary': tracer.summary()}
+        if request.get('path'):
+            try:
+                response['spans'] = tracer.export(request['path'])
+            except OSError as e:
+                return {'ok': False, 'error': str(e)}
+            response['path'] = request['path']
+        return response
+    
+    def show(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if self.on_show:
+            self.on_show()
+        return {'ok': True}
+    
+    def _cards_changed(self):
+        if self.on_cards_changed:
+            self.on_cards_changed()
\ No newline at end of file
@@ -0,0 +1,79 @@
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple
+
+from core.card_manager import normalize_hotkey
+
+
+class HotkeyRegistry:
+    def __init__(self, callback: Callable[[int], None], backend=None):
+        self.callback = callback
+        self.backend = backend
+        self.lock = threading.Lock()
+        self.registered: Dict[int, Tuple[str, Any]] = {}
+        self.conflicts: Dict[str, List[int]] = {}
+        self.errors: Dict[int, str] = {}
+    
+    def _get_backend(self):
+        if self.backend is None:
+            import keyboard
+            self.backend = keyboard
+        return self.backend
+    
+    def sync(self, cards: Iterable[Mapping[str, Any]]) -> Dict[str, Any]:
+        owners: Dict[str, List[int]] = {}
+        for card in cards:
+            combo = normalize_hotkey(card.get('hotkey', ''))
+            if combo:
+                owners.setdefault(combo, []).append(card['id'])
+        
+        desired = {ids[0]: combo for combo, ids in owners.items()}
+        added = []
+        removed = []
+        
+        with self.lock:
+            self.conflicts = {combo: ids for combo, ids in owners.items() if len(ids) > 1}
+            self.errors = {}
+            
+            for card_id, (combo, handle) in list(self.registered.items()):
+                if desired.get(card_id) != combo:
+                    self._remove(card_id, combo, handle)
+                    del self.registered[card_id]
+                    removed.append(card_id)
+            
+            for card_id, combo in desired.items():
+                if card_id in self.registered:
+                    continue
+                try:
+                    handle = self._get_backend().add_hotkey(combo, self.callback, args=(card_id,))
+                except Exception as e:
+                    self.errors[card_id] = f"{combo}: {e}"
+                    continue
+                self.registered[card_id] = (combo, handle)
+                added.append(card_id)
+            
+            return {
+                'added': added,
+                'removed': removed,
+                'conflicts': dict(self.conflicts),
+                'errors': dict(self.errors),
+            }
+    
+    def clear(self):
+        with self.lock:
+            for card_id, (combo, handle) in self.registered.items():
+                self._remove(card_id, combo, handle)
+            self.registered = {}
+    
+    def _remove(self, card_id: int, combo: str, handle):
+        try:
+            self._get_backend().remove_hotkey(handle)
+        except Exception as e:
+            self.errors[card_id] = f"{combo}: {e}"
+    
+    def describe_problems(self) -> List[str]:
+        problems = []
+        for combo, ids in self.conflicts.items():
+            problems.append(f"Hotkey '{combo}' is assigned to cards {', '.join(str(i) for i in ids)}; only card {ids[0]} will respond")
+        for card_id, error in self.errors.items():
+            problems.append(f"Could not register hotkey for card {card_id} ({error})")
+        return problems
\ No newline at end of file
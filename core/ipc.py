@@ -0,0 +1,188 @@
+import hashlib
+import json
+import os
+import socket
+import stat
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+
+def runtime_dir() -> str:
+    directory = os.environ.get('XDG_RUNTIME_DIR')
+    if directory and os.path.isdir(directory):
+        return directory
+    uid = os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', 'user')
+    directory = os.path.join(tempfile.gettempdir(), f"quick-access-{uid}")
+    try:
+        os.mkdir(directory, 0o700)
+        if hasattr(os, 'getuid'):
+            os.chmod(directory, 0o700)
+    except FileExistsError:
+        pass
+    if hasattr(os, 'getuid'):
+        info = os.lstat(directory)
+        if not stat.S_ISDIR(info.st_mode) or info.st_uid != uid or stat.S_IMODE(info.st_mode) != 0o700:
+            raise PermissionError(f"{directory} is not a private directory owned by this user")
+    return directory
+
+
+def socket_path(config_path: str) -> str:
+    digest = hashlib.sha1(os.path.abspath(config_path).encode('utf-8')).hexdigest()[:12]
+    return os.path.join(runtime_dir(), f"quick-access-{digest}.sock")
+
+
+def is_supported() -> bool:
+    return hasattr(socket, 'AF_UNIX')
+
+
+class InstanceLock:
+    def __init__(self, path: str):
+        self.path = path
+        self.file = None
+    
+    def acquire(self) -> bool:
+        if self.file is not None:
+            return True
+        handle = open(self.path, 'a+')
+        try:
+            if os.name == "nt":
+                import msvcrt
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return False
+        handle.seek(0)
+        handle.truncate()
+        handle.write(str(os.getpid()))
+        handle.flush()
+        self.file = handle
+        return True
+    
+    def release(self):
+        if self.file is None:
+            return
+        try:
+            self.file.close()
+        finally:
+            self.file = None
+
+
+class ControlServer:
+    def __init__(self, path: str, handler: Callable[[Dict[str, Any]], Dict[str, Any]]):
+        self.path = path
+        self.handler = handler
+        self.sock = None
+        self.thread = None
+        self.running = False
+        self.requests = 0
+    
+    def start(self):
+        if self.running:
+            return
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        previous_umask = os.umask(0o177)
+        try:
+            sock.bind(self.path)
+        finally:
+            os.umask(previous_umask)
+        sock.listen(8)
+        self.sock = sock
+        self.running = True
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        self.running = False
+        sock = self.sock
+        self.sock = None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+        if self.thread:
+            self.thread.join(timeout=1.0)
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+    
+    def _serve(self):
+        while self.running:
+            try:
+                connection, _ = self.sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(connection,), daemon=True).start()
+    
+    def dispatch(self, line: bytes) -> Dict[str, Any]:
+        try:
+            request = json.loads(line.decode('utf-8'))
+            if not isinstance(request, dict):
+                raise ValueError("request must be an object")
+            self.requests += 1
+            return self.handler(request)
+        except Exception as e:
+            return {'ok': False, 'error': str(e)}
+    
+    def _handle(self, connection: socket.socket):
+        with connection:
+            connection.settimeout(5.0)
+            try:
+                response = self.dispatch(_read_line(connection))
+            except Exception as e:
+                response = {'ok': False, 'error': str(e)}
+            try:
+                connection.sendall(encode_message(response))
+            except OSError:
+                pass
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    return (json.dumps(message, separators=(',', ':'), ensure_ascii=False) + "\n").encode('utf-8')
+
+
+def _read_line(connection: socket.socket) -> bytes:
+    chunks = []
+    size = 0
+    while True:
+        chunk = connection.recv(65536)
+        if not chunk:
+            break
+        newline = chunk.find(b"\n")
+        if newline != -1:
+            chunks.append(chunk[:newline])
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > MAX_REQUEST_BYTES:
+            raise ValueError("request too large")
+    return b"".join(chunks)
+
+
+def send_request(path: str, request: Dict[str, Any], timeout: float = 5.0) -> Dict[str, Any]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        sock.sendall(encode_message(request))
+        reply = _read_line(sock)
+    if not reply:
+        raise ConnectionError("no reply from Quick Access")
+    return json.loads(reply.decode('utf-8'))
+
+
+def try_request(path: str, request: Dict[str, Any], timeout: float = 5.0) -> Optional[Dict[str, Any]]:
+    try:
+        return send_request(path, request, timeout)
+    except (OSError, ValueError):
+        return None
\ No newline at end of file
@@ -0,0 +1,71 @@
+import json
+import os
+import threading
+from typing import Any, Dict, Iterator
+
+
+class CardJournal:
+    def __init__(self, path: str, compact_threshold: int = 256 * 1024, sync: bool = True):
+        self.path = path
+        self.compact_threshold = compact_threshold
+        self.sync = sync
+        self.lock = threading.Lock()
+        self.file = None
+        self.appends = 0
+        self.torn = False
+        self.size = os.path.getsize(path) if os.path.exists(path) else 0
+    
+    @staticmethod
+    def path_for(config_path: str) -> str:
+        return os.path.splitext(config_path)[0] + ".journal"
+    
+    def append(self, record: Dict[str, Any]):
+        line = json.dumps(record, separators=(',', ':'), ensure_ascii=False) + "\n"
+        data = line.encode('utf-8')
+        with self.lock:
+            if self.file is None:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self.file = open(self.path, 'ab')
+            self.file.write(data)
+            self.file.flush()
+            if self.sync:
+                os.fsync(self.file.fileno())
+            self.size += len(data)
+            self.appends += 1
+    
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        self.torn = False
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    self.torn = True
+                    break
+                try:
+                    yield json.loads(line.decode('utf-8'))
+                except ValueError:
+                    self.torn = True
+                    break
+    
+    def needs_compaction(self) -> bool:
+        return self.size >= self.compact_threshold
+    
+    def reset(self):
+        with self.lock:
+            self._close_locked()
+            with open(self.path, 'wb') as f:
+                f.flush()
+                os.fsync(f.fileno())
+            self.size = 0
+    
+    def close(self):
+        with self.lock:
+            self._close_locked()
+    
+    def _close_locked(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
\ No newline at end of file
@@ -0,0 +1,152 @@
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from core.tracing import percentile, tracer
+
+
+class CoalescingExecutor:
+    def __init__(self, coalesce_window: float = 0.5, latency_samples: int = 256):
+        self.coalesce_window = coalesce_window
+        self.lock = threading.Lock()
+        self.pending: Dict[Hashable, int] = {}
+        self.recent: Dict[Hashable, float] = {}
+        self.tokens = 0
+        self.latencies = deque(maxlen=latency_samples)
+        self.queue_waits = deque(maxlen=latency_samples)
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.coalesced = 0
+        self.rejected = 0
+        self.shutting_down = False
+    
+    def queue_depth(self) -> int:
+        with self.lock:
+            return len(self.pending)
+    
+    def stats(self) -> Dict[str, Any]:
+        queue_depth = self.queue_depth()
+        with self.lock:
+            latencies = sorted(self.latencies)
+            queue_waits = sorted(self.queue_waits)
+            return {
+                'queue_depth': queue_depth,
+                'in_flight': len(self.pending),
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'failed': self.failed,
+                'coalesced': self.coalesced,
+                'rejected': self.rejected,
+                'latency_p50': percentile(latencies, 0.5),
+                'latency_max': latencies[-1] if latencies else 0.0,
+                'queue_wait_p50': percentile(queue_waits, 0.5),
+                'last_latency': self.latencies[-1] if self.latencies else 0.0,
+            }
+    
+    def _admit(self, key: Hashable, now: float, replace: bool = False) -> Optional[int]:
+        if not (replace and key in self.pending):
+            last = self.recent.get(key)
+            if key in self.pending or last is not None and now - last < self.coalesce_window:
+                self.coalesced += 1
+                return None
+        self.tokens += 1
+        return self.tokens
+    
+    def _claim(self, key: Hashable, token: int, now: float):
+        self.pending[key] = token
+        self.recent[key] = now
+        self.submitted += 1
+        self._prune_recent(now)
+    
+    def _prune_recent(self, now: float):
+        if len(self.recent) < 256:
+            return
+        cutoff = now - self.coalesce_window
+        self.recent = {key: submitted for key, submitted in self.recent.items() if submitted >= cutoff}
+    
+    def _release(self, key: Hashable, token: int):
+        if self.pending.get(key) == token:
+            del self.pending[key]
+    
+    def _finish(self, key: Hashable, token: int, submitted_at: float, started_at: float, finished_at: float,
+                failed: bool):
+        self._release(key, token)
+        self.completed += 1
+        if failed:
+            self.failed += 1
+        self.latencies.append(finished_at - submitted_at)
+        self.queue_waits.append(started_at - submitted_at)
+
+
+class LaunchExecutor(CoalescingExecutor):
+    def __init__(self, max_workers: int = 2, max_queue: int = 16, coalesce_window: float = 0.5,
+                 latency_samples: int = 256):
+        super().__init__(coalesce_window, latency_samples)
+        self.max_workers = max(1, max_workers)
+        self.queue = queue.Queue(max(1, max_queue))
+        self.workers: List[threading.Thread] = []
+    
+    def submit(self, key: Hashable, fn: Callable, *args) -> bool:
+        now = time.monotonic()
+        with self.lock:
+            if self.shutting_down:
+                return False
+            token = self._admit(key, now)
+            if token is None:
+                return False
+            
+            try:
+                self.queue.put_nowait((key, token, fn, args, now))
+            except queue.Full:
+                self.rejected += 1
+                return False
+            
+            self._claim(key, token, now)
+            self._ensure_workers()
+        return True
+    
+    def queue_depth(self) -> int:
+        return self.queue.qsize()
+    
+    def shutdown(self, wait: bool = False, timeout: float = 1.0):
+        with self.lock:
+            self.shutting_down = True
+            workers = list(self.workers)
+        for _ in workers:
+            try:
+                self.queue.put_nowait(None)
+            except queue.Full:
+                break
+        if wait:
+            for worker in workers:
+                worker.join(timeout=timeout)
+    
+    def _ensure_workers(self):
+        self.workers = [worker for worker in self.workers if worker.is_alive()]
+        if len(self.workers) < min(self.max_workers, len(self.pending)):
+            worker = threading.Thread(target=self._work, daemon=True)
+            self.workers.append(worker)
+            with tracer.span('executor.thread_start'):
+                worker.start()
+    
+    def _work(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            key, token, fn, args, submitted_at = item
+            started_at = time.monotonic()
+            tracer.record('executor.queue_wait', started_at - submitted_at)
+            failed = False
+            try:
+                result = fn(*args)
+                failed = result is False
+            except Exception:
+                failed = True
+            finished_at = time.monotonic()
+            
+            with self.lock:
+                self._finish(key, token, submitted_at, started_at, finished_at, failed)
\ No newline at end of file
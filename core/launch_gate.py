@@ -0,0 +1,48 @@
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class LaunchGate:
+    def __init__(self, window: float = 0.5, max_entries: int = 1024):
+        self.window = window
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.recent: Dict[Tuple[Hashable, int], float] = {}
+        self.admitted = 0
+        self.suppressed = 0
+    
+    def admit(self, target: Hashable, content: Optional[str] = None) -> bool:
+        if self.window <= 0:
+            with self.lock:
+                self.admitted += 1
+            return True
+        now = time.monotonic()
+        key = (target, hash(content))
+        with self.lock:
+            last = self.recent.get(key)
+            self.recent[key] = now
+            if last is not None and now - last < self.window:
+                self.suppressed += 1
+                return False
+            self.admitted += 1
+            if len(self.recent) > self.max_entries:
+                self._prune(now)
+        return True
+    
+    def reset(self):
+        with self.lock:
+            self.recent.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                'window': self.window,
+                'admitted': self.admitted,
+                'suppressed': self.suppressed,
+                'tracked': len(self.recent),
+            }
+    
+    def _prune(self, now: float):
+        cutoff = now - self.window
+        self.recent = {key: seen for key, seen in self.recent.items() if seen >= cutoff}
\ No newline at end of file
@@ -0,0 +1,162 @@
+import hashlib
+import heapq
+import json
+import math
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+DEFAULT_HALF_LIFE = 7 * 24 * 3600.0
+
+
+def content_hash(content: Optional[str]) -> str:
+    if not content:
+        return ""
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()[:16]
+
+
+def _log_add(a: float, b: float) -> float:
+    if a < b:
+        a, b = b, a
+    return a + math.log1p(math.exp(b - a))
+
+
+class LaunchHistory:
+    def __init__(self, path: str, half_life: float = DEFAULT_HALF_LIFE, max_entries: int = 50000,
+                 epoch: float = 1.6e9):
+        self.path = path
+        self.decay = math.log(2) / half_life
+        self.max_entries = max_entries
+        self.epoch = epoch
+        self.lock = threading.Lock()
+        self.file = None
+        self.entries = 0
+        self.scores: Dict[int, float] = {}
+        self.counts: Dict[int, int] = {}
+        self.last_used: Dict[int, float] = {}
+        self._ranking: Optional[List[int]] = None
+        self.load()
+    
+    @staticmethod
+    def path_for(config_path: str) -> str:
+        return os.path.splitext(config_path)[0] + ".history"
+    
+    def load(self):
+        with self.lock:
+            self.scores = {}
+            self.counts = {}
+            self.last_used = {}
+            self._ranking = None
+            self.entries = 0
+            for record in self._read_records():
+                if record.get('op') == 'forget':
+                    self._forget_locked(record['id'])
+                else:
+                    self._apply(record['id'], record['ts'])
+                self.entries += 1
+    
+    def _read_records(self) -> Iterator[Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line.decode('utf-8'))
+                except ValueError:
+                    continue
+                if isinstance(record, dict) and 'id' in record and 'ts' in record:
+                    yield record
+    
+    def _apply(self, card_id: int, ts: float):
+        weight = self.decay * (ts - self.epoch)
+        score = self.scores.get(card_id)
+        self.scores[card_id] = weight if score is None else _log_add(score, weight)
+        self.counts[card_id] = self.counts.get(card_id, 0) + 1
+        self.last_used[card_id] = max(ts, self.last_used.get(card_id, 0.0))
+        self._ranking = None
+    
+    def record(self, card_id: int, content: Optional[str] = None, latency: float = 0.0,
+               ts: Optional[float] = None):
+        ts = time.time() if ts is None else ts
+        record = {'id': card_id, 'ts': round(ts, 3), 'hash': content_hash(content), 'latency': round(latency, 4)}
+        with self.lock:
+            self._apply(card_id, ts)
+            self._append_locked(record)
+    
+    def _append_locked(self, record: Dict[str, Any]):
+        data = (json.dumps(record, separators=(',', ':')) + "\n").encode('utf-8')
+        try:
+            if self.file is None:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self.file = open(self.path, 'ab')
+            self.file.write(data)
+            self.file.flush()
+        except OSError:
+            return
+        self.entries += 1
+        if self.entries > self.max_entries:
+            self._trim_locked()
+    
+    def _trim_locked(self):
+        self._close_locked()
+        keep = self.max_entries // 2
+        with open(self.path, 'rb') as f:
+            lines = f.readlines()[-keep:]
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        self.entries = len(lines)
+    
+    def forget(self, card_id: int):
+        with self.lock:
+            if self._forget_locked(card_id):
+                self._append_locked({'id': card_id, 'ts': round(time.time(), 3), 'op': 'forget'})
+    
+    def _forget_locked(self, card_id: int) -> bool:
+        self.counts.pop(card_id, None)
+        self.last_used.pop(card_id, None)
+        if self.scores.pop(card_id, None) is None:
+            return False
+        self._ranking = None
+        return True
+    
+    def score(self, card_id: int, now: Optional[float] = None) -> float:
+        log_score = self.scores.get(card_id)
+        if log_score is None:
+            return 0.0
+        now = time.time() if now is None else now
+        return math.exp(log_score - self.decay * (now - self.epoch))
+    
+    def ranking(self) -> List[int]:
+        with self.lock:
+            if self._ranking is None:
+                self._ranking = sorted(self.scores, key=lambda card_id: (-self.scores[card_id], card_id))
+            return self._ranking
+    
+    def top(self, k: int) -> List[int]:
+        with self.lock:
+            if self._ranking is not None:
+                return self._ranking[:k]
+            best = heapq.nsmallest(k, self.scores.items(), key=lambda item: (-item[1], item[0]))
+        return [card_id for card_id, _ in best]
+    
+    def usage(self, card_id: int) -> Tuple[int, float]:
+        return self.counts.get(card_id, 0), self.last_used.get(card_id, 0.0)
+    
+    def close(self):
+        with self.lock:
+            self._close_locked()
+    
+    def _close_locked(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
\ No newline at end of file
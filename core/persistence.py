@@ -0,0 +1,230 @@
+import atexit
+import gc
+import json
+import marshal
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+_active_persisters: Dict[str, "WriteBehindPersister"] = {}
+_registry_lock = threading.Lock()
+SNAPSHOT_VERSION = 1
+
+
+def encode_json(data: Any, indent: Optional[int] = 2) -> str:
+    if indent is None:
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+    return json.dumps(data, indent=indent, ensure_ascii=False)
+
+
+def atomic_write_json(path: str, data: Any, indent: Optional[int] = 2):
+    atomic_write_bytes(path, encode_json(data, indent).encode('utf-8'))
+
+
+def atomic_write_bytes(path: str, payload: bytes, sync: bool = True):
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix="." + os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    if sync:
+        fsync_directory(directory)
+
+
+@contextmanager
+def gc_paused():
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def snapshot_path(path: str) -> str:
+    return os.path.splitext(path)[0] + ".snapshot"
+
+
+def write_snapshot(path: str, data: Any, signature: Optional[Tuple[int, int, int]]) -> bool:
+    if signature is None:
+        return False
+    try:
+        atomic_write_bytes(snapshot_path(path), marshal.dumps((SNAPSHOT_VERSION, signature, data)), sync=False)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def read_snapshot(path: str, signature: Optional[Tuple[int, int, int]]) -> Optional[Any]:
+    if signature is None:
+        return None
+    try:
+        with open(snapshot_path(path), 'rb') as f:
+            version, cached_signature, data = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if version != SNAPSHOT_VERSION or tuple(cached_signature) != signature:
+        return None
+    return data
+
+
+def file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def fsync_directory(directory: str):
+    if os.name != "posix":
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def flush_pending(path: str):
+    with _registry_lock:
+        persister = _active_persisters.get(os.path.abspath(path))
+    if persister:
+        persister.flush()
+
+
+def flush_all():
+    with _registry_lock:
+        persisters = list(_active_persisters.values())
+    for persister in persisters:
+        persister.flush()
+
+
+atexit.register(flush_all)
+
+
+class WriteBehindPersister:
+    def __init__(self, path: str, snapshot: Callable[[], Any], delay: float = 0.25, indent: Optional[int] = 2,
+                 snapshot_cache: bool = False, scheduler: Callable[[float, Callable[[], Any]], Any] = None):
+        self.path = path
+        self.snapshot = snapshot
+        self.delay = delay
+        self.indent = indent
+        self.snapshot_cache = snapshot_cache
+        self.scheduler = scheduler
+        self.lock = threading.RLock()
+        self.timer = None
+        self.dirty = False
+        self.batch_depth = 0
+        self.writes = 0
+        self.coalesced = 0
+        self.last_error = None
+        self.last_signature = None
+    
+    def mark_dirty(self):
+        with self.lock:
+            if self.dirty:
+                self.coalesced += 1
+            self.dirty = True
+            if self.batch_depth:
+                return
+            if self.delay <= 0:
+                self._write_locked()
+                return
+            if self.timer is None:
+                self._register()
+                self.timer = self._schedule(self.delay, self._on_timer)
+    
+    def flush(self) -> bool:
+        with self.lock:
+            self._cancel_timer()
+            if not self.dirty:
+                return True
+            return self._write_locked()
+    
+    def discard(self):
+        with self.lock:
+            self._cancel_timer()
+            self.dirty = False
+            self._unregister()
+    
+    @contextmanager
+    def batch(self):
+        with self.lock:
+            self.batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self.lock:
+                self.batch_depth -= 1
+                if self.batch_depth == 0 and self.dirty:
+                    self.flush()
+    
+    def close(self):
+        self.flush()
+        self._unregister()
+    
+    def _on_timer(self):
+        with self.lock:
+            self.timer = None
+            if self.dirty and not self.batch_depth:
+                self._write_locked()
+    
+    def _write_locked(self) -> bool:
+        try:
+            data = self.snapshot()
+            atomic_write_json(self.path, data, self.indent)
+        except Exception as e:
+            self.last_error = e
+            return False
+        self.dirty = False
+        self.writes += 1
+        self.last_error = None
+        self.last_signature = file_signature(self.path)
+        if self.snapshot_cache:
+            write_snapshot(self.path, data, self.last_signature)
+        self._unregister()
+        return True
+    
+    def _schedule(self, delay: float, callback: Callable[[], Any]):
+        if self.scheduler is not None:
+            return self.scheduler(delay, callback)
+        timer = threading.Timer(delay, callback)
+        timer.daemon = True
+        timer.start()
+        return timer
+    
+    def _cancel_timer(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+    
+    def _register(self):
+        with _registry_lock:
+            _active_persisters[os.path.abspath(self.path)] = self
+    
+    def _unregister(self):
+        with _registry_lock:
+            key = os.path.abspath(self.path)
+            if _active_persisters.get(key) is self:
+                del _active_persisters[key]
\ No newline at end of file
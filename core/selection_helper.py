@@ -0,0 +1,199 @@
+import json
+import os
+import select
+import subprocess
+import sys
+import threading
+import time
+from typing import List, Optional
+
+if __name__ == "__main__":
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import x11
+
+
+def helper_command() -> List[str]:
+    return [sys.executable, os.path.abspath(__file__)]
+
+
+class SelectionHelper:
+    def __init__(self, command: List[str] = None, timeout: float = 1.0, max_restarts: int = 3,
+                 restart_cooldown: float = 30.0):
+        self.command = command or helper_command()
+        self.timeout = timeout
+        self.max_restarts = max_restarts
+        self.restart_cooldown = restart_cooldown
+        self.process = None
+        self.buffer = b""
+        self.lock = threading.Lock()
+        self.failures = 0
+        self.disabled_until = 0.0
+        self.starts = 0
+        self.requests = 0
+    
+    @staticmethod
+    def is_supported() -> bool:
+        return x11.is_available()
+    
+    def read(self, selection: str = "PRIMARY") -> Optional[str]:
+        with self.lock:
+            if not self._available():
+                return None
+            
+            for _ in range(2):
+                if not self._ensure_started():
+                    self._record_failure()
+                    return None
+                
+                reply = self._request(selection)
+                if reply is not None:
+                    return self._accept(reply)
+                self._terminate()
+            
+            self._record_failure()
+            return None
+    
+    def owner(self, selection: str = "PRIMARY") -> Optional[int]:
+        with self.lock:
+            if not self._available() or not self.process or self.process.poll() is not None:
+                return None
+            reply = self._request(f"owner {selection}")
+            if reply is None:
+                self._terminate()
+                return None
+            return reply.get('owner') if reply.get('ok') else None
+    
+    def close(self):
+        with self.lock:
+            self._terminate()
+    
+    def _available(self) -> bool:
+        return time.monotonic() >= self.disabled_until
+    
+    def _accept(self, reply: dict) -> Optional[str]:
+        self.failures = 0
+        self.requests += 1
+        if not reply.get('ok'):
+            return None
+        return reply.get('text', "")
+    
+    def _record_failure(self):
+        self.failures += 1
+        if self.failures >= self.max_restarts:
+            self.disabled_until = time.monotonic() + self.restart_cooldown
+            self.failures = 0
+    
+    def _ensure_started(self) -> bool:
+        if self.process and self.process.poll() is None:
+            return True
+        
+        self._terminate()
+        try:
+            self.process = subprocess.Popen(
+                self.command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                close_fds=True
+            )
+        except (OSError, ValueError):
+            self.process = None
+            return False
+        
+        self.starts += 1
+        self.buffer = b""
+        ready = self._read_line(self.timeout * 5)
+        if not ready or not ready.get('ready'):
+            self._terminate()
+            return False
+        return True
+    
+    def _request(self, selection: str) -> Optional[dict]:
+        try:
+            self.process.stdin.write(selection.encode('ascii') + b"\n")
+            self.process.stdin.flush()
+        except (OSError, ValueError):
+            return None
+        return self._read_line(self.timeout)
+    
+    def _read_line(self, timeout: float) -> Optional[dict]:
+        deadline = time.monotonic() + timeout
+        stdout = self.process.stdout
+        while b"\n" not in self.buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            readable, _, _ = select.select([stdout], [], [], remaining)
+            if not readable:
+                return None
+            chunk = os.read(stdout.fileno(), 65536)
+            if not chunk:
+                return None
+            self.buffer += chunk
+        
+        line, self.buffer = self.buffer.split(b"\n", 1)
+        return decode_reply(line)
+    
+    def _terminate(self):
+        process = self.process
+        self.process = None
+        self.buffer = b""
+        if not process:
+            return
+        try:
+            process.stdin.close()
+        except Exception:
+            pass
+        try:
+            process.wait(timeout=0.2)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        except Exception:
+            pass
+
+
+def decode_reply(line: bytes) -> Optional[dict]:
+    try:
+        return json.loads(line.decode('utf-8'))
+    except ValueError:
+        return None
+
+
+def _write(message: dict):
+    sys.stdout.write(json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+
+def serve():
+    try:
+        display = x11.XDisplay()
+    except Exception as e:
+        _write({'ready': False, 'error': str(e)})
+        return
+    
+    _write({'ready': True})
+    atoms = {}
+    try:
+        for line in sys.stdin:
+            command, _, name = line.strip().rpartition(" ")
+            name = name or "PRIMARY"
+            try:
+                if name not in atoms:
+                    atoms[name] = x11.XA_PRIMARY if name == "PRIMARY" else display.intern_atom(name)
+                if command == "owner":
+                    _write({'ok': True, 'owner': display.selection_owner(atoms[name])})
+                    continue
+                text = display.read_selection(atoms[name])
+                if text is None:
+                    _write({'ok': False})
+                else:
+                    _write({'ok': True, 'text': text})
+            except Exception as e:
+                _write({'ok': False, 'error': str(e)})
+    finally:
+        display.close()
+
+
+if __name__ == "__main__":
+    serve()
\ No newline at end of file
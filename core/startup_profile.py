@@ -0,0 +1,41 @@
+import sys
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+
+class StartupProfiler:
+    def __init__(self, enabled: bool = False, origin: float = None):
+        self.enabled = enabled
+        self.origin = time.perf_counter() if origin is None else origin
+        self.stages: List[Tuple[str, float, float, int]] = []
+    
+    @contextmanager
+    def stage(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        modules_before = len(sys.modules)
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            finished_at = time.perf_counter()
+            self.stages.append((name, started_at - self.origin, finished_at - started_at,
+                                len(sys.modules) - modules_before))
+    
+    def mark(self, name: str):
+        if self.enabled:
+            self.stages.append((name, time.perf_counter() - self.origin, 0.0, 0))
+    
+    def report(self) -> str:
+        lines = [f"{'stage':<20} {'start ms':>9} {'took ms':>9} {'modules':>8}"]
+        for name, start, duration, modules in self.stages:
+            lines.append(f"{name:<20} {start * 1000:>9.1f} {duration * 1000:>9.1f} {modules:>8}")
+        total = max((start + duration for _, start, duration, _ in self.stages), default=0.0)
+        lines.append(f"{'total':<20} {'':>9} {total * 1000:>9.1f} {len(sys.modules):>8}")
+        return "\n".join(lines)
+    
+    def print_report(self, stream=None):
+        if self.enabled:
+            print(self.report(), file=stream or sys.stderr, flush=True)
@@ -0,0 +1,141 @@
+import itertools
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+PERCENTILES = (0.5, 0.95, 0.99)
+
+
+class _NullSpan:
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'started_at')
+    
+    def __init__(self, tracer: "Tracer", name: str):
+        self.tracer = tracer
+        self.name = name
+    
+    def __enter__(self):
+        self.started_at = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        finished_at = time.perf_counter()
+        self.tracer.record(self.name, finished_at - self.started_at, finished_at)
+        return False
+
+
+class Tracer:
+    def __init__(self, capacity: int = 4096, enabled: bool = False):
+        self.capacity = max(1, capacity)
+        self.enabled = enabled
+        self.buffer: List[Optional[Tuple[str, float, float, int]]] = [None] * self.capacity
+        self.counter = itertools.count()
+        self.origin = time.perf_counter()
+    
+    def configure(self, enabled: bool = None, capacity: int = None):
+        if capacity is not None and max(1, capacity) != self.capacity:
+            self.capacity = max(1, capacity)
+            self.clear()
+        if enabled is not None:
+            self.enabled = enabled
+    
+    def clear(self):
+        self.buffer = [None] * self.capacity
+        self.counter = itertools.count()
+    
+    def span(self, name: str):
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, name)
+    
+    def record(self, name: str, duration: float, finished_at: float = None):
+        if not self.enabled:
+            return
+        if finished_at is None:
+            finished_at = time.perf_counter()
+        self.buffer[next(self.counter) % self.capacity] = (name, finished_at - duration, duration,
+                                                           threading.get_ident())
+    
+    def wrap(self, name: str, fn: Callable, started_at: float) -> Callable:
+        if not self.enabled:
+            return fn
+        
+        def traced(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                finished_at = time.perf_counter()
+                self.record(name, finished_at - started_at, finished_at)
+        return traced
+    
+    def spans(self) -> List[Tuple[str, float, float, int]]:
+        spans = [span for span in list(self.buffer) if span is not None]
+        spans.sort(key=lambda span: span[1])
+        return spans
+    
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        durations: Dict[str, List[float]] = {}
+        for name, _, duration, _ in self.spans():
+            durations.setdefault(name, []).append(duration)
+        
+        summary = {}
+        for name, values in sorted(durations.items()):
+            values.sort()
+            stats = {'count': len(values)}
+            for fraction in PERCENTILES:
+                stats[f"p{int(fraction * 100)}_ms"] = percentile(values, fraction) * 1000
+            stats['max_ms'] = values[-1] * 1000
+            summary[name] = stats
+        return summary
+    
+    def report(self) -> str:
+        return format_summary(self.summary())
+    
+    def export(self, path: str) -> int:
+        spans = self.spans()
+        events = [
+            {'name': name, 'ph': 'X', 'ts': (started_at - self.origin) * 1e6, 'dur': duration * 1e6,
+             'pid': os.getpid(), 'tid': thread_id}
+            for name, started_at, duration, thread_id in spans
+        ]
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        summary = self.summary()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms',
+                       'otherData': {'summary': summary, 'report': format_summary(summary)}}, f)
+        return len(events)
+
+
+def format_summary(summary: Dict[str, Dict[str, float]]) -> str:
+    lines = [f"{'span':<28} {'count':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}"]
+    for name, stats in summary.items():
+        lines.append(f"{name:<28} {stats['count']:>6} {stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} "
+                     f"{stats['p99_ms']:>8.2f} {stats['max_ms']:>8.2f}")
+    return "\n".join(lines)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(fraction * (len(values) - 1))))
+    return values[index]
+
+
+tracer = Tracer(enabled=bool(os.environ.get('QUICK_ACCESS_TRACE')))
\ No newline at end of file
@@ -0,0 +1,149 @@
+import threading
+import urllib.parse
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class TemplateError(ValueError):
+    pass
+
+
+ENCODERS: Dict[str, Callable[[str], str]] = {
+    'query': lambda value: urllib.parse.quote(value, safe=''),
+    'path': lambda value: urllib.parse.quote(value, safe='/'),
+    'plus': lambda value: urllib.parse.quote_plus(value, safe=''),
+    'raw': lambda value: value,
+}
+
+SOURCES = ('content', 'clipboard', 'date', 'env')
+DEFAULT_ENCODERS = {'env': 'query', 'date': 'query'}
+
+
+class TemplateField:
+    __slots__ = ('source', 'arg', 'encoder_name', 'encoder', 'key')
+    
+    def __init__(self, source: str, arg: Optional[str], encoder_name: str):
+        self.source = source
+        self.arg = arg
+        self.encoder_name = encoder_name
+        self.encoder = ENCODERS[encoder_name]
+        self.key = (source, arg)
+
+
+class CompiledTemplate:
+    def __init__(self, source: str, segments: List[str], slots: List[Tuple[int, TemplateField]]):
+        self.source = source
+        self.segments = segments
+        self.slots = slots
+        self.sources = frozenset(field.source for _, field in slots)
+        self.keys = tuple(dict.fromkeys(field.key for _, field in slots))
+    
+    def uses(self, source: str) -> bool:
+        return source in self.sources
+    
+    def render(self, values: Dict[Tuple[str, Optional[str]], str]) -> str:
+        if not self.slots:
+            return self.source
+        parts = list(self.segments)
+        for index, field in self.slots:
+            value = values.get(field.key) or ""
+            parts[index] = field.encoder(value) if value else ""
+        return "".join(parts)
+
+
+def _parse_field(body: str, position: int) -> TemplateField:
+    encoder_name = None
+    if '|' in body:
+        body, encoder_name = body.split('|', 1)
+        encoder_name = encoder_name.strip()
+        if encoder_name not in ENCODERS:
+            raise TemplateError(f"Unknown encoder '{encoder_name}' at position {position}")
+    
+    arg = None
+    if ':' in body:
+        body, arg = body.split(':', 1)
+    source = body.strip()
+    
+    if source not in SOURCES:
+        raise TemplateError(f"Unknown placeholder '{{{source}}}' at position {position}")
+    if source == 'env' and not arg:
+        raise TemplateError(f"Placeholder '{{env:NAME}}' needs a variable name at position {position}")
+    if source in ('content', 'clipboard') and arg:
+        raise TemplateError(f"Placeholder '{{{source}}}' takes no argument at position {position}")
+    
+    return TemplateField(source, arg, encoder_name or DEFAULT_ENCODERS.get(source, 'query'))
+
+
+def compile_template(url: str) -> CompiledTemplate:
+    segments: List[str] = []
+    slots: List[Tuple[int, TemplateField]] = []
+    literal: List[str] = []
+    length = len(url)
+    i = 0
+    
+    while i < length:
+        char = url[i]
+        if char == '{':
+            if url.startswith('{{', i):
+                literal.append('{')
+                i += 2
+                continue
+            end = url.find('}', i + 1)
+            if end == -1:
+                raise TemplateError(f"Unclosed '{{' at position {i}")
+            body = url[i + 1:end]
+            if '{' in body:
+                raise TemplateError(f"Nested '{{' at position {i}")
+            field = _parse_field(body, i)
+            segments.append("".join(literal))
+            literal = []
+            slots.append((len(segments), field))
+            segments.append("")
+            i = end + 1
+        elif char == '}':
+            if url.startswith('}}', i):
+                literal.append('}')
+                i += 2
+                continue
+            raise TemplateError(f"Unmatched '}}' at position {i}")
+        else:
+            literal.append(char)
+            i += 1
+    
+    segments.append("".join(literal))
+    if not slots:
+        return CompiledTemplate("".join(segments), segments, slots)
+    return CompiledTemplate(url, segments, slots)
+
+
+class TemplateCache:
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self.lock = threading.Lock()
+        self.templates: Dict[str, CompiledTemplate] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, url: str) -> CompiledTemplate:
+        template = self.templates.get(url)
+        if template is not None:
+            self.hits += 1
+            return template
+        
+        template = compile_template(url)
+        with self.lock:
+            self.misses += 1
+            if len(self.templates) >= self.max_size:
+                self.templates.clear()
+            self.templates[url] = template
+        return template
+    
+    def invalidate(self, url: str):
+        with self.lock:
+            self.templates.pop(url, None)
+    
+    def clear(self):
+        with self.lock:
+            self.templates.clear()
+
+
+template_cache = TemplateCache()
\ No newline at end of file
@@ -0,0 +1,237 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import time
+from typing import Optional
+
+
+XA_PRIMARY = 1
+XA_STRING = 31
+SELECTION_NOTIFY = 31
+ANY_PROPERTY_TYPE = 0
+CURRENT_TIME = 0
+MAX_PROPERTY_LENGTH = 1 << 24
+XFIXES_SELECTION_NOTIFY = 0
+XFIXES_SET_SELECTION_OWNER_NOTIFY_MASK = 1
+
+
+class XEvent(ctypes.Union):
+    _fields_ = [
+        ('type', ctypes.c_int),
+        ('pad', ctypes.c_long * 24),
+    ]
+
+
+class XSelectionEvent(ctypes.Structure):
+    _fields_ = [
+        ('type', ctypes.c_int),
+        ('serial', ctypes.c_ulong),
+        ('send_event', ctypes.c_int),
+        ('display', ctypes.c_void_p),
+        ('requestor', ctypes.c_ulong),
+        ('selection', ctypes.c_ulong),
+        ('target', ctypes.c_ulong),
+        ('property', ctypes.c_ulong),
+        ('time', ctypes.c_ulong),
+    ]
+
+
+class XFixesSelectionNotifyEvent(ctypes.Structure):
+    _fields_ = [
+        ('type', ctypes.c_int),
+        ('serial', ctypes.c_ulong),
+        ('send_event', ctypes.c_int),
+        ('display', ctypes.c_void_p),
+        ('window', ctypes.c_ulong),
+        ('subtype', ctypes.c_int),
+        ('owner', ctypes.c_ulong),
+        ('selection', ctypes.c_ulong),
+        ('timestamp', ctypes.c_ulong),
+        ('selection_timestamp', ctypes.c_ulong),
+    ]
+
+
+_libraries = None
+
+
+def _load_libraries():
+    global _libraries
+    if _libraries is not None:
+        return _libraries or None
+    
+    _libraries = ()
+    xlib_path = ctypes.util.find_library('X11')
+    xfixes_path = ctypes.util.find_library('Xfixes')
+    if not xlib_path or not xfixes_path:
+        return None
+    
+    try:
+        xlib = ctypes.cdll.LoadLibrary(xlib_path)
+        xfixes = ctypes.cdll.LoadLibrary(xfixes_path)
+    except OSError:
+        return None
+    
+    xlib.XOpenDisplay.argtypes = [ctypes.c_char_p]
+    xlib.XOpenDisplay.restype = ctypes.c_void_p
+    xlib.XCloseDisplay.argtypes = [ctypes.c_void_p]
+    xlib.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+    xlib.XDefaultRootWindow.restype = ctypes.c_ulong
+    xlib.XInternAtom.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+    xlib.XInternAtom.restype = ctypes.c_ulong
+    xlib.XConnectionNumber.argtypes = [ctypes.c_void_p]
+    xlib.XPending.argtypes = [ctypes.c_void_p]
+    xlib.XNextEvent.argtypes = [ctypes.c_void_p, ctypes.POINTER(XEvent)]
+    xlib.XFlush.argtypes = [ctypes.c_void_p]
+    xlib.XCreateSimpleWindow.argtypes = [
+        ctypes.c_void_p, ctypes.c_ulong, ctypes.c_int, ctypes.c_int, ctypes.c_uint,
+        ctypes.c_uint, ctypes.c_uint, ctypes.c_ulong, ctypes.c_ulong
+    ]
+    xlib.XCreateSimpleWindow.restype = ctypes.c_ulong
+    xlib.XGetSelectionOwner.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+    xlib.XGetSelectionOwner.restype = ctypes.c_ulong
+    xlib.XConvertSelection.argtypes = [
+        ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong
+    ]
+    xlib.XGetWindowProperty.argtypes = [
+        ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_long, ctypes.c_long, ctypes.c_int,
+        ctypes.c_ulong, ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.c_ulong),
+        ctypes.POINTER(ctypes.POINTER(ctypes.c_ubyte))
+    ]
+    xlib.XFree.argtypes = [ctypes.c_void_p]
+    
+    xfixes.XFixesQueryExtension.argtypes = [
+        ctypes.c_void_p, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int)
+    ]
+    xfixes.XFixesSelectSelectionInput.argtypes = [
+        ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong
+    ]
+    
+    _libraries = (xlib, xfixes)
+    return _libraries
+
+
+def is_available() -> bool:
+    return bool(os.environ.get('DISPLAY')) and _load_libraries() is not None
+
+
+class XDisplay:
+    def __init__(self, display_name: Optional[str] = None):
+        libraries = _load_libraries()
+        if libraries is None:
+            raise OSError("libX11/libXfixes not available")
+        self.xlib, self.xfixes = libraries
+        
+        self.handle = self.xlib.XOpenDisplay(display_name.encode() if display_name else None)
+        if not self.handle:
+            raise OSError("Cannot open X display")
+        
+        self.root = self.xlib.XDefaultRootWindow(self.handle)
+        self.fd = self.xlib.XConnectionNumber(self.handle)
+        self.xfixes_event_base = None
+        self.requestor = None
+    
+    def intern_atom(self, name: str) -> int:
+        return self.xlib.XInternAtom(self.handle, name.encode(), False)
+    
+    def watch_selection(self, selection: int):
+        if self.xfixes_event_base is None:
+            event_base = ctypes.c_int()
+            error_base = ctypes.c_int()
+            if not self.xfixes.XFixesQueryExtension(self.handle, ctypes.byref(event_base), ctypes.byref(error_base)):
+                raise OSError("XFixes extension not available")
+            self.xfixes_event_base = event_base.value
+        
+        self.xfixes.XFixesSelectSelectionInput(
+            self.handle, self.root, selection, XFIXES_SET_SELECTION_OWNER_NOTIFY_MASK
+        )
+        self.xlib.XFlush(self.handle)
+    
+    def wait_for_events(self, timeout: float) -> bool:
+        if self.xlib.XPending(self.handle):
+            return True
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        return bool(readable)
+    
+    def next_event(self) -> Optional[XEvent]:
+        if not self.xlib.XPending(self.handle):
+            return None
+        event = XEvent()
+        self.xlib.XNextEvent(self.handle, ctypes.byref(event))
+        return event
+    
+    def selection_changed(self, event: XEvent) -> Optional[int]:
+        if self.xfixes_event_base is None:
+            return None
+        if event.type != self.xfixes_event_base + XFIXES_SELECTION_NOTIFY:
+            return None
+        notify = ctypes.cast(ctypes.byref(event), ctypes.POINTER(XFixesSelectionNotifyEvent)).contents
+        return notify.selection
+    
+    def selection_owner(self, selection: int) -> int:
+        return self.xlib.XGetSelectionOwner(self.handle, selection)
+    
+    def read_selection(self, selection: int, timeout: float = 1.0) -> Optional[str]:
+        if not self.selection_owner(selection):
+            return ""
+        
+        if self.requestor is None:
+            self.requestor = self.xlib.XCreateSimpleWindow(self.handle, self.root, 0, 0, 1, 1, 0, 0, 0)
+        
+        for target in (self.intern_atom("UTF8_STRING"), XA_STRING):
+            converted = self._convert_selection(selection, target, timeout)
+            if converted is None:
+                return None
+            if converted is not False:
+                return converted
+        return ""
+    
+    def _convert_selection(self, selection: int, target: int, timeout: float):
+        property_atom = self.intern_atom("QUICK_ACCESS_SELECTION")
+        self.xlib.XConvertSelection(self.handle, selection, target, property_atom, self.requestor, CURRENT_TIME)
+        self.xlib.XFlush(self.handle)
+        
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self.wait_for_events(remaining):
+                return None
+            event = self.next_event()
+            while event is not None:
+                if event.type == SELECTION_NOTIFY:
+                    notify = ctypes.cast(ctypes.byref(event), ctypes.POINTER(XSelectionEvent)).contents
+                    if notify.requestor == self.requestor and notify.selection == selection:
+                        if not notify.property:
+                            return False
+                        return self._take_property(notify.property)
+                event = self.next_event()
+    
+    def _take_property(self, property_atom: int) -> Optional[str]:
+        actual_type = ctypes.c_ulong()
+        actual_format = ctypes.c_int()
+        item_count = ctypes.c_ulong()
+        bytes_after = ctypes.c_ulong()
+        data = ctypes.POINTER(ctypes.c_ubyte)()
+        
+        status = self.xlib.XGetWindowProperty(
+            self.handle, self.requestor, property_atom, 0, MAX_PROPERTY_LENGTH, True, ANY_PROPERTY_TYPE,
+            ctypes.byref(actual_type), ctypes.byref(actual_format), ctypes.byref(item_count),
+            ctypes.byref(bytes_after), ctypes.byref(data)
+        )
+        if status != 0:
+            return None
+        
+        try:
+            if actual_type.value == self.intern_atom("INCR") or actual_format.value != 8:
+                return None
+            raw = ctypes.string_at(data, item_count.value) if data else b""
+        finally:
+            if data:
+                self.xlib.XFree(data)
+        return raw.decode('utf-8', errors='replace')
+    
+    def close(self):
+        if self.handle:
+            self.xlib.XCloseDisplay(self.handle)
+            self.handle = None
\ No newline at end of file
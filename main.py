@@ -1,141 +1,401 @@
+import time
+
+_STARTED_AT = time.perf_counter()
+
+import argparse
 import os
 import sys
 import threading
-from PIL import Image, ImageDraw
-import pystray
-from pystray import MenuItem as item
-import keyboard
-import tkinter as tk
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from core.card_manager import CardManager
-from core.clipboard_reader import ClipboardReader
-from core.browser_launcher import BrowserLauncher
-from ui.window import MainWindow
+from core import ipc
+from core.startup_profile import StartupProfiler
+from core.tracing import tracer
+
+
+TRAY_ICON_SIZE = 64
+
+
+def render_tray_image():
+    from PIL import Image, ImageDraw
+    
+    width = TRAY_ICON_SIZE
+    height = TRAY_ICON_SIZE
+    image = Image.new('RGB', (width, height), color='white')
+    draw = ImageDraw.Draw(image)
+    
+    draw.rectangle([width//4, height//4, 3*width//4, 3*height//4], 
+                  fill='blue', outline='darkblue')
+    draw.text((width//2-8, height//2-8), "QA", fill='white')
+    
+    return image
+
+
+def load_tray_image(cache_path: str):
+    from PIL import Image
+    
+    try:
+        with Image.open(cache_path) as cached:
+            cached.load()
+            return cached.copy()
+    except (OSError, ValueError):
+        pass
+    
+    image = render_tray_image()
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = f"{cache_path}.tmp"
+        image.save(temp_path, format='PNG')
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass
+    return image
 
 
 class QuickAccessApp:
-    def __init__(self):
-        self.card_manager = CardManager()
-        self.clipboard_reader = ClipboardReader()
-        self.browser_launcher = BrowserLauncher(self.clipboard_reader)
-        
+    def __init__(self, config_path: str = "config/settings.json", profiler: StartupProfiler = None):
+        self.config_path = config_path
+        self.profiler = profiler or StartupProfiler()
+        self.card_manager = None
+        self.clipboard_reader = None
+        self.browser_launcher = None
+        self.hotkey_registry = None
+        self.command_hotkeys = None
+        self.launch_executor = None
+        self.async_core = None
+        self.search_index = None
         self.main_window = None
+        self.palette = None
         self.tray_icon = None
-        self.hotkeys_registered = False
+        self.control_server = None
+        self.config_watcher = None
+        self.instance_lock = None
         
-        self.setup_tray_icon()
-        self.setup_hotkeys()
-    
-    def create_tray_image(self):
-        width = 64
-        height = 64
-        image = Image.new('RGB', (width, height), color='white')
-        draw = ImageDraw.Draw(image)
+        from ui.dispatcher import UiDispatcher
         
-        draw.rectangle([width//4, height//4, 3*width//4, 3*height//4], 
-                      fill='blue', outline='darkblue')
-        draw.text((width//2-8, height//2-8), "QA", fill='white')
+        self.dispatcher = UiDispatcher(None)
+        with self.profiler.stage('tray'):
+            self.setup_tray_icon()
+            self.start_tray()
+        
+        with self.profiler.stage('import tkinter'):
+            import tkinter as tk
+        with self.profiler.stage('tk root'):
+            self.root = tk.Tk()
+            self.root.withdraw()
+            self.dispatcher.root = self.root
+        
+        with self.profiler.stage('import core'):
+            from core.card_manager import CardManager
+            from core.clipboard_reader import ClipboardReader
+            from core.browser_launcher import BrowserLauncher
+            from core.hotkey_registry import HotkeyRegistry
+            from core.launch_gate import LaunchGate
+        with self.profiler.stage('load cards'):
+            self.card_manager = CardManager(config_path)
+        with self.profiler.stage('core init'):
+            tracing = self.card_manager.get_setting('tracing', {})
+            tracer.configure(enabled=tracer.enabled or tracing.get('enabled', False), capacity=tracing.get('capacity'))
+            self.clipboard_reader = ClipboardReader(
+                freshness_window=self.card_manager.get_setting('selection_cache', {}).get('freshness_window', 0.5)
+            )
+            self.browser_launcher = BrowserLauncher(
+                self.clipboard_reader,
+                self.card_manager.get_setting('browser_command'),
+                on_launch=self.card_manager.record_launch,
+                gate=LaunchGate(self.card_manager.get_setting('launch', {}).get('coalesce_window', 0.5))
+            )
+            
+            self.hotkey_registry = HotkeyRegistry(self.launch_card_by_id)
+            self.command_hotkeys = HotkeyRegistry(self.run_command)
+            self.launch_executor = self.create_launch_executor()
+            self.card_manager.add_listener(self.on_card_event)
+            self.update_tray_menu()
         
-        return image
+        with self.profiler.stage('control socket'):
+            self.start_control_server()
     
-    def setup_tray_icon(self):
-        image = self.create_tray_image()
+    def start_control_server(self):
+        if not ipc.is_supported():
+            return
+        try:
+            path = ipc.socket_path(self.config_path)
+        except OSError:
+            return
+        from core.control import ControlHandler
         
-        menu = pystray.Menu(
-            item('Open', self.show_window),
-            item('Add Card', self.add_card_from_tray),
-            pystray.Menu.SEPARATOR,
-            item('Exit', self.quit_app)
+        handler = ControlHandler(
+            self.card_manager,
+            self.browser_launcher,
+            self.launch_executor,
+            self.clipboard_reader,
+            on_cards_changed=lambda: self.dispatcher.post(self.refresh_hotkeys),
+            on_show=self.show_window
         )
+        if self.async_core:
+            from core.async_core import AsyncControlServer
+            
+            self.control_server = AsyncControlServer(path, handler.handle, self.async_core)
+        else:
+            self.control_server = ipc.ControlServer(path, handler.handle)
+        try:
+            self.control_server.start()
+        except OSError:
+            self.control_server = None
+    
+    def tray_image_path(self) -> str:
+        return os.path.join(os.path.dirname(self.config_path) or ".", "tray_icon.png")
+    
+    def setup_tray_icon(self):
+        import pystray
+        
+        image = load_tray_image(self.tray_image_path())
+        
+        menu = pystray.Menu(self.tray_menu_items)
         
         self.tray_icon = pystray.Icon("QuickAccess", image, "Quick Access App", menu, default_action=self.show_window)
     
-    def setup_hotkeys(self):
-        if self.hotkeys_registered:
-            return
+    def start_tray(self):
+        if self.tray_icon:
+            threading.Thread(target=self.tray_icon.run, daemon=True).start()
+    
+    def update_tray_menu(self):
+        if self.tray_icon:
+            try:
+                self.tray_icon.update_menu()
+            except Exception:
+                pass
+    
+    def tray_menu_items(self):
+        import pystray
+        item = pystray.MenuItem
+        
+        card_manager = self.card_manager
+        top_cards = card_manager.top_cards(card_manager.get_setting('tray_top_cards', 10)) if card_manager else []
+        for card in top_cards:
+            yield item(card['name'], lambda icon, menu_item, card_id=card['id']: self.launch_card_by_id(card_id))
+        if top_cards:
+            yield pystray.Menu.SEPARATOR
+        yield item('Open', self.show_window, default=True)
+        yield item('Add Card', self.add_card_from_tray)
+        yield item('Quick Launch', self.show_palette)
+        if tracer.enabled:
+            yield item('Export Trace', self.export_trace)
+        if card_manager and card_manager.get_all_groups():
+            yield item('Groups', pystray.Menu(self.group_menu_items))
+        yield pystray.Menu.SEPARATOR
+        yield item('Exit', self.quit_app)
+    
+    def on_card_event(self, event, card_id, card):
+        if event.startswith('group_') or event in ('reloaded', 'launched', 'removed', 'updated'):
+            self.update_tray_menu()
+    
+    def group_menu_items(self):
+        import pystray
         
+        for group in self.card_manager.get_all_groups():
+            yield pystray.MenuItem(group['name'], lambda icon, menu_item, group_id=group['id']: self.launch_group_by_id(group_id))
+    
+    def setup_hotkeys(self):
         try:
-            cards = self.card_manager.get_all_cards()
-            for card in cards:
-                hotkey = card.get('hotkey', '').strip()
-                if hotkey:
-                    try:
-                        keyboard.add_hotkey(hotkey, lambda c=card: self.launch_card_by_hotkey(c))
-                    except Exception:
-                        pass
-            self.hotkeys_registered = True
+            self.command_hotkeys.sync([
+                {'id': 'palette', 'hotkey': self.card_manager.get_setting('palette_hotkey', 'ctrl+alt+space')}
+            ])
         except Exception:
             pass
+        return self.refresh_hotkeys()
+    
+    def run_command(self, command):
+        if command == 'palette':
+            self.dispatcher.call(self._show_palette)
+    
+    def show_palette(self, icon=None, item=None):
+        self.dispatcher.call(self._show_palette)
+    
+    def _show_palette(self):
+        if not self.palette:
+            from ui.palette import CommandPalette
+            
+            self.palette = CommandPalette(self.root, self.get_search_index(), self.card_manager, self.launch_card_by_hotkey)
+        self.palette.show()
+    
+    def get_search_index(self):
+        if self.search_index is None:
+            from core.card_search import CardSearchIndex
+            
+            history = self.card_manager.history
+            self.search_index = CardSearchIndex(rank=history.score if history else None,
+                                                top=history.top if history else None)
+            self.search_index.attach(self.card_manager)
+        return self.search_index
     
     def refresh_hotkeys(self):
         try:
-            keyboard.clear_all_hotkeys()
-            self.hotkeys_registered = False
-            self.setup_hotkeys()
-        except Exception:
-            pass
+            self.hotkey_registry.sync(list(self.card_manager.get_all_cards()) + list(self.card_manager.get_all_groups()))
+        except Exception as e:
+            return [f"Hotkeys are unavailable: {e}"]
+        return self.hotkey_registry.describe_problems()
+    
+    def launch_card_by_id(self, card_id):
+        card = self.card_manager.get_card(card_id)
+        if card:
+            self.launch_card_by_hotkey(card)
+        elif self.card_manager.get_group(card_id):
+            self.launch_group_by_id(card_id)
+    
+    def launch_group_by_id(self, group_id):
+        if self.async_core:
+            self.async_core.submit_group(('group', group_id), self.card_manager.get_group_cards(group_id))
+            return
+        self.launch_executor.submit(('group', group_id), self._launch_group, group_id)
+    
+    def _launch_group(self, group_id):
+        return self.browser_launcher.launch_group(self.card_manager.get_group_cards(group_id))
+    
+    def create_launch_executor(self):
+        settings = self.card_manager.get_setting('launch', {})
+        if settings.get('backend') == 'asyncio':
+            from core.async_core import AsyncCore
+            
+            self.async_core = AsyncCore(
+                self.browser_launcher,
+                self.clipboard_reader,
+                max_workers=settings.get('workers', 2),
+                max_queue=settings.get('queue_size', 16),
+                coalesce_window=0.0,
+                selection_timeout=settings.get('selection_timeout', 1.0)
+            )
+            self.async_core.start()
+            self.card_manager.persister.scheduler = self.async_core.call_later
+            return self.async_core
+        
+        from core.launch_executor import LaunchExecutor
+        
+        return LaunchExecutor(
+            max_workers=settings.get('workers', 2),
+            max_queue=settings.get('queue_size', 16),
+            coalesce_window=0.0
+        )
     
     def launch_card_by_hotkey(self, card):
-        def launch_in_background():
-            self.browser_launcher.launch_card(card)
-        threading.Thread(target=launch_in_background, daemon=True).start()
+        pressed_at = time.perf_counter()
+        with tracer.span('hotkey.dispatch'):
+            if self.async_core:
+                self.async_core.submit_card(card, pressed_at=pressed_at, replace=True)
+                return
+            launch = tracer.wrap('hotkey.to_browser', self.browser_launcher.launch_card, pressed_at)
+            self.launch_executor.submit(card['id'], launch, card)
+    
+    def export_trace(self, icon=None, item=None):
+        path = os.path.join(os.path.dirname(self.config_path) or ".", f"trace-{time.strftime('%Y%m%d-%H%M%S')}.json")
+        try:
+            tracer.export(path)
+            message = f"Trace written to {path}"
+        except OSError as e:
+            message = f"Trace export failed: {e}"
+        if self.tray_icon:
+            try:
+                self.tray_icon.notify(message, "Quick Access")
+            except Exception:
+                pass
     
     def show_window(self, icon=None, item=None):
-        def create_window():
-            if not self.main_window:
-                self.main_window = MainWindow(
-                    self.card_manager, 
-                    self.browser_launcher, 
-                    self.clipboard_reader
-                )
-                self.main_window.set_on_close_callback(self.hide_window)
-                self.main_window.set_on_card_changed_callback(self.refresh_hotkeys)
+        self.dispatcher.call(self._show_window)
+    
+    def _show_window(self):
+        if not self.main_window:
+            from ui.window import MainWindow
             
-            self.main_window.show()
-            self.main_window.refresh_cards()
-            self.refresh_hotkeys()
+            self.main_window = MainWindow(
+                self.root,
+                self.card_manager, 
+                self.browser_launcher, 
+                self.clipboard_reader,
+                self.dispatcher,
+                self.launch_executor
+            )
+            self.main_window.set_on_close_callback(self.hide_window)
+            self.main_window.set_on_card_changed_callback(self.refresh_hotkeys)
         
-        if hasattr(self, 'root') and self.root:
-            self.root.after(0, create_window)
-        else:
-            create_window()
+        self.main_window.show()
     
     def hide_window(self):
         if self.main_window:
             self.main_window.hide()
     
     def add_card_from_tray(self, icon=None, item=None):
-        self.show_window()
-        if self.main_window:
-            self.main_window.root.after(100, self.main_window.add_card)
+        self.dispatcher.call(self._add_card_from_tray)
+    
+    def _add_card_from_tray(self):
+        self._show_window()
+        self.main_window.window.after(100, self.main_window.add_card)
     
     def quit_app(self, icon=None, item=None):
-        if self.main_window:
-            self.main_window.root.quit()
+        if not self.dispatcher.on_ui_thread():
+            self.dispatcher.post(self.quit_app)
+            return
         
-        try:
-            keyboard.clear_all_hotkeys()
-        except Exception:
-            pass
+        self.dispatcher.stop()
+        self.root.quit()
+        
+        if self.control_server:
+            self.control_server.stop()
+        
+        if self.config_watcher:
+            self.config_watcher.stop()
+        
+        for registry in (self.hotkey_registry, self.command_hotkeys):
+            try:
+                if registry:
+                    registry.clear()
+            except Exception:
+                pass
         
         if self.clipboard_reader:
-            self.clipboard_reader.stop_monitoring()
+            self.clipboard_reader.close()
+        
+        if self.card_manager:
+            self.card_manager.persister.scheduler = None
+            self.card_manager.close()
+        
+        if self.launch_executor:
+            self.launch_executor.shutdown()
         
         if self.tray_icon:
             self.tray_icon.stop()
         
         os._exit(0)
     
-    def run(self):
-        self.clipboard_reader.start_monitoring()
-        
-        if self.tray_icon:
-            threading.Thread(target=self.tray_icon.run, daemon=True).start()
+    def start_deferred(self):
+        with self.profiler.stage('hotkeys'):
+            self.setup_hotkeys()
+        self.root.after_idle(self._start_monitor)
+    
+    def _start_monitor(self):
+        with self.profiler.stage('clipboard monitor'):
+            self.clipboard_reader.start_monitoring()
+        with self.profiler.stage('config watcher'):
+            self.start_config_watcher()
+        self.profiler.print_report()
+    
+    def start_config_watcher(self):
+        if not self.card_manager.get_setting('watch_config', True):
+            return
+        from core.config_watcher import create_config_watcher
         
-        self.root = tk.Tk()
-        self.root.withdraw()
+        self.config_watcher = create_config_watcher(self.config_path, self.on_config_changed)
+        self.config_watcher.start()
+    
+    def on_config_changed(self):
+        changes = self.card_manager.reload_from_disk()
+        if changes and any(changes.values()):
+            self.dispatcher.post(self.refresh_hotkeys)
+    
+    def run(self):
+        self.dispatcher.start()
+        self.root.after(0, self.start_deferred)
+        self.profiler.mark('event loop')
         
         try:
             self.root.mainloop()
@@ -143,8 +403,44 @@ class QuickAccessApp:
             self.quit_app()
 
 
-def main():
-    app = QuickAccessApp()
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Quick Access App")
+    parser.add_argument('--config', default="config/settings.json", help="path to the settings file")
+    parser.add_argument('--profile-startup', action='store_true',
+                        help="print import and init timings for each startup stage")
+    parser.add_argument('--trace', action='store_true',
+                        help="record hotkey-to-browser latency spans (export from the tray or 'qa.py trace')")
+    return parser.parse_args(argv)
+
+
+def acquire_instance_lock(config_path: str):
+    if not ipc.is_supported():
+        return None
+    try:
+        path = ipc.socket_path(config_path)
+    except OSError as e:
+        print(f"Control socket disabled: {e}", file=sys.stderr)
+        return None
+    lock = ipc.InstanceLock(f"{path}.lock")
+    if lock.acquire():
+        return lock
+    if ipc.try_request(path, {'op': 'show'}) is None:
+        print("Quick Access App is already running but not responding", file=sys.stderr)
+    else:
+        print("Quick Access App is already running", file=sys.stderr)
+    return False
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    lock = acquire_instance_lock(args.config)
+    if lock is False:
+        return
+    if args.trace:
+        tracer.configure(enabled=True)
+    profiler = StartupProfiler(args.profile_startup, origin=_STARTED_AT)
+    app = QuickAccessApp(args.config, profiler)
+    app.instance_lock = lock
     app.run()
 
 
@@ -0,0 +1,112 @@
+import argparse
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core import card_io, ipc
+from core.tracing import format_summary
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="qa", description="Control a running Quick Access App")
+    parser.add_argument('--config', default="config/settings.json", help="settings file of the running app")
+    parser.add_argument('--timeout', type=float, default=5.0)
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    launch = commands.add_parser('launch', help="launch a card by id or name")
+    launch.add_argument('card')
+    launch.add_argument('--content', help="text to use instead of the current selection")
+    
+    add = commands.add_parser('add', help="add a card")
+    add.add_argument('name')
+    add.add_argument('url')
+    add.add_argument('--hotkey', default="")
+    add.add_argument('--browser', default="")
+    
+    import_cards = commands.add_parser('import', help="import cards from a JSONL, CSV, bookmarks HTML or JSON file")
+    import_cards.add_argument('path')
+    import_cards.add_argument('--format', choices=card_io.FORMATS)
+    import_cards.add_argument('--allow-duplicates', action='store_true', help="keep cards whose URL already exists")
+    
+    export_cards = commands.add_parser('export', help="export all cards to a file")
+    export_cards.add_argument('path')
+    export_cards.add_argument('--format', choices=card_io.FORMATS)
+    
+    listing = commands.add_parser('list', help="list cards, most used first")
+    listing.add_argument('--limit', type=int)
+    
+    commands.add_parser('stats', help="print runtime statistics")
+    
+    trace = commands.add_parser('trace', help="print latency percentiles per span")
+    trace.add_argument('--output', help="also write the spans to this file (Chrome trace format)")
+    commands.add_parser('show', help="open the main window")
+    commands.add_parser('ping', help="check whether the app is running")
+    return parser
+
+
+def build_request(args) -> dict:
+    if args.command == 'launch':
+        return {'op': 'launch', 'card': args.card, 'content': args.content}
+    if args.command == 'add':
+        return {'op': 'add', 'name': args.name, 'url': args.url, 'hotkey': args.hotkey, 'browser': args.browser}
+    if args.command == 'import':
+        path = os.path.abspath(args.path)
+        if not os.path.isfile(path):
+            raise ValueError(f"no such file: {args.path}")
+        return {'op': 'import', 'path': path, 'format': card_io.detect_format(path, args.format),
+                'allow_duplicates': args.allow_duplicates}
+    if args.command == 'export':
+        path = os.path.abspath(args.path)
+        return {'op': 'export', 'path': path, 'format': card_io.detect_format(path, args.format)}
+    if args.command == 'list':
+        return {'op': 'list', 'limit': args.limit}
+    if args.command == 'trace':
+        return {'op': 'trace', 'path': os.path.abspath(args.output) if args.output else None}
+    return {'op': args.command}
+
+
+def print_response(command: str, response: dict):
+    if command == 'list':
+        for card in response.get('cards', []):
+            hotkey = f"  [{card['hotkey']}]" if card.get('hotkey') else ""
+            print(f"{card['id']:>6}  {card['name']}  {card['url']}{hotkey}")
+    elif command == 'trace':
+        print(format_summary(response.get('summary', {})))
+        if response.get('path'):
+            print(f"{response['spans']} spans written to {response['path']}")
+    elif command in ('stats', 'import', 'export', 'add', 'launch'):
+        print(json.dumps({key: value for key, value in response.items() if key != 'ok'}, indent=2))
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        request = build_request(args)
+    except (OSError, ValueError) as e:
+        print(f"qa: {e}", file=sys.stderr)
+        return 2
+    
+    try:
+        path = ipc.socket_path(args.config)
+    except OSError as e:
+        print(f"qa: {e}", file=sys.stderr)
+        return 3
+    
+    try:
+        response = ipc.send_request(path, request, args.timeout)
+    except (OSError, ValueError):
+        print("qa: Quick Access App is not running", file=sys.stderr)
+        return 3
+    
+    if not response.get('ok'):
+        print(f"qa: {response.get('error') or response.get('errors')}", file=sys.stderr)
+        print_response(args.command, response)
+        return 1
+    print_response(args.command, response)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,134 @@
+import unittest
+import os
+import sys
+import shlex
+import shutil
+import tempfile
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core import ipc
+from core.async_core import AsyncControlServer, AsyncCore
+from core.browser_launcher import BrowserLauncher
+from core.launch_gate import LaunchGate
+from core.persistence import WriteBehindPersister
+
+SLOW_CAPTURE = [sys.executable, "-c", "import time; time.sleep(5)"]
+ECHO_CAPTURE = [sys.executable, "-c", "print('picked text')"]
+DELAYED_CAPTURE = [sys.executable, "-c", "import time; time.sleep(0.4); print('picked text')"]
+
+
+class TestAsyncCore(unittest.TestCase):
+    def setUp(self):
+        self.launches = []
+        self.launcher = BrowserLauncher(browser_command=f"{shlex.quote(sys.executable)} -c pass",
+                                        on_launch=lambda card_id, content, latency: self.launches.append((card_id, content)))
+        self.core = AsyncCore(self.launcher, coalesce_window=0.0, selection_commands=[ECHO_CAPTURE])
+        self.core.start()
+    
+    def tearDown(self):
+        self.core.shutdown(wait=True)
+    
+    def wait_for(self, predicate, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.01)
+        return False
+    
+    def test_card_launch_runs_on_loop(self):
+        card = {'id': 1, 'name': "Search", 'url': "https://example.com/?q={content}"}
+        self.assertTrue(self.core.submit_card(card))
+        self.assertTrue(self.wait_for(lambda: self.core.stats()['completed'] == 1))
+        self.assertEqual(self.launches, [(1, "picked text")])
+        self.assertEqual(self.launcher.open_stats()['spawns'], 1)
+        self.assertEqual(self.core.stats()['failed'], 0)
+    
+    def test_gate_suppresses_repeated_card(self):
+        self.launcher.gate = LaunchGate(window=1.0)
+        card = {'id': 1, 'name': "Search", 'url': "https://example.com/?q={content}"}
+        for completed in (1, 2):
+            self.assertTrue(self.core.submit_card(card, replace=True))
+            self.assertTrue(self.wait_for(lambda: self.core.stats()['completed'] == completed))
+        self.assertEqual(self.launches, [(1, "picked text")])
+        self.assertEqual(self.launcher.gate.stats()['suppressed'], 1)
+    
+    def test_repeated_hotkey_replaces_older_capture(self):
+        self.core.selection_commands = [DELAYED_CAPTURE]
+        card = {'id': 1, 'name': "Search", 'url': "https://example.com/?q={content}"}
+        self.assertTrue(self.core.submit_card(card, replace=True))
+        time.sleep(0.1)
+        self.assertTrue(self.core.submit_card(card, replace=True))
+        
+        self.assertTrue(self.wait_for(lambda: self.core.stats()['cancelled'] == 1 and self.core.stats()['in_flight'] == 0))
+        self.assertEqual(self.core.stats()['completed'], 1)
+        self.assertEqual(self.core.stats()['coalesced'], 0)
+        self.assertEqual(self.launches, [(1, "picked text")])
+    
+    def test_different_hotkeys_launch_independently(self):
+        self.core.selection_commands = [DELAYED_CAPTURE]
+        first = {'id': 1, 'name': "Slow", 'url': "https://example.com/?q={content}"}
+        second = {'id': 2, 'name': "Plain", 'url': "https://example.com/"}
+        self.assertTrue(self.core.submit_card(first, replace=True))
+        time.sleep(0.1)
+        self.assertTrue(self.core.submit_card(second, replace=True))
+        
+        self.assertTrue(self.wait_for(lambda: self.core.stats()['completed'] == 2 and self.core.stats()['in_flight'] == 0))
+        self.assertEqual(self.core.stats()['cancelled'], 0)
+        self.assertEqual([card_id for card_id, _ in self.launches], [2, 1])
+    
+    def test_capture_times_out(self):
+        self.core.selection_commands = [SLOW_CAPTURE]
+        self.core.selection_timeout = 0.2
+        started_at = time.monotonic()
+        self.assertEqual(self.core.run(self.core.read_selection(), 5.0), "")
+        self.assertLess(time.monotonic() - started_at, 2.0)
+    
+    def test_repeats_are_coalesced(self):
+        calls = []
+        release = threading.Event()
+        self.assertTrue(self.core.submit(1, lambda: (release.wait(2.0), calls.append(1))))
+        self.assertFalse(self.core.submit(1, calls.append, 2))
+        release.set()
+        self.assertTrue(self.wait_for(lambda: self.core.stats()['completed'] == 1))
+        self.assertEqual(calls, [1])
+        self.assertEqual(self.core.stats()['coalesced'], 1)
+        self.assertLessEqual(self.core.stats()['io_threads'], 2)
+    
+    def test_group_launch(self):
+        cards = [{'id': 1, 'url': "https://a.example/{content}"}, {'id': 2, 'url': "https://b.example"}]
+        self.assertTrue(self.core.submit_group(('group', 3), cards, "x"))
+        self.assertTrue(self.wait_for(lambda: self.core.stats()['completed'] == 1))
+        self.assertEqual(sorted(self.launches), [(1, "x"), (2, "x")])
+    
+    def test_persister_writes_on_loop(self):
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, True)
+        persister = WriteBehindPersister(os.path.join(temp_dir, "settings.json"), lambda: {'cards': []}, delay=0.05,
+                                         scheduler=self.core.call_later)
+        threads = threading.active_count()
+        persister.mark_dirty()
+        persister.mark_dirty()
+        self.assertLessEqual(threading.active_count(), threads)
+        self.assertTrue(self.wait_for(lambda: persister.writes == 1))
+        self.assertEqual(persister.coalesced, 1)
+    
+    def test_control_server(self):
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, True)
+        path = os.path.join(temp_dir, "control.sock")
+        server = AsyncControlServer(path, lambda request: {'ok': True, 'echo': request['value']}, self.core)
+        server.start()
+        try:
+            self.assertEqual(ipc.send_request(path, {'value': 7}), {'ok': True, 'echo': 7})
+            self.assertFalse(ipc.send_request(path, ['not', 'an', 'object'])['ok'])
+            self.assertEqual(server.requests, 1)
+        finally:
+            server.stop()
+        self.assertFalse(os.path.exists(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
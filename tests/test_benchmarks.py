@@ -0,0 +1,34 @@
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks import bench_launch
+from benchmarks.harness import Results, compare
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+    def test_compare_flags_regressions(self):
+        baseline = {'metrics': {'a': {'seconds_per_op': 1.0}, 'b': {'seconds_per_op': 1.0},
+                                'c': {'seconds_per_op': 1.0}}}
+        current = Results()
+        current.add('a', 1.1)
+        current.add('b', 2.0)
+        current.add('c', 0.5)
+        current.add('new', 1.0)
+        comparison = compare(current.to_dict(), baseline, threshold=0.25)
+        
+        statuses = {row['name']: row['status'] for row in comparison['rows']}
+        self.assertEqual(statuses, {'a': 'ok', 'b': 'regression', 'c': 'improvement'})
+        self.assertEqual(comparison['regressions'], ['b'])
+    
+    def test_launch_benchmarks_use_stubs(self):
+        results = Results()
+        bench_launch.run(results, operations=20, repeat=1)
+        metrics = results.to_dict()['metrics']
+        self.assertIn('launch.launch_card[cold]', metrics)
+        self.assertGreater(metrics['launch.replace_parameters']['ops_per_sec'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -1,6 +1,7 @@
 import unittest
 import sys
 import os
+import shlex
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.browser_launcher import BrowserLauncher
@@ -9,8 +10,10 @@ from core.browser_launcher import BrowserLauncher
 class MockClipboardReader:
     def __init__(self, content="test content"):
         self.content = content
+        self.reads = 0
     
     def get_selected_content(self):
+        self.reads += 1
         return self.content
 
 
@@ -45,6 +48,23 @@ class TestBrowserLauncher(unittest.TestCase):
         result = self.browser_launcher.replace_parameters(url, content)
         self.assertEqual(result, "https://google.com/search?q=hello%20world%20%26%20test")
     
+    def test_replace_parameters_skips_selection_when_unused(self):
+        reader = MockClipboardReader()
+        reader.get_selected_content = lambda: self.fail("selection read for a URL without {content}")
+        launcher = BrowserLauncher(reader)
+        self.assertEqual(launcher.replace_parameters("https://google.com/{env:HOME|raw}"), "https://google.com/" + os.environ.get("HOME", ""))
+    
+    def test_replace_parameters_clipboard_placeholder(self):
+        reader = MockClipboardReader()
+        reader.get_clipboard_content = lambda: "copied text"
+        launcher = BrowserLauncher(reader)
+        result = launcher.replace_parameters("https://google.com/search?q={content|plus}&c={clipboard}", "a b")
+        self.assertEqual(result, "https://google.com/search?q=a+b&c=copied%20text")
+    
+    def test_replace_parameters_invalid_template_falls_back(self):
+        result = self.browser_launcher.replace_parameters("https://google.com/{weird}?q={content}", "x y")
+        self.assertEqual(result, "https://google.com/{weird}?q=x%20y")
+    
     def test_launch_card_valid(self):
         card = {
             'name': 'Test Card',
@@ -65,5 +85,93 @@ class TestBrowserLauncher(unittest.TestCase):
         self.assertFalse(result)
 
 
+
+class TestBrowserLauncherDirectExec(unittest.TestCase):
+    def setUp(self):
+        self.command = f"{shlex.quote(sys.executable)} -c pass"
+        self.browser_launcher = BrowserLauncher(MockClipboardReader(), browser_command=self.command)
+    
+    def test_default_command_resolved_once(self):
+        self.assertEqual(self.browser_launcher.default_command, [sys.executable, "-c", "pass"])
+        self.assertIs(self.browser_launcher.parse_command(self.command), self.browser_launcher.default_command)
+    
+    def test_build_argv_appends_url(self):
+        argv = self.browser_launcher.build_argv("https://example.com")
+        self.assertEqual(argv[-1], "https://example.com")
+    
+    def test_build_argv_substitutes_placeholder(self):
+        argv = self.browser_launcher.build_argv("https://example.com", "firefox -P work --new-tab=%s")
+        self.assertEqual(argv, ["firefox", "-P", "work", "--new-tab=https://example.com"])
+    
+    def test_launch_records_duration(self):
+        result = self.browser_launcher.launch_url("https://example.com/{content}", "query")
+        self.assertTrue(result)
+        
+        stats = self.browser_launcher.open_stats()
+        self.assertEqual(stats['opens'], 1)
+        self.assertGreater(stats['last'], 0)
+        for child in self.browser_launcher.children:
+            child.wait(timeout=5)
+    
+    def test_missing_card_browser_falls_back_to_default(self):
+        card = {
+            'name': 'Profile Card',
+            'url': 'https://example.com',
+            'browser': '/nonexistent/browser --new-tab'
+        }
+        self.assertTrue(self.browser_launcher.launch_card(card, ""))
+        self.assertEqual(self.browser_launcher.children[-1].args[:2], [sys.executable, "-c"])
+        for child in self.browser_launcher.children:
+            child.wait(timeout=5)
+
+    def test_group_launch_reads_selection_once(self):
+        cards = [
+            {'id': 1, 'name': 'Google', 'url': 'https://google.com/search?q={content}'},
+            {'id': 2, 'name': 'GitHub', 'url': 'github.com/search?q={content|plus}'},
+            {'id': 3, 'name': 'Docs', 'url': 'https://docs.python.org', 'browser': 'firefox --new-tab'},
+        ]
+        reader = self.browser_launcher.clipboard_reader
+        batches = self.browser_launcher.render_group(cards)
+        
+        self.assertEqual(reader.reads, 1)
+        self.assertEqual(batches[None], [
+            "https://google.com/search?q=test%20content",
+            "https://github.com/search?q=test+content",
+        ])
+        self.assertEqual(batches['firefox --new-tab'], ["https://docs.python.org"])
+    
+    def test_group_launch_uses_one_process(self):
+        cards = [
+            {'id': 1, 'name': 'A', 'url': 'https://example.com/a?q={content}'},
+            {'id': 2, 'name': 'B', 'url': 'https://example.com/b?q={content}'},
+            {'id': 3, 'name': 'C', 'url': 'https://example.com/c'},
+        ]
+        self.assertTrue(self.browser_launcher.launch_group(cards))
+        self.assertEqual(self.browser_launcher.spawns, 1)
+        self.assertEqual(self.browser_launcher.children[-1].args[-3:], [
+            "https://example.com/a?q=test%20content",
+            "https://example.com/b?q=test%20content",
+            "https://example.com/c",
+        ])
+        for child in self.browser_launcher.children:
+            child.wait(timeout=5)
+    
+    def test_successful_launch_is_reported(self):
+        launches = []
+        launcher = BrowserLauncher(MockClipboardReader("picked"), browser_command=self.command,
+                                   on_launch=lambda card_id, content, latency: launches.append((card_id, content)))
+        self.assertTrue(launcher.launch_card({'id': 7, 'name': 'A', 'url': 'https://example.com/?q={content}'}))
+        self.assertTrue(launcher.launch_card({'id': 8, 'name': 'B', 'url': 'https://example.com/'}))
+        self.assertEqual(launches, [(7, "picked"), (8, None)])
+        self.assertEqual(launcher.clipboard_reader.reads, 1)
+        for child in launcher.children:
+            child.wait(timeout=5)
+    
+    def test_single_url_openers_are_not_batched(self):
+        self.assertIsNone(self.browser_launcher.build_batch_argv(["a", "b"], "xdg-open"))
+        self.assertIsNone(self.browser_launcher.build_batch_argv(["a", "b"], "firefox --new-tab=%s"))
+        self.assertEqual(self.browser_launcher.build_batch_argv(["a", "b"], "firefox"), ["firefox", "a", "b"])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
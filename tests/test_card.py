@@ -0,0 +1,59 @@
+import unittest
+import os
+import sys
+import json
+import pickle
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.card import Card
+
+
+class TestCard(unittest.TestCase):
+    def test_json_round_trip(self):
+        records = [
+            {'id': 1, 'name': "Search", 'url': "https://example.com/?q={content}", 'hotkey': "ctrl+alt+s"},
+            {'id': 2, 'name': "Docs", 'url': "https://docs.example", 'hotkey': "", 'browser': "firefox"},
+            {'id': 3, 'name': "Tagged", 'url': "https://tagged.example", 'hotkey': "", 'tags': ["a", "b"]},
+        ]
+        for record in records:
+            card = Card.from_dict(json.loads(json.dumps(record)))
+            self.assertEqual(card.to_dict(), record)
+            self.assertEqual(dict(card), record)
+            self.assertEqual(card, record)
+            self.assertEqual(json.loads(json.dumps(dict(card))), record)
+    
+    def test_missing_browser_is_absent(self):
+        card = Card(1, "Search", "https://example.com")
+        self.assertNotIn('browser', card)
+        self.assertIsNone(card.get('browser'))
+        with self.assertRaises(KeyError):
+            card['browser']
+        self.assertEqual(len(card), 4)
+    
+    def test_immutable_and_replace(self):
+        card = Card(1, "Search", "https://example.com", "ctrl+s")
+        with self.assertRaises(TypeError):
+            card['name'] = "Changed"
+        with self.assertRaises(AttributeError):
+            card.name = "Changed"
+        with self.assertRaises(AttributeError):
+            card.__dict__
+        
+        renamed = card.replace(name="Renamed", browser="chromium")
+        self.assertEqual(card['name'], "Search")
+        self.assertEqual(renamed['name'], "Renamed")
+        self.assertEqual(renamed['browser'], "chromium")
+        self.assertNotIn('browser', renamed.replace(browser=""))
+    
+    def test_repeated_values_are_interned(self):
+        first = Card.from_dict({'id': 1, 'name': "a", 'url': "https://a", 'hotkey': "".join(["ctrl+", "alt+x"])})
+        second = Card.from_dict({'id': 2, 'name': "b", 'url': "https://b", 'hotkey': "".join(["ctrl+al", "t+x"])})
+        self.assertIs(first.hotkey, second.hotkey)
+    
+    def test_pickle(self):
+        card = Card(1, "Search", "https://example.com", browser="firefox")
+        self.assertEqual(pickle.loads(pickle.dumps(card)), card)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,138 @@
+import unittest
+import tempfile
+import os
+import sys
+import shutil
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core import card_io
+from core.card_manager import CardManager
+
+
+CARDS = [
+    {'id': 1, 'name': "Docs & Guides", 'url': "https://docs.python.org/3/search.html?q={content}", 'hotkey': "ctrl+alt+d"},
+    {'id': 2, 'name': 'Quote "this"', 'url': "https://example.com/a,b", 'hotkey': "", 'browser': "firefox"},
+]
+
+
+class TestCardIO(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def path(self, name):
+        return os.path.join(self.temp_dir, name)
+    
+    def test_round_trip_every_format(self):
+        for name in ("cards.jsonl", "cards.csv", "cards.json", "cards.html"):
+            path = self.path(name)
+            self.assertEqual(card_io.write_cards(CARDS, path), 2)
+            records = list(card_io.read_cards(path))
+            self.assertEqual([(r['name'], r['url']) for r in records],
+                             [(c['name'], c['url']) for c in CARDS], name)
+            self.assertFalse(os.path.exists(f"{path}.tmp"))
+    
+    def test_failed_write_keeps_original(self):
+        path = self.path("cards.jsonl")
+        card_io.write_cards(CARDS, path)
+        
+        def broken():
+            yield CARDS[0]
+            raise RuntimeError("export failed")
+        
+        with self.assertRaises(RuntimeError):
+            card_io.write_cards(broken(), path)
+        self.assertFalse(os.path.exists(f"{path}.tmp"))
+        self.assertEqual(len(list(card_io.read_cards(path))), 2)
+    
+    def test_detect_format(self):
+        self.assertEqual(card_io.detect_format("x.NDJSON"), 'jsonl')
+        self.assertEqual(card_io.detect_format("x.txt", 'csv'), 'csv')
+        with self.assertRaises(ValueError):
+            card_io.detect_format("x.txt")
+    
+    def test_bookmarks_across_chunk_boundaries(self):
+        path = self.path("bookmarks.html")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("<!DOCTYPE NETSCAPE-Bookmark-file-1>\n<DL><p>\n<DT><H3>Folder</H3>\n<DL><p>\n")
+            for i in range(5000):
+                f.write(f'<DT><A HREF="https://example.com/{i}?a=1&amp;b=2" ADD_DATE="1">Page &lt;{i}&gt;</A>\n')
+            f.write("</DL><p>\n</DL><p>\n")
+        records = list(card_io.read_cards(path))
+        self.assertEqual(len(records), 5000)
+        self.assertEqual(records[4999], {'name': "Page <4999>", 'url': "https://example.com/4999?a=1&b=2"})
+    
+    def test_csv_without_header(self):
+        path = self.path("plain.csv")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("Docs,https://docs.python.org\nPyPI,https://pypi.org\n")
+        self.assertEqual([r['url'] for r in card_io.read_cards(path)], ["https://docs.python.org", "https://pypi.org"])
+    
+    def test_jsonl_reports_bad_lines(self):
+        path = self.path("cards.jsonl")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('{"name": "A", "url": "https://a.example"}\nnot json\n[1]\n')
+        records = list(card_io.read_cards(path))
+        self.assertEqual(len(records), 3)
+        self.assertIn('error', records[1])
+        self.assertIn('error', records[2])
+
+
+class TestCardImport(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.temp_dir, "settings.json")
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_import_counts_duplicates_and_invalid(self):
+        card_manager = CardManager(self.config_path)
+        card_manager.add_card("A", "https://a.example")
+        events = []
+        card_manager.add_listener(lambda event, card_id, card: events.append(event))
+        result = card_manager.import_cards([
+            {'name': "A again", 'url': "https://a.example"},
+            {'url': "https://b.example"},
+            {'url': "https://b.example"},
+            {'name': "Broken", 'url': "https://c.example/{nope}"},
+            {'error': "line 5: bad"},
+        ])
+        self.assertEqual((result['added'], result['duplicates'], result['invalid']), (1, 2, 2))
+        self.assertEqual(card_manager.get_cards_by_url("https://b.example")[0]['name'], "https://b.example")
+        self.assertEqual(events, ['reloaded'])
+        card_manager.close()
+    
+    def test_large_import_is_one_write(self):
+        card_manager = CardManager(self.config_path, journaled=True)
+        path = os.path.join(self.temp_dir, "bookmarks.html")
+        card_io.write_cards(({'name': f"Page {i}", 'url': f"https://example.com/{i}"} for i in range(20000)), path)
+        writes = card_manager.persister.writes
+        
+        start = time.perf_counter()
+        result = card_manager.import_cards(card_io.read_cards(path))
+        elapsed = time.perf_counter() - start
+        
+        self.assertEqual(result['added'], 20000)
+        self.assertEqual(card_manager.persister.writes, writes + 1)
+        self.assertLess(elapsed, 5.0)
+        card_manager.close()
+        
+        reloaded = CardManager(self.config_path, journaled=True)
+        self.assertEqual(reloaded.card_count(), 20000)
+        reloaded.close()
+    
+    def test_export_matches_cards(self):
+        card_manager = CardManager(self.config_path)
+        card_manager.add_card("A", "https://a.example", "ctrl+alt+a")
+        path = os.path.join(self.temp_dir, "cards.csv")
+        self.assertEqual(card_manager.export_cards(path), 1)
+        self.assertEqual(list(card_io.read_cards(path))[0]['hotkey'], "ctrl+alt+a")
+        card_manager.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
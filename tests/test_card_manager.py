@@ -6,6 +6,7 @@ import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.card_manager import CardManager
+from core.url_template import TemplateError
 
 
 class TestCardManager(unittest.TestCase):
@@ -15,8 +16,9 @@ class TestCardManager(unittest.TestCase):
         self.card_manager = CardManager(self.config_path)
     
     def tearDown(self):
-        if os.path.exists(self.config_path):
-            os.remove(self.config_path)
+        self.card_manager.close()
+        for name in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, name))
         os.rmdir(self.temp_dir)
     
     def test_add_card(self):
@@ -59,6 +61,277 @@ class TestCardManager(unittest.TestCase):
         card = self.card_manager.get_card_by_hotkey("ctrl+3")
         self.assertIsNone(card)
     
+    def test_ids_not_reused_after_delete(self):
+        first_id = self.card_manager.add_card("First", "https://first.com")
+        second_id = self.card_manager.add_card("Second", "https://second.com")
+        self.card_manager.delete_card(second_id)
+        
+        third_id = self.card_manager.add_card("Third", "https://third.com")
+        self.assertNotIn(third_id, (first_id, second_id))
+        
+        new_manager = CardManager(self.config_path)
+        self.assertNotIn(new_manager.add_card("Fourth", "https://fourth.com"), (first_id, second_id, third_id))
+    
+    def test_hotkey_index_follows_updates(self):
+        card_id = self.card_manager.add_card("Card", "https://example.com", "ctrl+1")
+        self.card_manager.update_card(card_id, hotkey="ctrl+2")
+        
+        self.assertIsNone(self.card_manager.get_card_by_hotkey("ctrl+1"))
+        self.assertEqual(self.card_manager.get_card_by_hotkey("ctrl+2")['id'], card_id)
+        
+        self.card_manager.delete_card(card_id)
+        self.assertIsNone(self.card_manager.get_card_by_hotkey("ctrl+2"))
+    
+    def test_get_card_by_name_is_case_insensitive(self):
+        card_id = self.card_manager.add_card("GitHub Search", "https://github.com")
+        
+        self.assertEqual(self.card_manager.get_card_by_name("github search")['id'], card_id)
+        self.assertEqual(len(self.card_manager.get_cards_by_name("GITHUB SEARCH")), 1)
+        self.assertIsNone(self.card_manager.get_card_by_name("missing"))
+    
+    def test_cards_are_immutable_snapshots(self):
+        card_id = self.card_manager.add_card("Card", "https://example.com")
+        card = self.card_manager.get_card(card_id)
+        
+        with self.assertRaises(TypeError):
+            card['name'] = "Changed"
+        with self.assertRaises(AttributeError):
+            card.name = "Changed"
+        
+        self.card_manager.update_card(card_id, name="Renamed")
+        self.assertEqual(card['name'], "Card")
+        self.assertEqual(self.card_manager.get_card(card_id)['name'], "Renamed")
+        self.assertIs(self.card_manager.get_card(card_id), self.card_manager.get_all_cards()[0])
+    
+    def test_shared_index_entries(self):
+        first = self.card_manager.add_card("Same", "https://example.com/a")
+        second = self.card_manager.add_card("same", "https://example.com/b")
+        self.assertEqual(self.card_manager.name_index['same'], [first, second])
+        self.assertEqual(self.card_manager.url_index['https://example.com/a'], first)
+        
+        self.card_manager.delete_card(first)
+        self.assertEqual(self.card_manager.name_index['same'], second)
+        self.assertEqual([card['id'] for card in self.card_manager.get_cards_by_name("SAME")], [second])
+    
+    def test_transaction_writes_once(self):
+        writes_before = self.card_manager.persister.writes
+        with self.card_manager.transaction():
+            for i in range(50):
+                self.card_manager.add_card(f"Card {i}", f"https://example.com/{i}")
+        
+        self.assertEqual(self.card_manager.persister.writes, writes_before + 1)
+        with open(self.config_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(len(json.load(f)['cards']), 50)
+    
+    def test_changes_are_coalesced_until_flush(self):
+        manager = CardManager(self.config_path, save_delay=60)
+        writes_before = manager.persister.writes
+        manager.add_card("One", "https://one.com")
+        manager.add_card("Two", "https://two.com")
+        self.assertEqual(manager.persister.writes, writes_before)
+        
+        self.assertTrue(manager.flush())
+        self.assertEqual(manager.persister.writes, writes_before + 1)
+        manager.close()
+    
+    def test_extra_keys_survive_update_without_hotkey(self):
+        self.card_manager.flush()
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({'cards': [{'id': 1, 'name': "a", 'url': "https://a/{content}", 'color': "red"}]}, f)
+        
+        manager = CardManager(self.config_path)
+        self.assertEqual(manager.get_card(1)['color'], "red")
+        self.assertTrue(manager.update_card(1, name="b"))
+        manager.flush()
+        manager.close()
+        
+        reloaded = CardManager(self.config_path)
+        card = reloaded.get_card(1)
+        self.assertEqual(card['name'], "b")
+        self.assertEqual(card['color'], "red")
+        self.assertEqual(card['hotkey'], "")
+        reloaded.close()
+    
+    def test_corrupt_config_is_preserved(self):
+        self.card_manager.flush()
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            f.write('{"cards": [{"id": 1, "na')
+        
+        manager = CardManager(self.config_path)
+        self.assertEqual(len(manager.get_all_cards()), 0)
+        self.assertIsNotNone(manager.load_error)
+        self.assertTrue(any(name.startswith("test_settings.json.corrupt") for name in os.listdir(self.temp_dir)))
+        manager.close()
+    
+    def test_invalid_records_are_skipped(self):
+        self.card_manager.flush()
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({'cards': [
+                {'id': 1, 'name': "Good", 'url': "https://good.example"},
+                {'id': 2, 'name': "No URL"},
+                {'name': "No id", 'url': "https://noid.example"},
+                {'id': 1, 'name': "Duplicate", 'url': "https://dup.example"},
+                "not a card",
+            ]}, f)
+        
+        manager = CardManager(self.config_path)
+        self.assertEqual([card['name'] for card in manager.get_all_cards()], ["Good"])
+        self.assertIsInstance(manager.load_error, ValueError)
+        self.assertTrue(os.path.exists(self.config_path))
+        self.assertFalse(any(".corrupt" in name for name in os.listdir(self.temp_dir)))
+        manager.close()
+    
+    def test_journaled_mode_appends_instead_of_rewriting(self):
+        manager = CardManager(self.config_path, journaled=True)
+        writes_before = manager.persister.writes
+        
+        card_id = manager.add_card("Journaled", "https://journal.com", "ctrl+j")
+        manager.update_card(card_id, name="Renamed")
+        removed_id = manager.add_card("Removed", "https://removed.com")
+        manager.delete_card(removed_id)
+        
+        self.assertEqual(manager.persister.writes, writes_before)
+        self.assertEqual(manager.journal.appends, 4)
+        manager.close()
+        
+        replayed = CardManager(self.config_path, journaled=True)
+        cards = replayed.get_all_cards()
+        self.assertEqual(len(cards), 1)
+        self.assertEqual(cards[0]['name'], "Renamed")
+        self.assertEqual(replayed.get_card_by_hotkey("ctrl+j")['id'], card_id)
+        self.assertNotIn(replayed.add_card("Next", "https://next.com"), (card_id, removed_id))
+        replayed.close()
+    
+    def test_journal_compaction(self):
+        manager = CardManager(self.config_path, journaled=True, compact_threshold=512)
+        for i in range(20):
+            manager.add_card(f"Card {i}", f"https://example.com/{i}")
+        
+        self.assertLess(manager.journal.size, 512)
+        with open(self.config_path, 'r', encoding='utf-8') as f:
+            self.assertGreater(len(json.load(f)['cards']), 0)
+        manager.close()
+        
+        replayed = CardManager(self.config_path, journaled=True, compact_threshold=512)
+        self.assertEqual(len(replayed.get_all_cards()), 20)
+        replayed.close()
+    
+    def test_journaled_setting(self):
+        self.card_manager.flush()
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({'storage': {'journaled': True}, 'cards': []}, f)
+        
+        manager = CardManager(self.config_path)
+        self.assertIsNotNone(manager.journal)
+        writes_before = manager.persister.writes
+        manager.add_card("Journaled", "https://journal.com")
+        self.assertEqual(manager.persister.writes, writes_before)
+        self.assertEqual(manager.journal.appends, 1)
+        manager.close()
+        
+        replayed = CardManager(self.config_path)
+        self.assertEqual([card['name'] for card in replayed.get_all_cards()], ["Journaled"])
+        replayed.close()
+    
+    def test_journal_ignores_torn_tail(self):
+        manager = CardManager(self.config_path, journaled=True)
+        manager.add_card("Complete", "https://complete.com")
+        manager.close()
+        with open(manager.journal.path, 'ab') as f:
+            f.write(b'{"op":"add","card":{"id":9')
+        
+        replayed = CardManager(self.config_path, journaled=True)
+        self.assertEqual([card['name'] for card in replayed.get_all_cards()], ["Complete"])
+        self.assertEqual(replayed.journal.size, 0)
+        replayed.close()
+    
+    def test_change_events(self):
+        events = []
+        self.card_manager.add_listener(lambda event, card_id, card: events.append((event, card_id, card and card['name'])))
+        
+        card_id = self.card_manager.add_card("Card", "https://example.com")
+        self.card_manager.update_card(card_id, name="Renamed")
+        self.card_manager.delete_card(card_id)
+        self.card_manager.update_card(card_id, name="Missing")
+        
+        self.assertEqual(events, [
+            ('added', card_id, "Card"),
+            ('updated', card_id, "Renamed"),
+            ('removed', card_id, None),
+        ])
+    
+    def test_card_browser_command(self):
+        card_id = self.card_manager.add_card("Profile", "https://example.com", "", "firefox -P work")
+        self.assertEqual(self.card_manager.get_card(card_id)['browser'], "firefox -P work")
+        
+        self.card_manager.update_card(card_id, browser="")
+        self.assertNotIn('browser', self.card_manager.get_card(card_id))
+    
+    def test_invalid_template_rejected_on_save(self):
+        with self.assertRaises(TemplateError):
+            self.card_manager.add_card("Bad", "https://example.com/{nope}")
+        self.assertEqual(len(self.card_manager.get_all_cards()), 0)
+        
+        card_id = self.card_manager.add_card("Good", "https://example.com/{content}")
+        with self.assertRaises(TemplateError):
+            self.card_manager.update_card(card_id, url="https://example.com/{content")
+        self.assertEqual(self.card_manager.get_card(card_id)['url'], "https://example.com/{content}")
+    
+    def test_groups(self):
+        first = self.card_manager.add_card("Google", "https://google.com/search?q={content}")
+        second = self.card_manager.add_card("GitHub", "https://github.com/search?q={content}")
+        group_id = self.card_manager.add_group("Search", [second, first, second], "ctrl+shift+s")
+        
+        self.assertNotIn(group_id, (first, second))
+        self.assertEqual(self.card_manager.get_group(group_id)['cards'], [second, first])
+        self.assertEqual([card['id'] for card in self.card_manager.get_group_cards(group_id)], [second, first])
+        self.assertIsNone(self.card_manager.get_card_by_hotkey("ctrl+shift+s"))
+        
+        with self.assertRaises(KeyError):
+            self.card_manager.add_group("Broken", [first, 999])
+        
+        self.assertTrue(self.card_manager.update_group(group_id, name="Everywhere"))
+        self.card_manager.delete_card(second)
+        self.assertEqual(self.card_manager.get_group(group_id)['cards'], [first])
+        
+        self.card_manager.flush()
+        reloaded = CardManager(self.config_path)
+        self.assertEqual(reloaded.get_group(group_id)['name'], "Everywhere")
+        self.assertEqual(reloaded.get_group(group_id)['cards'], [first])
+        self.assertGreater(reloaded.next_id, group_id)
+        reloaded.close()
+        
+        self.assertTrue(self.card_manager.delete_group(group_id))
+        self.assertIsNone(self.card_manager.get_group(group_id))
+    
+    def test_groups_journaled(self):
+        self.card_manager.close()
+        self.card_manager = CardManager(self.config_path, journaled=True)
+        first = self.card_manager.add_card("Google", "https://google.com")
+        second = self.card_manager.add_card("GitHub", "https://github.com")
+        group_id = self.card_manager.add_group("Search", [first, second])
+        self.card_manager.update_group(group_id, card_ids=[second])
+        self.card_manager.close()
+        
+        reloaded = CardManager(self.config_path, journaled=True)
+        self.assertEqual(reloaded.get_group(group_id)['cards'], [second])
+        reloaded.close()
+    
+    def test_top_cards_by_frecency(self):
+        first = self.card_manager.add_card("Google", "https://google.com")
+        second = self.card_manager.add_card("GitHub", "https://github.com")
+        third = self.card_manager.add_card("Docs", "https://docs.python.org")
+        
+        self.card_manager.record_launch(second, "query", 0.01)
+        self.card_manager.record_launch(second)
+        self.card_manager.record_launch(third)
+        
+        self.assertEqual([card['id'] for card in self.card_manager.top_cards(2)], [second, third])
+        self.assertEqual([card['id'] for card in self.card_manager.get_ranked_cards()], [second, third, first])
+        
+        self.card_manager.delete_card(second)
+        self.assertEqual([card['id'] for card in self.card_manager.top_cards(5)], [third])
+    
     def test_persistence(self):
         self.card_manager.add_card("Persistent Card", "https://persist.com", "ctrl+p")
         
@@ -0,0 +1,96 @@
+import unittest
+import tempfile
+import os
+import sys
+import shutil
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.card_manager import CardManager
+from core.card_search import CardSearchIndex, normalize_url
+
+
+class TestCardSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.card_manager = CardManager(os.path.join(self.temp_dir, "settings.json"))
+        self.index = CardSearchIndex()
+        self.index.attach(self.card_manager)
+        self.github = self.card_manager.add_card("GitHub Search", "https://github.com/search?q={content}")
+        self.python = self.card_manager.add_card("Python Docs", "https://docs.python.org/3/search.html?q={content}")
+        self.maps = self.card_manager.add_card("Maps", "https://www.google.com/maps?q={content}")
+    
+    def tearDown(self):
+        self.card_manager.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_url_scheme_not_indexed(self):
+        self.assertEqual(normalize_url("https://www.Google.com/maps"), "google com maps")
+        self.assertEqual(self.index.search("https"), [])
+    
+    def test_name_match_ranks_first(self):
+        self.assertEqual(self.index.search("python")[0], self.python)
+        self.assertEqual(self.index.search("git")[0], self.github)
+    
+    def test_short_query_uses_prefixes(self):
+        self.assertEqual(self.index.search("ma"), [self.maps])
+    
+    def test_typo_tolerant(self):
+        self.assertIn(self.python, self.index.search("pyhton"))
+    
+    def test_follows_card_events(self):
+        self.card_manager.update_card(self.maps, name="Atlas")
+        self.assertEqual(self.index.search("atlas"), [self.maps])
+        
+        self.card_manager.delete_card(self.github)
+        self.assertNotIn(self.github, self.index.search("github"))
+        
+        self.card_manager.flush()
+        self.card_manager.load_cards()
+        self.assertEqual(len(self.index), 2)
+    
+    def test_search_10k_cards(self):
+        words = ["github", "google", "docs", "python", "jira", "wiki", "mail", "calendar", "drive", "news"]
+        mixed = CardSearchIndex()
+        mixed.rebuild({
+            'id': i,
+            'name': f"{words[i % 10]} {words[(i // 10) % 10]} {i}",
+            'url': f"https://{words[(i // 100) % 10]}.example.com/{words[i % 7]}?q={{content}}"
+        } for i in range(10000))
+        shared = CardSearchIndex(rank=lambda card_id: 0.0)
+        shared.rebuild({
+            'id': i,
+            'name': f"Project {i}",
+            'url': f"https://intranet.example.com/projects/{i}/search?q={{content}}"
+        } for i in range(10000))
+        
+        self.assertEqual(shared.search("project 9999")[0], 9999)
+        for index, query in ((mixed, "pyt"), (mixed, "jira wiki"), (mixed, "calendr"), (mixed, "42"), (mixed, "ex"),
+                             (shared, "ex"), (shared, "search"), (shared, "project9999"), (shared, "proejct"),
+                             (shared, "intranet example")):
+            self.assertTrue(index.search(query))
+            elapsed = []
+            for _ in range(3):
+                started_at = time.perf_counter()
+                index.search(query)
+                elapsed.append(time.perf_counter() - started_at)
+            self.assertLess(min(elapsed), 0.005, query)
+        
+        shared.rank = lambda card_id: 1.0 if card_id == 7777 else 0.0
+        shared.top = lambda k: [12345, 7777]
+        self.assertEqual(shared.search("ex")[0], 7777)
+    
+    def test_rebuild_reuses_unchanged_cards(self):
+        cards = list(self.card_manager.get_all_cards())
+        postings = self.index.postings[" ma"]
+        self.index.rebuild(cards)
+        self.assertIs(self.index.postings[" ma"], postings)
+        self.assertEqual(self.index.search("maps"), [self.maps])
+        
+        self.index.rebuild(cards[:2])
+        self.assertEqual(self.index.search("maps"), [])
+        self.assertEqual(len(self.index), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,9 @@ import os
 import time
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from core.clipboard_reader import ClipboardReader
+from core import clipboard_reader
+from core.clipboard_reader import ClipboardReader, SelectionCache
+from core.clipboard_watcher import PollingClipboardWatcher
 
 
 class TestClipboardReader(unittest.TestCase):
@@ -46,10 +48,93 @@ class TestClipboardReader(unittest.TestCase):
         self.assertEqual(first_thread, second_thread)
         self.assertTrue(self.clipboard_reader.monitoring)
     
+    def test_failed_watcher_falls_back_to_polling(self):
+        class BrokenWatcher(PollingClipboardWatcher):
+            def start(self):
+                raise OSError("display went away")
+        
+        original = clipboard_reader.create_clipboard_watcher
+        clipboard_reader.create_clipboard_watcher = lambda check, backend=None: BrokenWatcher(check)
+        try:
+            self.clipboard_reader.start_monitoring()
+        finally:
+            clipboard_reader.create_clipboard_watcher = original
+        
+        self.assertTrue(self.clipboard_reader.monitoring)
+        self.assertIs(type(self.clipboard_reader.watcher), PollingClipboardWatcher)
+        self.assertTrue(self.clipboard_reader.watcher.running)
+    
     def test_try_get_selected_text(self):
         result = self.clipboard_reader.try_get_selected_text()
         self.assertIsInstance(result, str)
 
 
+
+class FakeWatcher:
+    running = True
+    
+    def __init__(self):
+        self.selection_changes = 0
+    
+    def generation(self):
+        return self.selection_changes
+    
+    def stop(self, timeout=1.0):
+        pass
+
+
+class TestSelectionCache(unittest.TestCase):
+    def setUp(self):
+        self.reader = ClipboardReader(freshness_window=5.0)
+        self.reader.watcher = FakeWatcher()
+        self.captures = 0
+        
+        def capture():
+            self.captures += 1
+            return f"selection {self.captures}"
+        self.reader.try_get_selected_text = capture
+    
+    def tearDown(self):
+        self.reader.stop_monitoring()
+    
+    def test_capture_reused_within_window(self):
+        self.assertEqual(self.reader.get_selected_content(), "selection 1")
+        self.assertEqual(self.reader.get_selected_content(), "selection 1")
+        
+        stats = self.reader.cache_stats()
+        self.assertEqual(self.captures, 1)
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+    
+    def test_selection_change_invalidates(self):
+        self.reader.get_selected_content()
+        self.reader.watcher.selection_changes += 1
+        self.assertEqual(self.reader.get_selected_content(), "selection 2")
+        self.assertEqual(self.reader.cache_stats()['stale'], 1)
+    
+    def test_no_generation_bypasses_cache(self):
+        self.reader.watcher = None
+        self.assertEqual(self.reader.get_selected_content(), "selection 1")
+        self.assertEqual(self.reader.get_selected_content(), "selection 2")
+        self.assertEqual(self.reader.cache_stats()['hits'], 0)
+    
+    def test_clipboard_change_invalidates(self):
+        self.reader.get_selected_content()
+        self.reader.get_clipboard_content = lambda: "fresh copy"
+        self.assertTrue(self.reader._check_clipboard())
+        self.assertEqual(self.reader.get_selected_content(), "selection 2")
+    
+    def test_expired_capture_is_dropped(self):
+        self.reader.selection_cache.freshness_window = 0.05
+        self.reader.get_selected_content()
+        time.sleep(0.1)
+        self.assertEqual(self.reader.get_selected_content(), "selection 2")
+    
+    def test_disabled_window_never_caches(self):
+        cache = SelectionCache(freshness_window=0)
+        cache.put('selection', "text", None)
+        self.assertIsNone(cache.get('selection', None))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
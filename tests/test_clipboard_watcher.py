@@ -0,0 +1,107 @@
+import unittest
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.clipboard_watcher import (
+    ClipboardWatcher,
+    PollingClipboardWatcher,
+    SequenceClipboardWatcher,
+    XFixesClipboardWatcher,
+    create_clipboard_watcher,
+)
+
+
+class TestPollingClipboardWatcher(unittest.TestCase):
+    def test_backoff_grows_without_changes(self):
+        watcher = PollingClipboardWatcher(lambda: False, min_interval=0.01, max_interval=0.04, backoff=2.0)
+        watcher.start()
+        time.sleep(0.2)
+        watcher.stop()
+        
+        self.assertEqual(watcher.interval, 0.04)
+        self.assertGreater(watcher.wakeups, 0)
+        self.assertEqual(watcher.changes, 0)
+    
+    def test_change_resets_interval(self):
+        results = [False, False, False, True]
+        
+        def check():
+            return results.pop(0) if results else False
+        
+        watcher = PollingClipboardWatcher(check, min_interval=0.01, max_interval=1.0, backoff=2.0)
+        watcher.start()
+        time.sleep(0.2)
+        watcher.stop()
+        
+        self.assertEqual(watcher.changes, 1)
+    
+    def test_stop_is_prompt(self):
+        watcher = PollingClipboardWatcher(lambda: False, min_interval=5.0, max_interval=5.0)
+        watcher.start()
+        start = time.monotonic()
+        watcher.stop()
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertFalse(watcher.running)
+
+
+class TestSequenceClipboardWatcher(unittest.TestCase):
+    def test_reads_only_on_sequence_change(self):
+        sequence = [1]
+        reads = []
+        
+        def check():
+            reads.append(sequence[0])
+            return True
+        
+        watcher = SequenceClipboardWatcher(check, lambda: sequence[0], interval=0.01)
+        watcher.start()
+        time.sleep(0.1)
+        self.assertEqual(reads, [])
+        
+        sequence[0] = 2
+        time.sleep(0.1)
+        watcher.stop()
+        
+        self.assertEqual(reads, [2])
+        self.assertGreater(watcher.wakeups, watcher.reads)
+    
+    def test_stats_report_avoided_work(self):
+        watcher = SequenceClipboardWatcher(lambda: True, lambda: 0, interval=0.2)
+        watcher.start()
+        time.sleep(0.5)
+        watcher.stop()
+        
+        stats = watcher.stats()
+        self.assertEqual(stats['backend'], "sequence")
+        self.assertEqual(stats['reads'], 0)
+        self.assertGreater(stats['wakeups_avoided'], 0)
+        self.assertGreaterEqual(stats['spawns_avoided'], 0)
+
+
+class TestCreateClipboardWatcher(unittest.TestCase):
+    def test_polling_fallback(self):
+        watcher = create_clipboard_watcher(lambda: False, backend="polling")
+        self.assertIsInstance(watcher, PollingClipboardWatcher)
+    
+    def test_base_is_abstract(self):
+        with self.assertRaises(TypeError):
+            ClipboardWatcher(lambda: False)
+    
+    def test_xfixes_opens_display_on_start(self):
+        watcher = XFixesClipboardWatcher(lambda: False)
+        self.assertIsNone(watcher.display)
+        if XFixesClipboardWatcher.is_supported():
+            watcher.start()
+            self.assertIsNotNone(watcher.display)
+            watcher.stop(timeout=3.0)
+            self.assertIsNone(watcher.display)
+        else:
+            with self.assertRaises(OSError):
+                watcher.start()
+            self.assertFalse(watcher.running)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
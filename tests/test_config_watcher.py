@@ -0,0 +1,118 @@
+import unittest
+import tempfile
+import os
+import sys
+import shutil
+import json
+import threading
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.card_manager import CardManager
+from core.config_watcher import InotifyConfigWatcher, PollingConfigWatcher, create_config_watcher
+from core.persistence import atomic_write_json
+
+
+class TestConfigReload(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.temp_dir, "settings.json")
+        self.card_manager = CardManager(self.config_path, save_delay=0)
+        self.first = self.card_manager.add_card("First", "https://first.example", "ctrl+alt+f")
+        self.second = self.card_manager.add_card("Second", "https://second.example")
+        self.events = []
+        self.card_manager.add_listener(lambda event, card_id, card: self.events.append((event, card_id)))
+    
+    def tearDown(self):
+        self.card_manager.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def deploy(self, data):
+        atomic_write_json(self.config_path, data)
+    
+    def test_own_writes_are_ignored(self):
+        self.card_manager.add_card("Third", "https://third.example")
+        self.assertIsNone(self.card_manager.reload_from_disk())
+    
+    def test_reload_applies_minimal_diff(self):
+        view = self.card_manager.get_card(self.first)
+        self.deploy({
+            'next_id': 10,
+            'cards': [
+                {'id': self.first, 'name': "First", 'url': "https://first.example", 'hotkey': "ctrl+alt+g"},
+                {'id': 9, 'name': "Ninth", 'url': "https://ninth.example", 'hotkey': ""},
+            ],
+            'browser_command': "firefox %s",
+        })
+        changes = self.card_manager.reload_from_disk()
+        
+        self.assertEqual(changes, {'added': 1, 'updated': 1, 'removed': 1, 'groups': 0})
+        self.assertEqual(sorted(self.events), sorted([('removed', self.second), ('added', 9), ('updated', self.first)]))
+        self.assertEqual(view['hotkey'], "ctrl+alt+f")
+        self.assertEqual(self.card_manager.get_card(self.first)['hotkey'], "ctrl+alt+g")
+        self.assertEqual(self.card_manager.get_setting('browser_command'), "firefox %s")
+        self.assertEqual(self.card_manager.add_card("New", "https://new.example"), 10)
+    
+    def test_unchanged_cards_emit_nothing(self):
+        with open(self.config_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data['tray_top_cards'] = 5
+        self.deploy(data)
+        self.assertEqual(self.card_manager.reload_from_disk(), {'added': 0, 'updated': 0, 'removed': 0, 'groups': 0})
+        self.assertEqual(self.events, [])
+    
+    def test_legacy_brace_url_is_accepted(self):
+        self.deploy({'next_id': 3, 'cards': [
+            {'id': self.first, 'name': "First", 'url': "https://x/{}", 'hotkey': ""},
+            {'id': self.second, 'name': "Second", 'url': "https://second.example", 'hotkey': ""},
+        ]})
+        self.assertEqual(self.card_manager.reload_from_disk(), {'added': 0, 'updated': 1, 'removed': 0, 'groups': 0})
+        self.assertIsNone(self.card_manager.reload_error)
+        self.assertEqual(self.card_manager.get_card(self.first)['url'], "https://x/{}")
+    
+    def test_partial_file_keeps_cards(self):
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            f.write('{"next_id": 3, "cards": [{"id": 1, "name": "Fir')
+        self.assertIsNone(self.card_manager.reload_from_disk())
+        self.assertIsNotNone(self.card_manager.reload_error)
+        self.assertEqual(self.card_manager.card_count(), 2)
+        
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            f.write('{}')
+        self.assertIsNone(self.card_manager.reload_from_disk())
+        self.assertEqual(self.card_manager.card_count(), 2)
+        self.assertTrue(os.path.exists(self.config_path))
+
+
+class TestConfigWatcher(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "settings.json")
+        atomic_write_json(self.path, {'cards': []})
+        self.changed = threading.Event()
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def assert_detects_change(self, watcher):
+        watcher.start()
+        try:
+            atomic_write_json(os.path.join(self.temp_dir, "other.json"), {})
+            atomic_write_json(self.path, {'cards': [], 'next_id': 2})
+            self.assertTrue(self.changed.wait(5.0))
+            self.assertEqual(watcher.changes, 1)
+        finally:
+            watcher.stop()
+    
+    def test_polling_watcher(self):
+        self.assert_detects_change(PollingConfigWatcher(self.path, self.changed.set, settle=0.01, interval=0.02))
+    
+    def test_inotify_watcher(self):
+        watcher = create_config_watcher(self.path, self.changed.set)
+        if not isinstance(watcher, InotifyConfigWatcher):
+            self.skipTest("inotify is not available")
+        watcher.settle = 0.01
+        self.assert_detects_change(watcher)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,123 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.hotkey_registry import HotkeyRegistry
+from core.card_manager import normalize_hotkey
+
+
+class FakeKeyboard:
+    def __init__(self, rejected=()):
+        self.hotkeys = {}
+        self.rejected = set(rejected)
+        self.broken = set()
+        self.add_calls = 0
+        self.remove_calls = 0
+        self.next_handle = 0
+    
+    def add_hotkey(self, hotkey, callback, args=()):
+        if hotkey in self.rejected:
+            raise ValueError("unknown key")
+        self.add_calls += 1
+        self.next_handle += 1
+        self.hotkeys[self.next_handle] = (hotkey, callback, args)
+        return self.next_handle
+    
+    def remove_hotkey(self, handle):
+        self.remove_calls += 1
+        if handle in self.broken:
+            raise OSError("backend failure")
+        del self.hotkeys[handle]
+    
+    def press(self, hotkey):
+        for combo, callback, args in list(self.hotkeys.values()):
+            if combo == hotkey:
+                callback(*args)
+
+
+class TestHotkeyRegistry(unittest.TestCase):
+    def setUp(self):
+        self.launched = []
+        self.keyboard = FakeKeyboard()
+        self.registry = HotkeyRegistry(self.launched.append, backend=self.keyboard)
+    
+    def test_initial_sync_registers_all(self):
+        cards = [
+            {'id': 1, 'hotkey': 'ctrl+1'},
+            {'id': 2, 'hotkey': ''},
+            {'id': 3, 'hotkey': 'ctrl+3'},
+        ]
+        result = self.registry.sync(cards)
+        
+        self.assertEqual(sorted(result['added']), [1, 3])
+        self.keyboard.press('ctrl+3')
+        self.assertEqual(self.launched, [3])
+    
+    def test_resync_only_touches_changes(self):
+        cards = [{'id': i, 'hotkey': f'ctrl+{i}'} for i in range(1, 6)]
+        self.registry.sync(cards)
+        adds_before = self.keyboard.add_calls
+        
+        cards[2] = {'id': 3, 'hotkey': 'alt+3'}
+        del cards[4]
+        result = self.registry.sync(cards)
+        
+        self.assertEqual(result['added'], [3])
+        self.assertEqual(sorted(result['removed']), [3, 5])
+        self.assertEqual(self.keyboard.add_calls, adds_before + 1)
+        self.assertEqual(self.keyboard.remove_calls, 2)
+        self.assertEqual(len(self.keyboard.hotkeys), 4)
+    
+    def test_unchanged_sync_is_noop(self):
+        cards = [{'id': 1, 'hotkey': 'ctrl+shift+g'}]
+        self.registry.sync(cards)
+        result = self.registry.sync([{'id': 1, 'hotkey': 'Shift + Ctrl + G'}])
+        
+        self.assertEqual(result['added'], [])
+        self.assertEqual(result['removed'], [])
+        self.assertEqual(self.keyboard.add_calls, 1)
+    
+    def test_conflicting_hotkeys_reported(self):
+        cards = [
+            {'id': 1, 'hotkey': 'ctrl+shift+g'},
+            {'id': 2, 'hotkey': 'shift+ctrl+g'},
+        ]
+        result = self.registry.sync(cards)
+        
+        self.assertEqual(result['conflicts'], {'ctrl+shift+g': [1, 2]})
+        self.assertEqual(result['added'], [1])
+        self.assertEqual(len(self.registry.describe_problems()), 1)
+    
+    def test_registration_errors_reported(self):
+        self.keyboard.rejected.add('ctrl+nosuchkey')
+        result = self.registry.sync([{'id': 1, 'hotkey': 'ctrl+nosuchkey'}])
+        
+        self.assertIn(1, result['errors'])
+        self.assertEqual(self.registry.registered, {})
+    
+    def test_remove_errors_are_recorded(self):
+        self.registry.sync([{'id': 1, 'hotkey': 'ctrl+1'}])
+        self.keyboard.broken.update(self.keyboard.hotkeys)
+        result = self.registry.sync([{'id': 1, 'hotkey': 'ctrl+2'}])
+        
+        self.assertIn("backend failure", result['errors'][1])
+        self.assertEqual(self.registry.registered[1][0], 'ctrl+2')
+    
+    def test_clear_removes_everything(self):
+        self.registry.sync([{'id': 1, 'hotkey': 'ctrl+1'}, {'id': 2, 'hotkey': 'ctrl+2'}])
+        self.registry.clear()
+        
+        self.assertEqual(self.keyboard.hotkeys, {})
+        self.assertEqual(self.registry.registered, {})
+
+
+class TestNormalizeHotkey(unittest.TestCase):
+    def test_modifier_order_and_aliases(self):
+        self.assertEqual(normalize_hotkey("Shift+Control+G"), "ctrl+shift+g")
+        self.assertEqual(normalize_hotkey(" ctrl + alt + del "), "ctrl+alt+del")
+        self.assertEqual(normalize_hotkey(""), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
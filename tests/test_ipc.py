@@ -0,0 +1,164 @@
+import unittest
+import tempfile
+import os
+import sys
+import shutil
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+import qa
+from core import ipc
+from core.card_manager import CardManager
+from core.control import ControlHandler
+
+
+class RecordingLauncher:
+    def __init__(self):
+        self.launched = []
+    
+    def launch_card(self, card, content=None):
+        self.launched.append((card['id'], content))
+        return True
+    
+    def open_stats(self):
+        return {'opens': len(self.launched)}
+
+
+@unittest.skipUnless(ipc.is_supported(), "Unix domain sockets are not available")
+class TestControlChannel(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.temp_dir, "settings.json")
+        self.card_manager = CardManager(self.config_path)
+        self.launcher = RecordingLauncher()
+        self.changes = []
+        handler = ControlHandler(self.card_manager, self.launcher, on_cards_changed=lambda: self.changes.append(1))
+        self.path = ipc.socket_path(self.config_path)
+        self.server = ipc.ControlServer(self.path, handler.handle)
+        self.server.start()
+    
+    def tearDown(self):
+        self.server.stop()
+        self.card_manager.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def request(self, **request):
+        return ipc.send_request(self.path, request)
+    
+    def test_ping(self):
+        self.assertEqual(self.request(op='ping'), {'ok': True})
+    
+    def test_add_and_launch_by_name(self):
+        response = self.request(op='add', name="Google", url="https://google.com/search?q={content}")
+        self.assertTrue(response['ok'])
+        self.assertEqual(self.changes, [1])
+        
+        response = self.request(op='launch', card="google", content="query")
+        self.assertTrue(response['ok'])
+        self.assertEqual(self.launcher.launched, [(response['id'], "query")])
+    
+    def test_errors_are_reported(self):
+        self.assertFalse(self.request(op='launch', card="missing")['ok'])
+        self.assertFalse(self.request(op='add', name="Bad", url="https://x/{nope}")['ok'])
+        self.assertFalse(self.request(op='unknown')['ok'])
+    
+    def test_import_is_batched(self):
+        writes = self.card_manager.persister.writes
+        response = self.request(op='import', cards=[
+            {'name': "A", 'url': "https://a.example"},
+            {'name': "B", 'url': "https://b.example"},
+            {'name': "No URL"},
+            {'name': "Again", 'url': "https://a.example"},
+        ])
+        self.assertEqual(response['added'], 2)
+        self.assertEqual(response['duplicates'], 1)
+        self.assertEqual(response['invalid'], 1)
+        self.card_manager.flush()
+        self.assertEqual(self.card_manager.persister.writes, writes + 1)
+    
+    def test_qa_client(self):
+        self.card_manager.add_card("Docs", "https://docs.python.org")
+        self.assertEqual(qa.main(['--config', self.config_path, 'launch', 'Docs']), 0)
+        self.assertEqual(qa.main(['--config', self.config_path, 'launch', 'Nothing']), 1)
+        self.assertEqual(len(self.launcher.launched), 1)
+    
+    def test_qa_import_and_export(self):
+        source = os.path.join(self.temp_dir, "cards.csv")
+        with open(source, 'w', encoding='utf-8') as f:
+            f.write("name,url\nDocs,https://docs.python.org\nPyPI,https://pypi.org\n")
+        self.assertEqual(qa.main(['--config', self.config_path, 'import', source]), 0)
+        self.assertEqual(self.card_manager.card_count(), 2)
+        
+        target = os.path.join(self.temp_dir, "cards.jsonl")
+        self.assertEqual(qa.main(['--config', self.config_path, 'export', target]), 0)
+        with open(target, encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 2)
+        self.assertEqual(qa.main(['--config', self.config_path, 'import', source + ".missing"]), 2)
+    
+    def test_instance_lock_is_exclusive(self):
+        first = ipc.InstanceLock(f"{self.path}.lock")
+        second = ipc.InstanceLock(f"{self.path}.lock")
+        self.assertTrue(first.acquire())
+        self.assertFalse(second.acquire())
+        first.release()
+        self.assertTrue(second.acquire())
+        second.release()
+
+
+@unittest.skipUnless(hasattr(os, 'getuid'), "POSIX ownership checks are not available")
+class TestRuntimeDir(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, True)
+        self.addCleanup(setattr, tempfile, 'tempdir', tempfile.tempdir)
+        tempfile.tempdir = self.temp_dir
+        runtime = os.environ.pop('XDG_RUNTIME_DIR', None)
+        if runtime is not None:
+            self.addCleanup(os.environ.__setitem__, 'XDG_RUNTIME_DIR', runtime)
+        self.directory = os.path.join(self.temp_dir, f"quick-access-{os.getuid()}")
+    
+    def test_fallback_is_private(self):
+        self.assertEqual(ipc.runtime_dir(), self.directory)
+        self.assertEqual(os.stat(self.directory).st_mode & 0o777, 0o700)
+        self.assertEqual(ipc.runtime_dir(), self.directory)
+    
+    def test_shared_fallback_is_refused(self):
+        os.mkdir(self.directory)
+        os.chmod(self.directory, 0o755)
+        with self.assertRaises(PermissionError):
+            ipc.runtime_dir()
+    
+    def test_symlinked_fallback_is_refused(self):
+        target = os.path.join(self.temp_dir, "elsewhere")
+        os.mkdir(target, 0o700)
+        os.symlink(target, self.directory)
+        with self.assertRaises(PermissionError):
+            ipc.runtime_dir()
+
+
+class TestQaClient(unittest.TestCase):
+    def test_client_is_light(self):
+        code = (
+            "import sys, qa; "
+            "print(','.join(m for m in ('tkinter', 'PIL', 'pystray', 'keyboard', 'pyperclip') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, timeout=30)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "")
+    
+    def test_not_running(self):
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, True)
+        with open(os.devnull, 'w') as devnull:
+            stderr = sys.stderr
+            sys.stderr = devnull
+            try:
+                code = qa.main(['--config', os.path.join(temp_dir, "settings.json"), 'ping'])
+            finally:
+                sys.stderr = stderr
+        self.assertEqual(code, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,73 @@
+import unittest
+import sys
+import os
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.launch_executor import LaunchExecutor
+
+
+class TestLaunchExecutor(unittest.TestCase):
+    def setUp(self):
+        self.executor = LaunchExecutor(max_workers=2, max_queue=4, coalesce_window=0.2)
+    
+    def tearDown(self):
+        self.executor.shutdown(wait=True)
+    
+    def wait_for(self, predicate, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.01)
+        return False
+    
+    def test_runs_submitted_launch(self):
+        done = threading.Event()
+        self.assertTrue(self.executor.submit(1, done.set))
+        self.assertTrue(done.wait(2.0))
+        self.assertTrue(self.wait_for(lambda: self.executor.stats()['completed'] == 1))
+    
+    def test_repeats_within_window_are_coalesced(self):
+        calls = []
+        for _ in range(20):
+            self.executor.submit(1, calls.append, 1)
+        
+        self.assertTrue(self.wait_for(lambda: self.executor.stats()['completed'] == 1))
+        self.assertEqual(calls, [1])
+        self.assertEqual(self.executor.stats()['coalesced'], 19)
+        
+        time.sleep(0.25)
+        self.assertTrue(self.executor.submit(1, calls.append, 1))
+        self.assertTrue(self.wait_for(lambda: len(calls) == 2))
+    
+    def test_distinct_cards_are_not_coalesced(self):
+        calls = []
+        for card_id in range(3):
+            self.assertTrue(self.executor.submit(card_id, calls.append, card_id))
+        self.assertTrue(self.wait_for(lambda: len(calls) == 3))
+        self.assertEqual(sorted(calls), [0, 1, 2])
+    
+    def test_bounded_queue_rejects_overflow(self):
+        release = threading.Event()
+        for card_id in range(10):
+            self.executor.submit(card_id, release.wait, 2.0)
+        
+        stats = self.executor.stats()
+        self.assertGreater(stats['rejected'], 0)
+        self.assertLessEqual(stats['queue_depth'], 4)
+        self.assertLessEqual(len(self.executor.workers), 2)
+        release.set()
+    
+    def test_latency_recorded(self):
+        self.executor.submit(1, time.sleep, 0.05)
+        self.assertTrue(self.wait_for(lambda: self.executor.stats()['completed'] == 1))
+        
+        stats = self.executor.stats()
+        self.assertGreaterEqual(stats['last_latency'], 0.05)
+        self.assertEqual(self.executor.queue_depth(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
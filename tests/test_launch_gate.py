@@ -0,0 +1,82 @@
+import unittest
+import os
+import sys
+import shlex
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.browser_launcher import BrowserLauncher
+from core.launch_executor import LaunchExecutor
+from core.launch_gate import LaunchGate
+
+
+class TestLaunchGate(unittest.TestCase):
+    def test_duplicates_inside_window_are_suppressed(self):
+        gate = LaunchGate(window=0.2)
+        self.assertTrue(gate.admit(1, "text"))
+        self.assertFalse(gate.admit(1, "text"))
+        self.assertTrue(gate.admit(1, "other text"))
+        self.assertTrue(gate.admit(2, "text"))
+        
+        stats = gate.stats()
+        self.assertEqual(stats['admitted'], 3)
+        self.assertEqual(stats['suppressed'], 1)
+    
+    def test_repeats_extend_the_window(self):
+        gate = LaunchGate(window=0.15)
+        self.assertTrue(gate.admit(1))
+        for _ in range(4):
+            time.sleep(0.05)
+            self.assertFalse(gate.admit(1))
+        time.sleep(0.2)
+        self.assertTrue(gate.admit(1))
+    
+    def test_zero_window_admits_everything(self):
+        gate = LaunchGate(window=0)
+        self.assertTrue(gate.admit(1, "x"))
+        self.assertTrue(gate.admit(1, "x"))
+        self.assertEqual(gate.stats()['suppressed'], 0)
+    
+    def test_old_entries_are_pruned(self):
+        gate = LaunchGate(window=0.01, max_entries=8)
+        for card_id in range(8):
+            gate.admit(card_id)
+        time.sleep(0.02)
+        gate.admit(100)
+        self.assertEqual(gate.stats()['tracked'], 1)
+
+
+class TestGatedLaunches(unittest.TestCase):
+    def setUp(self):
+        self.gate = LaunchGate(window=1.0)
+        self.launcher = BrowserLauncher(browser_command=f"{shlex.quote(sys.executable)} -c pass", gate=self.gate)
+        self.card = {'id': 1, 'name': "Search", 'url': "https://example.com/?q={content}"}
+    
+    def test_same_card_and_content_open_once(self):
+        self.assertTrue(self.launcher.launch_card(self.card, "python"))
+        self.assertTrue(self.launcher.launch_card(self.card, "python"))
+        self.assertTrue(self.launcher.launch_card(self.card, "asyncio"))
+        self.assertEqual(self.launcher.open_stats()['spawns'], 2)
+        self.assertEqual(self.gate.stats()['suppressed'], 1)
+    
+    def test_group_duplicates_are_suppressed(self):
+        cards = [self.card, {'id': 2, 'url': "https://b.example"}]
+        self.assertTrue(self.launcher.launch_group(cards, "x"))
+        self.assertTrue(self.launcher.launch_group(cards, "x"))
+        self.assertEqual(self.gate.stats()['suppressed'], 1)
+    
+    def test_click_burst_through_executor(self):
+        executor = LaunchExecutor(max_workers=2, coalesce_window=0.0)
+        for _ in range(5):
+            executor.submit(self.card['id'], self.launcher.launch_card, self.card, "python")
+            time.sleep(0.05)
+        executor.shutdown(wait=True, timeout=5.0)
+        
+        self.assertEqual(self.launcher.open_stats()['spawns'], 1)
+        stats = executor.stats()
+        self.assertEqual(stats['failed'], 0)
+        self.assertEqual(self.gate.stats()['suppressed'] + stats['coalesced'], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,83 @@
+import unittest
+import tempfile
+import os
+import sys
+import shutil
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.launch_history import LaunchHistory, content_hash
+
+
+class TestLaunchHistory(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "settings.history")
+        self.history = LaunchHistory(self.path, half_life=3600.0)
+    
+    def tearDown(self):
+        self.history.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_frequency_ranks_higher(self):
+        now = 1.7e9
+        for _ in range(3):
+            self.history.record(1, ts=now)
+        self.history.record(2, ts=now)
+        self.assertEqual(self.history.top(2), [1, 2])
+    
+    def test_recency_beats_old_frequency(self):
+        now = 1.7e9
+        for _ in range(3):
+            self.history.record(1, ts=now - 4 * 3600)
+        self.history.record(2, ts=now)
+        self.assertEqual(self.history.ranking(), [2, 1])
+        self.assertAlmostEqual(self.history.score(1, now), 3 / 16)
+        self.assertAlmostEqual(self.history.score(2, now), 1.0)
+    
+    def test_scores_survive_reload(self):
+        self.history.record(5, "selected text", 0.02, ts=1.7e9)
+        self.history.record(6, ts=1.7e9 - 10)
+        self.history.close()
+        
+        reloaded = LaunchHistory(self.path, half_life=3600.0)
+        self.assertEqual(reloaded.top(10), [5, 6])
+        self.assertEqual(reloaded.usage(5), (1, 1.7e9))
+        reloaded.close()
+        
+        with open(self.path, encoding='utf-8') as f:
+            self.assertIn(content_hash("selected text"), f.readline())
+    
+    def test_torn_tail_ignored(self):
+        self.history.record(1, ts=1.7e9)
+        self.history.close()
+        with open(self.path, 'ab') as f:
+            f.write(b'{"id":2,"ts":17')
+        
+        reloaded = LaunchHistory(self.path)
+        self.assertEqual(reloaded.top(5), [1])
+        reloaded.close()
+    
+    def test_forget(self):
+        self.history.record(1, ts=1.7e9)
+        self.history.record(2, ts=1.7e9)
+        self.history.forget(1)
+        self.assertEqual(self.history.ranking(), [2])
+        self.history.close()
+        
+        reloaded = LaunchHistory(self.path)
+        self.assertEqual(reloaded.ranking(), [2])
+        self.assertEqual(reloaded.usage(1), (0, 0.0))
+        reloaded.record(1, ts=1.7e9 + 1)
+        self.assertEqual(reloaded.usage(1), (1, 1.7e9 + 1))
+        reloaded.close()
+    
+    def test_trim_keeps_recent_entries(self):
+        history = LaunchHistory(os.path.join(self.temp_dir, "small.history"), max_entries=10)
+        for index in range(11):
+            history.record(index, ts=1.7e9 + index)
+        self.assertEqual(history.entries, 5)
+        history.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,144 @@
+import unittest
+import tempfile
+import os
+import json
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.card_manager import CardManager
+from core.persistence import (WriteBehindPersister, atomic_write_json, file_signature, flush_pending, read_snapshot,
+                              snapshot_path, write_snapshot)
+
+
+class TestAtomicWriteJson(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "data.json")
+    
+    def tearDown(self):
+        for name in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+    
+    def test_writes_and_replaces(self):
+        atomic_write_json(self.path, {'value': 1})
+        atomic_write_json(self.path, {'value': 2})
+        
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f), {'value': 2})
+        self.assertEqual(os.listdir(self.temp_dir), ["data.json"])
+    
+    def test_failed_write_keeps_original(self):
+        atomic_write_json(self.path, {'value': 1})
+        
+        with self.assertRaises(TypeError):
+            atomic_write_json(self.path, {'value': object()})
+        
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f), {'value': 1})
+        self.assertEqual(os.listdir(self.temp_dir), ["data.json"])
+
+
+class TestWriteBehindPersister(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "data.json")
+        self.data = {'value': 0}
+    
+    def tearDown(self):
+        for name in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+    
+    def read(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def test_debounce_coalesces_writes(self):
+        persister = WriteBehindPersister(self.path, lambda: dict(self.data), delay=0.05)
+        for i in range(10):
+            self.data['value'] = i
+            persister.mark_dirty()
+        
+        self.assertFalse(os.path.exists(self.path))
+        time.sleep(0.3)
+        
+        self.assertEqual(persister.writes, 1)
+        self.assertEqual(self.read(), {'value': 9})
+    
+    def test_batch_flushes_on_exit(self):
+        persister = WriteBehindPersister(self.path, lambda: dict(self.data), delay=60)
+        with persister.batch():
+            self.data['value'] = 5
+            persister.mark_dirty()
+            self.assertFalse(os.path.exists(self.path))
+        
+        self.assertEqual(persister.writes, 1)
+        self.assertEqual(self.read(), {'value': 5})
+    
+    def test_flush_pending_by_path(self):
+        persister = WriteBehindPersister(self.path, lambda: dict(self.data), delay=60)
+        persister.mark_dirty()
+        
+        flush_pending(self.path)
+        
+        self.assertFalse(persister.dirty)
+        self.assertEqual(self.read(), {'value': 0})
+        persister.close()
+    
+    def test_compact_mode(self):
+        persister = WriteBehindPersister(self.path, lambda: {'cards': [{'id': 1}]}, delay=0, indent=None)
+        persister.mark_dirty()
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), '{"cards":[{"id":1}]}')
+
+
+class TestSnapshotCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "settings.json")
+    
+    def tearDown(self):
+        for name in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+    
+    def test_snapshot_is_keyed_by_signature(self):
+        atomic_write_json(self.path, {'cards': []})
+        signature = file_signature(self.path)
+        self.assertTrue(write_snapshot(self.path, {'cards': [{'id': 1}]}, signature))
+        self.assertEqual(read_snapshot(self.path, signature), {'cards': [{'id': 1}]})
+        
+        atomic_write_json(self.path, {'cards': [], 'next_id': 2})
+        self.assertIsNone(read_snapshot(self.path, file_signature(self.path)))
+    
+    def test_corrupt_snapshot_is_ignored(self):
+        atomic_write_json(self.path, {'cards': []})
+        with open(snapshot_path(self.path), 'wb') as f:
+            f.write(b"garbage")
+        self.assertIsNone(read_snapshot(self.path, file_signature(self.path)))
+    
+    def test_card_manager_loads_from_snapshot(self):
+        card_manager = CardManager(self.path, save_delay=0, history=False, snapshot_cache=True, compact_json=True)
+        card_manager.add_card("Docs", "https://docs.python.org")
+        card_manager.close()
+        self.assertTrue(os.path.exists(snapshot_path(self.path)))
+        
+        reloaded = CardManager(self.path, history=False)
+        self.assertTrue(reloaded.loaded_from_snapshot)
+        self.assertEqual(reloaded.get_card_by_name("Docs")['url'], "https://docs.python.org")
+        reloaded.close()
+        
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data['cards'][0]['name'] = "Edited"
+        atomic_write_json(self.path, data)
+        edited = CardManager(self.path, history=False)
+        self.assertFalse(edited.loaded_from_snapshot)
+        self.assertIsNotNone(edited.get_card_by_name("Edited"))
+        edited.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
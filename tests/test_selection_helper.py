@@ -0,0 +1,90 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.selection_helper import SelectionHelper
+
+
+ECHO_HELPER = """
+import json, sys
+print(json.dumps({'ready': True}), flush=True)
+for line in sys.stdin:
+    print(json.dumps({'ok': True, 'text': 'selected ' + line.strip()}), flush=True)
+"""
+
+ONE_SHOT_HELPER = """
+import json, sys
+print(json.dumps({'ready': True}), flush=True)
+line = sys.stdin.readline()
+print(json.dumps({'ok': True, 'text': 'once'}), flush=True)
+"""
+
+OWNER_HELPER = """
+import json, sys
+print(json.dumps({'ready': True}), flush=True)
+for line in sys.stdin:
+    command, _, name = line.strip().rpartition(' ')
+    if command == 'owner':
+        print(json.dumps({'ok': True, 'owner': 42}), flush=True)
+    else:
+        print(json.dumps({'ok': True, 'text': name}), flush=True)
+"""
+
+UNAVAILABLE_HELPER = """
+import json
+print(json.dumps({'ready': False}), flush=True)
+"""
+
+
+class TestSelectionHelper(unittest.TestCase):
+    def make_helper(self, source, **kwargs):
+        helper = SelectionHelper(command=[sys.executable, "-c", source], **kwargs)
+        self.addCleanup(helper.close)
+        return helper
+    
+    def test_lazy_start(self):
+        helper = self.make_helper(ECHO_HELPER)
+        self.assertIsNone(helper.process)
+        self.assertEqual(helper.starts, 0)
+    
+    def test_read_reuses_process(self):
+        helper = self.make_helper(ECHO_HELPER)
+        
+        self.assertEqual(helper.read("PRIMARY"), "selected PRIMARY")
+        self.assertEqual(helper.read("CLIPBOARD"), "selected CLIPBOARD")
+        self.assertEqual(helper.starts, 1)
+        self.assertEqual(helper.requests, 2)
+    
+    def test_owner_query_does_not_start_helper(self):
+        helper = self.make_helper(OWNER_HELPER)
+        
+        self.assertIsNone(helper.owner())
+        self.assertEqual(helper.starts, 0)
+        self.assertEqual(helper.read(), "PRIMARY")
+        self.assertEqual(helper.owner("PRIMARY"), 42)
+    
+    def test_restarts_after_helper_exits(self):
+        helper = self.make_helper(ONE_SHOT_HELPER)
+        
+        self.assertEqual(helper.read(), "once")
+        helper.process.wait(timeout=5)
+        self.assertEqual(helper.read(), "once")
+        self.assertEqual(helper.starts, 2)
+    
+    def test_unavailable_helper_falls_back(self):
+        helper = self.make_helper(UNAVAILABLE_HELPER, max_restarts=2)
+        
+        self.assertIsNone(helper.read())
+        self.assertIsNone(helper.read())
+        starts = helper.starts
+        self.assertIsNone(helper.read())
+        self.assertEqual(helper.starts, starts)
+    
+    def test_missing_command_falls_back(self):
+        helper = SelectionHelper(command=["/nonexistent/selection-helper"])
+        self.assertIsNone(helper.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,58 @@
+import unittest
+import os
+import sys
+import shutil
+import subprocess
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+from core.startup_profile import StartupProfiler
+
+
+class TestStartupProfiler(unittest.TestCase):
+    def test_disabled_records_nothing(self):
+        profiler = StartupProfiler()
+        with profiler.stage('config'):
+            pass
+        profiler.mark('event loop')
+        self.assertEqual(profiler.stages, [])
+    
+    def test_stages_are_reported(self):
+        profiler = StartupProfiler(True)
+        with profiler.stage('load cards'):
+            pass
+        profiler.mark('event loop')
+        
+        report = profiler.report()
+        self.assertEqual([stage[0] for stage in profiler.stages], ['load cards', 'event loop'])
+        self.assertIn('load cards', report)
+        self.assertIn('total', report)
+
+
+class TestLazyStartup(unittest.TestCase):
+    def test_main_import_is_light(self):
+        code = (
+            "import sys, main; "
+            "print(','.join(m for m in ('tkinter', 'pystray', 'PIL', 'keyboard', 'pyperclip') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, timeout=30)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "")
+    
+    def test_tray_image_is_cached(self):
+        import main
+        
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, True)
+        path = os.path.join(temp_dir, "tray_icon.png")
+        
+        first = main.load_tray_image(path)
+        self.assertTrue(os.path.exists(path))
+        second = main.load_tray_image(path)
+        self.assertEqual(second.size, first.size)
+        self.assertEqual(second.tobytes(), first.tobytes())
+
+
+if __name__ == '__main__':
+    unittest.main()
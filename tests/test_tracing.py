@@ -0,0 +1,104 @@
+import unittest
+import tempfile
+import os
+import sys
+import shlex
+import shutil
+import json
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.browser_launcher import BrowserLauncher
+from core.launch_executor import LaunchExecutor
+from core.tracing import NULL_SPAN, Tracer, tracer
+
+
+class TestTracer(unittest.TestCase):
+    def test_disabled_tracer_records_nothing(self):
+        disabled = Tracer(enabled=False)
+        self.assertIs(disabled.span('x'), NULL_SPAN)
+        with disabled.span('x'):
+            pass
+        disabled.record('y', 0.1)
+        fn = lambda: 1
+        self.assertIs(disabled.wrap('z', fn, 0.0), fn)
+        self.assertEqual(disabled.spans(), [])
+    
+    def test_ring_keeps_latest_spans(self):
+        ring = Tracer(capacity=8, enabled=True)
+        for i in range(20):
+            ring.record('step', i / 1000, finished_at=100.0 + i)
+        spans = ring.spans()
+        self.assertEqual(len(spans), 8)
+        self.assertEqual([round(duration * 1000) for _, _, duration, _ in spans], list(range(12, 20)))
+    
+    def test_percentiles(self):
+        ring = Tracer(capacity=1000, enabled=True)
+        for i in range(1, 101):
+            ring.record('launch', i / 1000)
+        stats = ring.summary()['launch']
+        self.assertEqual(stats['count'], 100)
+        self.assertAlmostEqual(stats['p50_ms'], 51.0)
+        self.assertAlmostEqual(stats['p95_ms'], 95.0)
+        self.assertAlmostEqual(stats['p99_ms'], 99.0)
+        self.assertAlmostEqual(stats['max_ms'], 100.0)
+        self.assertIn('launch', ring.report())
+    
+    def test_concurrent_records(self):
+        ring = Tracer(capacity=10000, enabled=True)
+        
+        def work():
+            for _ in range(1000):
+                with ring.span('work'):
+                    pass
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(ring.summary()['work']['count'], 4000)
+    
+    def test_export_chrome_trace(self):
+        ring = Tracer(enabled=True)
+        started_at = time.perf_counter()
+        ring.wrap('hotkey.to_browser', lambda: None, started_at)()
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, "trace.json")
+            self.assertEqual(ring.export(path), 1)
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        self.assertEqual(data['traceEvents'][0]['name'], 'hotkey.to_browser')
+        self.assertEqual(data['traceEvents'][0]['ph'], 'X')
+        self.assertIn('hotkey.to_browser', data['otherData']['summary'])
+        self.assertIn('hotkey.to_browser', data['otherData']['report'])
+
+
+class TestLaunchTracing(unittest.TestCase):
+    def setUp(self):
+        self.previous = tracer.enabled
+        tracer.clear()
+        tracer.configure(enabled=True)
+    
+    def tearDown(self):
+        tracer.configure(enabled=self.previous)
+        tracer.clear()
+    
+    def test_hot_path_spans(self):
+        launcher = BrowserLauncher(browser_command=f"{shlex.quote(sys.executable)} -c pass")
+        executor = LaunchExecutor(max_workers=1)
+        card = {'id': 1, 'name': "Search", 'url': "https://example.com/?q={content}"}
+        executor.submit(1, tracer.wrap('hotkey.to_browser', launcher.launch_card, time.perf_counter()), card, "x")
+        executor.shutdown(wait=True)
+        
+        names = set(tracer.summary())
+        for name in ('executor.thread_start', 'executor.queue_wait', 'launch.capture', 'url.render',
+                     'browser.open', 'launch.card', 'hotkey.to_browser'):
+            self.assertIn(name, names)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
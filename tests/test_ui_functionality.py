@@ -1,9 +1,29 @@
 import unittest
 import sys
 import os
+import threading
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.card_manager import CardManager
+from ui.card_list import visible_range, ROW_HEIGHT
+from ui.dispatcher import UiDispatcher
+
+
+class FakeRoot:
+    def __init__(self):
+        self.scheduled = []
+    
+    def after(self, delay, callback):
+        self.scheduled.append((delay, callback))
+        return len(self.scheduled)
+    
+    def after_cancel(self, after_id):
+        pass
+    
+    def run_next(self):
+        delay, callback = self.scheduled.pop(0)
+        callback()
+        return delay
 
 
 class TestUIFunctionality(unittest.TestCase):
@@ -18,6 +38,7 @@ class TestUIFunctionality(unittest.TestCase):
     
     def tearDown(self):
         import os
+        self.card_manager.close()
         try:
             os.remove("/tmp/test_settings.json")
         except FileNotFoundError:
@@ -53,6 +74,60 @@ class TestUIFunctionality(unittest.TestCase):
         card = self.card_manager.get_card(self.test_card)
         self.assertIsNone(card)
 
+    
+    def test_visible_range_only_covers_viewport(self):
+        first, last = visible_range(0, 400, 10000, overscan=0)
+        self.assertEqual(first, 0)
+        self.assertEqual(last, 400 // ROW_HEIGHT + 1)
+        
+        first, last = visible_range(ROW_HEIGHT * 5000, 400, 10000, overscan=2)
+        self.assertEqual(first, 4998)
+        self.assertLessEqual(last - first, 400 // ROW_HEIGHT + 5)
+    
+    def test_visible_range_clamps_to_card_count(self):
+        self.assertEqual(visible_range(0, 400, 0), (0, 0))
+        self.assertEqual(visible_range(0, 400, 2, overscan=2), (0, 2))
+        self.assertEqual(visible_range(ROW_HEIGHT * 100, 400, 3), (3, 3))
+
+
+
+class TestUiDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.root = FakeRoot()
+        self.dispatcher = UiDispatcher(self.root, min_interval_ms=10, max_interval_ms=40)
+        self.dispatcher.start()
+    
+    def test_posts_from_other_threads_run_on_drain(self):
+        calls = []
+        worker = threading.Thread(target=lambda: self.dispatcher.call(calls.append, "from worker"))
+        worker.start()
+        worker.join()
+        
+        self.assertEqual(calls, [])
+        self.root.run_next()
+        self.assertEqual(calls, ["from worker"])
+    
+    def test_call_on_ui_thread_runs_immediately(self):
+        calls = []
+        self.dispatcher.call(calls.append, "direct")
+        self.assertEqual(calls, ["direct"])
+    
+    def test_idle_interval_backs_off(self):
+        for _ in range(5):
+            self.root.run_next()
+        self.assertEqual(self.root.scheduled[-1][0], 40)
+        
+        self.dispatcher.post(lambda: None)
+        self.root.run_next()
+        self.assertEqual(self.root.scheduled[-1][0], 10)
+    
+    def test_failing_callback_does_not_stop_queue(self):
+        calls = []
+        self.dispatcher.post(lambda: 1 / 0)
+        self.dispatcher.post(calls.append, "after failure")
+        self.root.run_next()
+        self.assertEqual(calls, ["after failure"])
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
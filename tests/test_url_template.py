@@ -0,0 +1,72 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.url_template import TemplateCache, TemplateError, compile_template
+
+
+class TestCompileTemplate(unittest.TestCase):
+    def test_literal_url(self):
+        template = compile_template("https://example.com")
+        self.assertEqual(template.slots, [])
+        self.assertEqual(template.render({}), "https://example.com")
+    
+    def test_content_default_encoder(self):
+        template = compile_template("https://example.com/search?q={content}")
+        self.assertTrue(template.uses('content'))
+        self.assertEqual(template.render({('content', None): "a b/c"}), "https://example.com/search?q=a%20b%2Fc")
+    
+    def test_per_field_encoders(self):
+        template = compile_template("https://example.com/{content|path}?q={content|plus}&raw={content|raw}")
+        rendered = template.render({('content', None): "a b/c"})
+        self.assertEqual(rendered, "https://example.com/a%20b/c?q=a+b%2Fc&raw=a b/c")
+    
+    def test_multiple_sources(self):
+        template = compile_template("https://example.com/{date:%Y}/{env:TEAM}?q={content}&c={clipboard}")
+        self.assertEqual(template.keys, (('date', '%Y'), ('env', 'TEAM'), ('content', None), ('clipboard', None)))
+        rendered = template.render({
+            ('date', '%Y'): "2026",
+            ('env', 'TEAM'): "core",
+            ('content', None): "x",
+            ('clipboard', None): "y",
+        })
+        self.assertEqual(rendered, "https://example.com/2026/core?q=x&c=y")
+    
+    def test_escaped_braces(self):
+        template = compile_template("https://example.com/{{literal}}/{content}")
+        self.assertEqual(template.render({('content', None): "x"}), "https://example.com/{literal}/x")
+        self.assertEqual(compile_template("https://example.com/{{x}}").render({}), "https://example.com/{x}")
+    
+    def test_invalid_templates_rejected(self):
+        for url in (
+            "https://example.com/{unknown}",
+            "https://example.com/{content",
+            "https://example.com/content}",
+            "https://example.com/{content|bogus}",
+            "https://example.com/{env}",
+            "https://example.com/{content:arg}",
+        ):
+            with self.assertRaises(TemplateError, msg=url):
+                compile_template(url)
+
+
+class TestTemplateCache(unittest.TestCase):
+    def test_compiles_once(self):
+        cache = TemplateCache()
+        first = cache.get("https://example.com/{content}")
+        second = cache.get("https://example.com/{content}")
+        
+        self.assertIs(first, second)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 1)
+    
+    def test_invalidate(self):
+        cache = TemplateCache()
+        first = cache.get("https://example.com/{content}")
+        cache.invalidate("https://example.com/{content}")
+        self.assertIsNot(cache.get("https://example.com/{content}"), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
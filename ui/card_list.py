@@ -0,0 +1,227 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+
+ROW_HEIGHT = 78
+ROW_PADDING = 2
+ROW_MARGIN = 5
+OVERSCAN = 2
+SCROLL_INCREMENT = 20
+SCROLL_UNITS_PER_NOTCH = 3
+
+
+def visible_range(top: float, height: float, count: int, row_height: int = ROW_HEIGHT,
+                  overscan: int = OVERSCAN) -> Tuple[int, int]:
+    if count <= 0 or height <= 0:
+        return 0, 0
+    first = min(count, max(0, int(top // row_height) - overscan))
+    last = min(count, int((top + height) // row_height) + 1 + overscan)
+    return first, max(first, last)
+
+
+class CardRow:
+    def __init__(self, card_list: "CardList"):
+        canvas = card_list.canvas
+        self.card_id = None
+        self.rendered = None
+        self.index = None
+        self.width = None
+        
+        self.frame = ttk.Frame(canvas, relief="raised", borderwidth=1)
+        self.frame.grid_columnconfigure(0, weight=1)
+        
+        self.name_label = ttk.Label(self.frame, font=('Arial', 12, 'bold'))
+        self.name_label.grid(row=0, column=0, sticky="w", padx=10, pady=(5, 0))
+        
+        self.url_label = ttk.Label(self.frame, foreground="blue")
+        self.url_label.grid(row=1, column=0, sticky="w", padx=10, pady=(0, 2))
+        
+        self.hotkey_label = ttk.Label(self.frame, font=('Arial', 9), foreground="gray")
+        self.hotkey_label.grid(row=2, column=0, sticky="w", padx=10, pady=(0, 5))
+        
+        button_frame = ttk.Frame(self.frame)
+        button_frame.grid(row=0, column=1, rowspan=3, padx=10, pady=5)
+        
+        ttk.Button(button_frame, text="Launch",
+                   command=lambda: card_list.launch(self.card_id)).pack(side=tk.TOP, pady=1)
+        ttk.Button(button_frame, text="Edit",
+                   command=lambda: card_list.edit(self.card_id)).pack(side=tk.TOP, pady=1)
+        
+        for widget in (self.frame, self.name_label, self.url_label, self.hotkey_label):
+            widget.bind("<Button-1>", lambda e: card_list.launch(self.card_id))
+            widget.bind("<Button-3>", lambda e: card_list.context_menu(e, self.card_id))
+            card_list.bind_wheel(widget)
+        
+        self.item = canvas.create_window(0, 0, window=self.frame, anchor="nw",
+                                         height=ROW_HEIGHT - 2 * ROW_PADDING, state="hidden")
+    
+    def show(self, card: Mapping[str, Any]):
+        hotkey = card.get('hotkey', '')
+        rendered = (card['name'], card['url'], hotkey)
+        self.card_id = card['id']
+        if rendered == self.rendered:
+            return
+        self.rendered = rendered
+        self.name_label.configure(text=card['name'])
+        self.url_label.configure(text=card['url'])
+        self.hotkey_label.configure(text=f"Hotkey: {hotkey}" if hotkey else "")
+    
+    def place(self, canvas: tk.Canvas, index: int, width: int):
+        if index != self.index:
+            canvas.coords(self.item, ROW_MARGIN, index * ROW_HEIGHT + ROW_PADDING)
+            self.index = index
+        if width != self.width:
+            canvas.itemconfigure(self.item, width=max(1, width - 2 * ROW_MARGIN))
+            self.width = width
+        canvas.itemconfigure(self.item, state="normal")
+    
+    def hide(self, canvas: tk.Canvas):
+        canvas.itemconfigure(self.item, state="hidden")
+        self.card_id = None
+        self.index = None
+
+
+class CardList:
+    def __init__(self, parent, on_launch: Callable, on_edit: Callable, on_context_menu: Callable):
+        self.on_launch = on_launch
+        self.on_edit = on_edit
+        self.on_context_menu = on_context_menu
+        
+        self.frame = ttk.Frame(parent)
+        self.canvas = tk.Canvas(self.frame, bg="white", highlightthickness=0,
+                                yscrollincrement=SCROLL_INCREMENT)
+        self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+        
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+        
+        self.order: List[int] = []
+        self.cards: Dict[int, Mapping[str, Any]] = {}
+        self.rows: List[CardRow] = []
+        self.bound: Dict[int, CardRow] = {}
+        self.render_pending = False
+        
+        self.canvas.bind("<Configure>", self._on_configure)
+        self.bind_wheel(self.canvas)
+    
+    def bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_wheel)
+        widget.bind("<Button-4>", self._on_wheel)
+        widget.bind("<Button-5>", self._on_wheel)
+    
+    def set_cards(self, cards: Sequence[Mapping[str, Any]]):
+        self.order = [card['id'] for card in cards]
+        self.cards = {card['id']: card for card in cards}
+        for row in self.rows:
+            row.rendered = None
+        self._update_scrollregion()
+        self.schedule_render()
+    
+    def insert_card(self, card: Mapping[str, Any], index: Optional[int] = None):
+        card_id = card['id']
+        if card_id in self.cards:
+            self.update_card(card)
+            return
+        self.cards[card_id] = card
+        if index is None:
+            self.order.append(card_id)
+        else:
+            self.order.insert(index, card_id)
+        self._update_scrollregion()
+        self.schedule_render()
+    
+    def update_card(self, card: Mapping[str, Any]):
+        card_id = card['id']
+        if card_id not in self.cards:
+            self.insert_card(card)
+            return
+        self.cards[card_id] = card
+        row = self.bound.get(card_id)
+        if row is not None:
+            row.show(card)
+    
+    def remove_card(self, card_id: int):
+        if self.cards.pop(card_id, None) is None:
+            return
+        self.order.remove(card_id)
+        self._update_scrollregion()
+        self.schedule_render()
+    
+    def apply_change(self, event: str, card_id: int, card: Optional[Mapping[str, Any]]):
+        if event == 'added' and card is not None:
+            self.insert_card(card)
+        elif event == 'updated' and card is not None:
+            self.update_card(card)
+        elif event == 'removed':
+            self.remove_card(card_id)
+    
+    def launch(self, card_id: Optional[int]):
+        card = self.cards.get(card_id)
+        if card is not None:
+            self.on_launch(card)
+    
+    def edit(self, card_id: Optional[int]):
+        card = self.cards.get(card_id)
+        if card is not None:
+            self.on_edit(card)
+    
+    def context_menu(self, event, card_id: Optional[int]):
+        card = self.cards.get(card_id)
+        if card is not None:
+            self.on_context_menu(event, card)
+    
+    def schedule_render(self):
+        if not self.render_pending:
+            self.render_pending = True
+            self.canvas.after_idle(self._render)
+    
+    def _on_configure(self, event):
+        self._update_scrollregion()
+        self.schedule_render()
+    
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.schedule_render()
+    
+    def _on_wheel(self, event):
+        if getattr(event, 'num', None) == 4:
+            steps = -1
+        elif getattr(event, 'num', None) == 5:
+            steps = 1
+        elif event.delta:
+            steps = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        else:
+            return
+        self.canvas.yview_scroll(steps * SCROLL_UNITS_PER_NOTCH, "units")
+    
+    def _update_scrollregion(self):
+        width = max(1, self.canvas.winfo_width())
+        self.canvas.configure(scrollregion=(0, 0, width, len(self.order) * ROW_HEIGHT))
+    
+    def _render(self):
+        self.render_pending = False
+        width = self.canvas.winfo_width()
+        top = self.canvas.canvasy(0)
+        first, last = visible_range(top, self.canvas.winfo_height(), len(self.order))
+        wanted = self.order[first:last]
+        wanted_ids = set(wanted)
+        
+        while len(self.rows) < len(wanted):
+            self.rows.append(CardRow(self))
+        
+        free = [row for row in self.rows if row.card_id not in wanted_ids]
+        bound = {}
+        for index, card_id in enumerate(wanted, start=first):
+            row = self.bound.get(card_id)
+            if row is None or row.card_id != card_id:
+                row = free.pop()
+            row.show(self.cards[card_id])
+            row.place(self.canvas, index, width)
+            bound[card_id] = row
+        
+        for row in free:
+            if row.index is not None:
+                row.hide(self.canvas)
+        self.bound = bound
\ No newline at end of file
@@ -0,0 +1,70 @@
+import queue
+import threading
+from typing import Callable
+
+
+class UiDispatcher:
+    def __init__(self, root, min_interval_ms: int = 15, max_interval_ms: int = 50):
+        self.root = root
+        self.min_interval_ms = min_interval_ms
+        self.max_interval_ms = max_interval_ms
+        self.interval_ms = min_interval_ms
+        self.queue = queue.SimpleQueue()
+        self.ui_thread = threading.current_thread()
+        self.running = False
+        self.after_id = None
+        self.executed = 0
+    
+    def start(self):
+        if self.running:
+            return
+        self.ui_thread = threading.current_thread()
+        self.running = True
+        self.after_id = self.root.after(self.interval_ms, self._drain)
+    
+    def stop(self):
+        self.running = False
+        if self.after_id is not None:
+            try:
+                self.root.after_cancel(self.after_id)
+            except Exception:
+                pass
+            self.after_id = None
+    
+    def on_ui_thread(self) -> bool:
+        return threading.current_thread() is self.ui_thread
+    
+    def post(self, callback: Callable, *args):
+        self.queue.put((callback, args))
+    
+    def call(self, callback: Callable, *args):
+        if self.on_ui_thread():
+            callback(*args)
+        else:
+            self.post(callback, *args)
+    
+    def drain(self) -> int:
+        executed = 0
+        while True:
+            try:
+                callback, args = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception:
+                pass
+            executed += 1
+        self.executed += executed
+        return executed
+    
+    def _drain(self):
+        self.after_id = None
+        if not self.running:
+            return
+        if self.queue.empty():
+            self.interval_ms = min(self.max_interval_ms, self.interval_ms * 2)
+        else:
+            self.interval_ms = self.min_interval_ms
+        self.after_id = self.root.after(self.interval_ms, self._drain)
+        self.drain()
\ No newline at end of file
@@ -0,0 +1,93 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable, List, Mapping
+
+
+class CommandPalette:
+    def __init__(self, master, search_index, card_manager, on_launch: Callable[[Mapping[str, Any]], None],
+                 limit: int = 8):
+        self.search_index = search_index
+        self.card_manager = card_manager
+        self.on_launch = on_launch
+        self.limit = limit
+        self.results: List[Mapping[str, Any]] = []
+        
+        self.window = tk.Toplevel(master)
+        self.window.title("Quick Launch")
+        self.window.withdraw()
+        self.window.resizable(False, False)
+        self.window.attributes('-topmost', True)
+        
+        frame = ttk.Frame(self.window, padding="8")
+        frame.pack(fill="both", expand=True)
+        
+        self.query = tk.StringVar()
+        self.entry = ttk.Entry(frame, textvariable=self.query, width=60, font=('Arial', 14))
+        self.entry.pack(fill="x")
+        
+        self.listbox = tk.Listbox(frame, height=limit, activestyle="none", exportselection=False,
+                                  font=('Arial', 11))
+        self.listbox.pack(fill="both", expand=True, pady=(6, 0))
+        
+        self.query.trace_add("write", lambda *args: self.update_results())
+        self.entry.bind('<Return>', lambda e: self.launch_selected())
+        self.entry.bind('<Escape>', lambda e: self.hide())
+        self.entry.bind('<Down>', lambda e: self.move_selection(1))
+        self.entry.bind('<Up>', lambda e: self.move_selection(-1))
+        self.listbox.bind('<Double-Button-1>', lambda e: self.launch_selected())
+        self.window.bind('<FocusOut>', self.on_focus_out)
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)
+    
+    def show(self):
+        self.query.set("")
+        self.update_results()
+        self.window.update_idletasks()
+        width = self.window.winfo_reqwidth()
+        x = (self.window.winfo_screenwidth() - width) // 2
+        y = self.window.winfo_screenheight() // 4
+        self.window.geometry(f"+{x}+{y}")
+        self.window.deiconify()
+        self.window.lift()
+        self.window.focus_force()
+        self.entry.focus_set()
+    
+    def hide(self):
+        self.window.withdraw()
+    
+    def on_focus_out(self, event):
+        if event.widget is self.window:
+            self.hide()
+    
+    def update_results(self):
+        query = self.query.get()
+        if query.strip():
+            ids = self.search_index.search(query, self.limit)
+            cards = [self.card_manager.get_card(card_id) for card_id in ids]
+        else:
+            cards = self.card_manager.top_cards(self.limit)
+        self.results = [card for card in cards if card is not None]
+        
+        self.listbox.delete(0, tk.END)
+        for card in self.results:
+            self.listbox.insert(tk.END, f"{card['name']}  —  {card['url']}")
+        if self.results:
+            self.listbox.selection_set(0)
+    
+    def move_selection(self, step: int):
+        if not self.results:
+            return "break"
+        selection = self.listbox.curselection()
+        index = (selection[0] if selection else 0) + step
+        index = max(0, min(len(self.results) - 1, index))
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(index)
+        self.listbox.see(index)
+        return "break"
+    
+    def launch_selected(self):
+        if not self.results:
+            return
+        selection = self.listbox.curselection()
+        card = self.results[selection[0] if selection else 0]
+        self.hide()
+        self.on_launch(card)
\ No newline at end of file
@@ -1,15 +1,28 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox, simpledialog, filedialog
 from typing import Callable, Optional
 import threading
 
+from core import card_io
+from core.url_template import TemplateError, compile_template
+from ui.card_list import CardList
+
+
+FILE_TYPES = [
+    ("Card files", "*.jsonl *.ndjson *.csv *.html *.htm *.json"),
+    ("JSON Lines", "*.jsonl *.ndjson"),
+    ("CSV", "*.csv"),
+    ("Browser bookmarks", "*.html *.htm"),
+    ("JSON", "*.json"),
+]
+
 
 class CardDialog:
-    def __init__(self, parent, title: str, name: str = "", url: str = "", hotkey: str = ""):
+    def __init__(self, parent, title: str, name: str = "", url: str = "", hotkey: str = "", browser: str = ""):
         self.result = None
         self.dialog = tk.Toplevel(parent)
         self.dialog.title(title)
-        self.dialog.geometry("400x200")
+        self.dialog.geometry("400x230")
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
@@ -33,8 +46,13 @@ class CardDialog:
         self.hotkey_entry.grid(row=2, column=1, pady=2)
         self.hotkey_entry.insert(0, hotkey)
         
+        ttk.Label(frame, text="Browser:").grid(row=3, column=0, sticky="w", pady=2)
+        self.browser_entry = ttk.Entry(frame, width=40)
+        self.browser_entry.grid(row=3, column=1, pady=2)
+        self.browser_entry.insert(0, browser)
+        
         button_frame = ttk.Frame(frame)
-        button_frame.grid(row=3, column=0, columnspan=2, pady=10)
+        button_frame.grid(row=4, column=0, columnspan=2, pady=10)
         
         ttk.Button(button_frame, text="OK", command=self.ok_clicked).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Cancel", command=self.cancel_clicked).pack(side=tk.LEFT, padx=5)
@@ -47,6 +65,7 @@ class CardDialog:
         name = self.name_entry.get().strip()
         url = self.url_entry.get().strip()
         hotkey = self.hotkey_entry.get().strip()
+        browser = self.browser_entry.get().strip()
         
         if not name:
             messagebox.showerror("Error", "Name is required")
@@ -54,8 +73,80 @@ class CardDialog:
         if not url:
             messagebox.showerror("Error", "URL is required")
             return
+        try:
+            compile_template(url)
+        except TemplateError as e:
+            messagebox.showerror("Error", f"Invalid URL template: {e}")
+            return
         
-        self.result = (name, url, hotkey)
+        self.result = (name, url, hotkey, browser)
+        self.dialog.destroy()
+    
+    def cancel_clicked(self):
+        self.dialog.destroy()
+
+
+class GroupDialog:
+    def __init__(self, parent, title: str, cards, name: str = "", hotkey: str = "", selected=()):
+        self.result = None
+        self.card_ids = [card['id'] for card in cards]
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title(title)
+        self.dialog.geometry("400x360")
+        self.dialog.transient(parent)
+        self.dialog.grab_set()
+        
+        self.dialog.geometry(f"+{parent.winfo_rootx() + 50}+{parent.winfo_rooty() + 50}")
+        
+        frame = ttk.Frame(self.dialog, padding="10")
+        frame.grid(row=0, column=0, sticky="nsew")
+        self.dialog.grid_rowconfigure(0, weight=1)
+        self.dialog.grid_columnconfigure(0, weight=1)
+        frame.grid_rowconfigure(3, weight=1)
+        frame.grid_columnconfigure(1, weight=1)
+        
+        ttk.Label(frame, text="Name:").grid(row=0, column=0, sticky="w", pady=2)
+        self.name_entry = ttk.Entry(frame, width=40)
+        self.name_entry.grid(row=0, column=1, sticky="ew", pady=2)
+        self.name_entry.insert(0, name)
+        
+        ttk.Label(frame, text="Hotkey:").grid(row=1, column=0, sticky="w", pady=2)
+        self.hotkey_entry = ttk.Entry(frame, width=40)
+        self.hotkey_entry.grid(row=1, column=1, sticky="ew", pady=2)
+        self.hotkey_entry.insert(0, hotkey)
+        
+        ttk.Label(frame, text="Cards:").grid(row=2, column=0, sticky="w", pady=2)
+        self.card_listbox = tk.Listbox(frame, selectmode=tk.EXTENDED, exportselection=False)
+        self.card_listbox.grid(row=3, column=0, columnspan=2, sticky="nsew")
+        selected = set(selected)
+        for index, card in enumerate(cards):
+            self.card_listbox.insert(tk.END, f"{card['id']}: {card['name']}")
+            if card['id'] in selected:
+                self.card_listbox.selection_set(index)
+        
+        button_frame = ttk.Frame(frame)
+        button_frame.grid(row=4, column=0, columnspan=2, pady=10)
+        
+        ttk.Button(button_frame, text="OK", command=self.ok_clicked).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self.cancel_clicked).pack(side=tk.LEFT, padx=5)
+        
+        self.name_entry.focus()
+        self.dialog.bind('<Return>', lambda e: self.ok_clicked())
+        self.dialog.bind('<Escape>', lambda e: self.cancel_clicked())
+    
+    def ok_clicked(self):
+        name = self.name_entry.get().strip()
+        hotkey = self.hotkey_entry.get().strip()
+        card_ids = [self.card_ids[index] for index in self.card_listbox.curselection()]
+        
+        if not name:
+            messagebox.showerror("Error", "Name is required")
+            return
+        if not card_ids:
+            messagebox.showerror("Error", "Select at least one card")
+            return
+        
+        self.result = (name, card_ids, hotkey)
         self.dialog.destroy()
     
     def cancel_clicked(self):
@@ -63,28 +154,33 @@ class CardDialog:
 
 
 class MainWindow:
-    def __init__(self, card_manager, browser_launcher, clipboard_reader):
+    def __init__(self, master, card_manager, browser_launcher, clipboard_reader, dispatcher=None,
+                 launch_executor=None):
         self.card_manager = card_manager
         self.browser_launcher = browser_launcher
         self.clipboard_reader = clipboard_reader
+        self.dispatcher = dispatcher
+        self.launch_executor = launch_executor
         self.on_close_callback = None
         self.on_card_changed_callback = None
         
-        self.root = tk.Tk()
-        self.root.title("Quick Access App")
-        self.root.geometry("600x400")
+        self.window = tk.Toplevel(master)
+        self.window.title("Quick Access App")
+        self.window.geometry("600x400")
         
+        self.ui_thread = threading.current_thread()
         self.setup_ui()
         self.refresh_cards()
+        self.card_manager.add_listener(self.on_card_event)
         
-        self.root.protocol("WM_DELETE_WINDOW", self.on_window_close)
+        self.window.protocol("WM_DELETE_WINDOW", self.on_window_close)
     
     def setup_ui(self):
-        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame = ttk.Frame(self.window, padding="10")
         main_frame.grid(row=0, column=0, sticky="nsew")
         
-        self.root.grid_rowconfigure(0, weight=1)
-        self.root.grid_columnconfigure(0, weight=1)
+        self.window.grid_rowconfigure(0, weight=1)
+        self.window.grid_columnconfigure(0, weight=1)
         main_frame.grid_rowconfigure(1, weight=1)
         main_frame.grid_columnconfigure(0, weight=1)
         
@@ -94,88 +190,113 @@ class MainWindow:
         ttk.Button(toolbar, text="Add Card", command=self.add_card).pack(side=tk.LEFT, padx=5)
         ttk.Button(toolbar, text="Delete Card", command=self.delete_card).pack(side=tk.LEFT, padx=5)
         ttk.Button(toolbar, text="Refresh", command=self.refresh_cards).pack(side=tk.LEFT, padx=5)
+        ttk.Button(toolbar, text="Import...", command=self.import_cards).pack(side=tk.LEFT, padx=5)
+        ttk.Button(toolbar, text="Export...", command=self.export_cards).pack(side=tk.LEFT, padx=5)
         
-        self.cards_frame = ttk.Frame(main_frame)
-        self.cards_frame.grid(row=1, column=0, sticky="nsew")
-        
-        canvas = tk.Canvas(self.cards_frame, bg="white")
-        scrollbar = ttk.Scrollbar(self.cards_frame, orient="vertical", command=canvas.yview)
-        self.scrollable_frame = ttk.Frame(canvas)
-        
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self.groups_menu = tk.Menu(self.window, tearoff=0, postcommand=self.build_groups_menu)
+        ttk.Menubutton(toolbar, text="Groups", menu=self.groups_menu).pack(side=tk.LEFT, padx=5)
         
-        canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        self.cards_frame.grid_rowconfigure(0, weight=1)
-        self.cards_frame.grid_columnconfigure(0, weight=1)
+        self.card_list = CardList(main_frame, self.launch_card, self.edit_specific_card, self.show_card_context_menu)
+        self.card_list.frame.grid(row=1, column=0, sticky="nsew")
     
     def refresh_cards(self):
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        
-        cards = self.card_manager.get_all_cards()
-        for i, card in enumerate(cards):
-            self.create_card_widget(card, i)
+        self.card_list.set_cards(self.card_manager.get_ranked_cards())
+    
+    def run_on_ui_thread(self, callback, *args):
+        if self.dispatcher:
+            self.dispatcher.call(callback, *args)
+        elif threading.current_thread() is self.ui_thread:
+            callback(*args)
+        else:
+            self.window.after(0, lambda: callback(*args))
     
-    def create_card_widget(self, card, row):
-        card_frame = ttk.Frame(self.scrollable_frame, relief="raised", borderwidth=1)
-        card_frame.grid(row=row, column=0, sticky="ew", pady=2, padx=5)
-        card_frame.grid_columnconfigure(0, weight=1)
-        
-        name_label = ttk.Label(card_frame, text=card['name'], font=('Arial', 12, 'bold'))
-        name_label.grid(row=0, column=0, sticky="w", padx=10, pady=(5, 0))
-        
-        url_label = ttk.Label(card_frame, text=card['url'], foreground="blue")
-        url_label.grid(row=1, column=0, sticky="w", padx=10, pady=(0, 2))
-        
-        if card.get('hotkey'):
-            hotkey_label = ttk.Label(card_frame, text=f"Hotkey: {card['hotkey']}", 
-                                   font=('Arial', 9), foreground="gray")
-            hotkey_label.grid(row=2, column=0, sticky="w", padx=10, pady=(0, 5))
-        
-        button_frame = ttk.Frame(card_frame)
-        button_frame.grid(row=0, column=1, rowspan=3, padx=10, pady=5)
-        
-        launch_button = ttk.Button(button_frame, text="Launch", 
-                                 command=lambda c=card: self.launch_card(c))
-        launch_button.pack(side=tk.TOP, pady=1)
-        
-        edit_button = ttk.Button(button_frame, text="Edit", 
-                               command=lambda c=card: self.edit_specific_card(c))
-        edit_button.pack(side=tk.TOP, pady=1)
-        
-        card_frame.bind("<Button-1>", lambda e, c=card: self.launch_card(c))
-        card_frame.bind("<Button-3>", lambda e, c=card: self.show_card_context_menu(e, c))
-        name_label.bind("<Button-1>", lambda e, c=card: self.launch_card(c))
-        name_label.bind("<Button-3>", lambda e, c=card: self.show_card_context_menu(e, c))
-        url_label.bind("<Button-1>", lambda e, c=card: self.launch_card(c))
-        url_label.bind("<Button-3>", lambda e, c=card: self.show_card_context_menu(e, c))
+    def on_card_event(self, event, card_id, card):
+        self.run_on_ui_thread(self.apply_card_event, event, card_id, card)
+    
+    def apply_card_event(self, event, card_id, card):
+        if event == 'reloaded':
+            self.refresh_cards()
+        else:
+            self.card_list.apply_change(event, card_id, card)
     
     def launch_card(self, card):
         def launch_async():
             success = self.browser_launcher.launch_card(card)
             if not success:
-                self.root.after(0, lambda: messagebox.showerror("Error", "Failed to launch browser"))
+                self.run_on_ui_thread(messagebox.showerror, "Error", "Failed to launch browser")
+            return success
+        
+        if self.launch_executor:
+            self.launch_executor.submit(card['id'], launch_async)
+        else:
+            threading.Thread(target=launch_async, daemon=True).start()
+    
+    def build_groups_menu(self):
+        self.groups_menu.delete(0, tk.END)
+        self.groups_menu.add_command(label="New Group...", command=self.add_group)
+        groups = self.card_manager.get_all_groups()
+        if groups:
+            self.groups_menu.add_separator()
+        for group in groups:
+            submenu = tk.Menu(self.groups_menu, tearoff=0)
+            submenu.add_command(label="Launch", command=lambda g=group: self.launch_group(g))
+            submenu.add_command(label="Edit", command=lambda g=group: self.edit_group(g))
+            submenu.add_command(label="Delete", command=lambda g=group: self.delete_group(g))
+            self.groups_menu.add_cascade(label=f"{group['name']} ({len(group['cards'])})", menu=submenu)
+    
+    def launch_group(self, group):
+        group_id = group['id']
+        
+        def launch_async():
+            success = self.browser_launcher.launch_group(self.card_manager.get_group_cards(group_id))
+            if not success:
+                self.run_on_ui_thread(messagebox.showerror, "Error", "Failed to launch browser")
+            return success
+        
+        if self.launch_executor:
+            self.launch_executor.submit(('group', group_id), launch_async)
+        else:
+            threading.Thread(target=launch_async, daemon=True).start()
+    
+    def add_group(self):
+        cards = self.card_manager.get_all_cards()
+        if not cards:
+            messagebox.showinfo("Info", "Add some cards first")
+            return
+        
+        dialog = GroupDialog(self.window, "Add Group", cards)
+        self.window.wait_window(dialog.dialog)
+        
+        if dialog.result:
+            name, card_ids, hotkey = dialog.result
+            self.card_manager.add_group(name, card_ids, hotkey)
+            self.notify_card_changed()
+    
+    def edit_group(self, group):
+        dialog = GroupDialog(self.window, "Edit Group", self.card_manager.get_all_cards(),
+                             group['name'], group.get('hotkey', ''), group['cards'])
+        self.window.wait_window(dialog.dialog)
         
-        threading.Thread(target=launch_async, daemon=True).start()
+        if dialog.result:
+            name, card_ids, hotkey = dialog.result
+            self.card_manager.update_group(group['id'], name, card_ids, hotkey)
+            self.notify_card_changed()
+    
+    def delete_group(self, group):
+        if messagebox.askyesno("Confirm", f"Delete group '{group['name']}'?"):
+            if self.card_manager.delete_group(group['id']):
+                self.notify_card_changed()
+            else:
+                messagebox.showerror("Error", "Group not found")
     
     def add_card(self):
-        dialog = CardDialog(self.root, "Add Card")
-        self.root.wait_window(dialog.dialog)
+        dialog = CardDialog(self.window, "Add Card")
+        self.window.wait_window(dialog.dialog)
         
         if dialog.result:
-            name, url, hotkey = dialog.result
-            self.card_manager.add_card(name, url, hotkey)
-            self.refresh_cards()
-            if self.on_card_changed_callback:
-                self.on_card_changed_callback()
+            name, url, hotkey, browser = dialog.result
+            self.card_manager.add_card(name, url, hotkey, browser)
+            self.notify_card_changed()
     
     def edit_card(self):
         cards = self.card_manager.get_all_cards()
@@ -184,7 +305,7 @@ class MainWindow:
             return
         
         card_names = [f"{card['id']}: {card['name']}" for card in cards]
-        selection = simpledialog.askstring("Select Card", 
+        selection = simpledialog.askstring("Select Card",
                                          f"Enter card ID to edit:\n" + "\n".join(card_names))
         
         if selection:
@@ -192,35 +313,31 @@ class MainWindow:
                 card_id = int(selection.split(':')[0])
                 card = self.card_manager.get_card(card_id)
                 if card:
-                    dialog = CardDialog(self.root, "Edit Card", 
-                                      card['name'], card['url'], card.get('hotkey', ''))
-                    self.root.wait_window(dialog.dialog)
+                    dialog = CardDialog(self.window, "Edit Card",
+                                      card['name'], card['url'], card.get('hotkey', ''), card.get('browser', ''))
+                    self.window.wait_window(dialog.dialog)
                     
                     if dialog.result:
-                        name, url, hotkey = dialog.result
-                        self.card_manager.update_card(card_id, name, url, hotkey)
-                        self.refresh_cards()
-                        if self.on_card_changed_callback:
-                            self.on_card_changed_callback()
+                        name, url, hotkey, browser = dialog.result
+                        self.card_manager.update_card(card_id, name, url, hotkey, browser)
+                        self.notify_card_changed()
                 else:
                     messagebox.showerror("Error", "Card not found")
             except ValueError:
                 messagebox.showerror("Error", "Invalid card ID")
     
     def edit_specific_card(self, card):
-        dialog = CardDialog(self.root, "Edit Card", 
-                          card['name'], card['url'], card.get('hotkey', ''))
-        self.root.wait_window(dialog.dialog)
+        dialog = CardDialog(self.window, "Edit Card",
+                          card['name'], card['url'], card.get('hotkey', ''), card.get('browser', ''))
+        self.window.wait_window(dialog.dialog)
         
         if dialog.result:
-            name, url, hotkey = dialog.result
-            self.card_manager.update_card(card['id'], name, url, hotkey)
-            self.refresh_cards()
-            if self.on_card_changed_callback:
-                self.on_card_changed_callback()
+            name, url, hotkey, browser = dialog.result
+            self.card_manager.update_card(card['id'], name, url, hotkey, browser)
+            self.notify_card_changed()
     
     def show_card_context_menu(self, event, card):
-        context_menu = tk.Menu(self.root, tearoff=0)
+        context_menu = tk.Menu(self.window, tearoff=0)
         context_menu.add_command(label="Launch", command=lambda: self.launch_card(card))
         context_menu.add_command(label="Edit", command=lambda: self.edit_specific_card(card))
         context_menu.add_command(label="Delete", command=lambda: self.delete_specific_card(card))
@@ -233,9 +350,7 @@ class MainWindow:
     def delete_specific_card(self, card):
         if messagebox.askyesno("Confirm", f"Delete card '{card['name']}'?"):
             if self.card_manager.delete_card(card['id']):
-                self.refresh_cards()
-                if self.on_card_changed_callback:
-                    self.on_card_changed_callback()
+                self.notify_card_changed()
             else:
                 messagebox.showerror("Error", "Card not found")
     
@@ -246,7 +361,7 @@ class MainWindow:
             return
         
         card_names = [f"{card['id']}: {card['name']}" for card in cards]
-        selection = simpledialog.askstring("Select Card", 
+        selection = simpledialog.askstring("Select Card",
                                          f"Enter card ID to delete:\n" + "\n".join(card_names))
         
         if selection:
@@ -254,14 +369,53 @@ class MainWindow:
                 card_id = int(selection.split(':')[0])
                 if messagebox.askyesno("Confirm", f"Delete card {card_id}?"):
                     if self.card_manager.delete_card(card_id):
-                        self.refresh_cards()
-                        if self.on_card_changed_callback:
-                            self.on_card_changed_callback()
+                        self.notify_card_changed()
                     else:
                         messagebox.showerror("Error", "Card not found")
             except ValueError:
                 messagebox.showerror("Error", "Invalid card ID")
     
+    def import_cards(self):
+        path = filedialog.askopenfilename(parent=self.window, title="Import Cards", filetypes=FILE_TYPES)
+        if not path:
+            return
+        
+        def import_async():
+            try:
+                result = self.card_manager.import_cards(card_io.read_cards(path))
+            except (OSError, ValueError) as e:
+                self.run_on_ui_thread(messagebox.showerror, "Import Failed", str(e))
+                return
+            self.run_on_ui_thread(self.finish_import, result)
+        threading.Thread(target=import_async, daemon=True).start()
+    
+    def finish_import(self, result):
+        if result['added']:
+            self.notify_card_changed()
+        summary = f"Added {result['added']} cards, skipped {result['duplicates']} duplicates"
+        if result['invalid']:
+            summary += f" and {result['invalid']} invalid records:\n" + "\n".join(result['errors'])
+        messagebox.showinfo("Import", summary)
+    
+    def export_cards(self):
+        path = filedialog.asksaveasfilename(parent=self.window, title="Export Cards", filetypes=FILE_TYPES,
+                                            defaultextension=".jsonl")
+        if not path:
+            return
+        try:
+            count = self.card_manager.export_cards(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Export Failed", str(e))
+            return
+        messagebox.showinfo("Export", f"Exported {count} cards")
+    
+    def notify_card_changed(self):
+        if not self.on_card_changed_callback:
+            return
+        problems = self.on_card_changed_callback()
+        if problems:
+            messagebox.showwarning("Hotkeys", "\n".join(problems))
+    
     def set_on_close_callback(self, callback: Callable):
         self.on_close_callback = callback
     
@@ -272,15 +426,16 @@ class MainWindow:
         if self.on_close_callback:
             self.on_close_callback()
         else:
-            self.root.withdraw()
+            self.window.withdraw()
     
     def show(self):
-        self.root.deiconify()
-        self.root.lift()
-        self.root.focus_force()
+        self.refresh_cards()
+        self.window.deiconify()
+        self.window.lift()
+        self.window.focus_force()
     
     def hide(self):
-        self.root.withdraw()
+        self.window.withdraw()
     
     def run(self):
-        self.root.mainloop()
\ No newline at end of file
+        self.window.mainloop()
\ No newline at end of file